@@ -0,0 +1,160 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Benchmark suite for the filesystem hot paths of the synchronization.
+
+Run from the root of the repository with:
+
+.. code::
+
+    python -m benchmarks --files 10000 --files 100000
+
+Each case runs in a fresh process, and its throughput is compared with the
+baselines stored in ``benchmarks/baselines.json``.
+
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+from pathlib import Path
+import tempfile
+
+import click
+
+from .cases import CASES, MANIFEST_CASES, TREE_CASES, run_case
+from .report import report, report_options
+from .trees import LAYOUTS, TreeSpec, generate_manifest, generate_tree
+
+
+@click.command(short_help="Benchmark the filesystem hot paths of the synchronization.")
+@click.option(
+    "--files",
+    type=click.IntRange(min=1),
+    multiple=True,
+    default=[10_000],
+    show_default=True,
+    help="Number of tiny files of the synthetic trees. Can be passed several times.",
+)
+@click.option(
+    "--layout",
+    type=click.Choice(list(LAYOUTS)),
+    multiple=True,
+    default=list(LAYOUTS),
+    show_default=True,
+    help="Layouts of the trees of tiny files: many files per directory, or long chains.",
+)
+@click.option(
+    "--large-files",
+    type=click.IntRange(min=0),
+    default=16,
+    show_default=True,
+    help="Number of large random binaries in the tree of large files (0 to skip it).",
+)
+@click.option(
+    "--large-file-size",
+    type=click.IntRange(min=1),
+    default=8,
+    show_default=True,
+    help="Size of each large binary, in MB.",
+)
+@click.option(
+    "--patterns",
+    type=click.IntRange(min=1),
+    multiple=True,
+    default=[1, 10, 100],
+    show_default=True,
+    help="Number of patterns of the manifests. Can be passed several times.",
+)
+@click.option(
+    "--case",
+    "cases",
+    type=click.Choice(list(CASES)),
+    multiple=True,
+    default=list(CASES),
+    help="Operations to benchmark. By default, all of them.",
+)
+@click.option(
+    "--repeat",
+    type=click.IntRange(min=1),
+    default=3,
+    show_default=True,
+    help="Number of runs of each case. The fastest one is reported.",
+)
+@click.option(
+    "--work-dir",
+    type=click.Path(file_okay=False),
+    default=str(Path(tempfile.gettempdir()) / "repo-sync-benchmarks"),
+    show_default=True,
+    help="Directory holding the generated trees, reused between invocations.",
+)
+@report_options
+def benchmark(
+    files,
+    layout,
+    large_files,
+    large_file_size,
+    patterns,
+    cases,
+    repeat,
+    work_dir,
+    baseline,
+    save_baseline,
+    tolerance,
+    check,
+    output,
+):
+    """Run the benchmarks and compare them with the baselines."""
+    work_dir = Path(work_dir)
+    scratch = work_dir / "scratch"
+    specs = [TreeSpec(count, tree_layout) for count in files for tree_layout in layout]
+    if large_files:
+        specs.append(TreeSpec(large_files, "wide", large_file_size * 1024**2))
+    manifests = {count: generate_manifest(count) for count in patterns}
+
+    # Cases that do not depend on the manifest size run with the largest manifest,
+    # and cases that do not walk a tree run once
+    plan = []
+    for name in cases:
+        case_patterns = patterns if name in MANIFEST_CASES else [max(patterns)]
+        for spec in specs if name in TREE_CASES else [None]:
+            tree = None if spec is None else generate_tree(spec, work_dir)
+            for count in case_patterns:
+                labels = [] if spec is None else [spec.name]
+                if name in MANIFEST_CASES:
+                    labels.append(f"patterns={count}")
+                plan.append((f"{name}[{', '.join(labels)}]", name, tree, manifests[count]))
+
+    measurements = []
+    context = multiprocessing.get_context("spawn")
+    for case_id, name, tree, manifest in plan:
+        print(f">>> Running {case_id} ...")
+        # A fresh process per case isolates the peak memory of each case
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+            measurements.append(
+                executor.submit(run_case, case_id, name, tree, manifest, scratch, repeat).result()
+            )
+
+    report(measurements, baseline, save_baseline, tolerance, check, output)
+
+
+if __name__ == "__main__":
+    benchmark()
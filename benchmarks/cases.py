@@ -0,0 +1,223 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Benchmarked operations, each measured in isolation."""
+
+from dataclasses import asdict, dataclass
+import os
+from pathlib import Path
+import shutil
+import time
+from typing import Callable, Dict, List, Tuple
+
+from ansys.tools.repo_sync.copier import copy_tree
+from ansys.tools.repo_sync.manifest import ManifestMatcher
+from ansys.tools.repo_sync.metrics import peak_rss_bytes
+from ansys.tools.repo_sync.repo_sync import (
+    adapt_regex_from_manifest,
+    delete_folder_contents,
+    include_patterns,
+)
+
+ADAPT_REGEX_CALLS = 10_000
+"""Number of manifests adapted by the ``adapt_regex_from_manifest`` case."""
+
+
+@dataclass
+class Measurement:
+    """Result of a benchmarked case."""
+
+    case: str
+    """Identifier of the case, including the tree and manifest it ran on."""
+
+    items: int
+    """Number of files (or patterns) processed by one run."""
+
+    bytes: int
+    """Number of bytes processed by one run."""
+
+    seconds: float
+    """Duration of the fastest run."""
+
+    peak_rss_bytes: int | None
+    """Peak resident memory of the process running the case."""
+
+    @property
+    def items_per_second(self) -> float:
+        """Throughput, in files (or patterns) per second."""
+        return self.items / self.seconds if self.seconds else 0.0
+
+    @property
+    def mb_per_second(self) -> float:
+        """Throughput, in MB per second."""
+        return self.bytes / 1024**2 / self.seconds if self.seconds else 0.0
+
+    def as_dict(self) -> dict:
+        """Return the measurement with its throughputs."""
+        return {
+            **asdict(self),
+            "items_per_second": self.items_per_second,
+            "mb_per_second": self.mb_per_second,
+        }
+
+
+def _timed(operation: Callable[[], None]) -> float:
+    start = time.perf_counter()
+    operation()
+    return time.perf_counter() - start
+
+
+def _reset(path: Path):
+    shutil.rmtree(path, ignore_errors=True)
+
+
+def bench_include_patterns(
+    tree: Path, patterns: List[str], scratch: Path
+) -> Tuple[int, int, float]:
+    """Filter every directory of the tree with the ``copytree()`` ignore function."""
+    listing = [(directory, names + dirs) for directory, dirs, names in os.walk(tree)]
+    ignore = include_patterns(*patterns)
+
+    def operation():
+        for directory, names in listing:
+            ignore(directory, names)
+
+    return sum(len(names) for _, names in listing), 0, _timed(operation)
+
+
+def bench_adapt_regex_from_manifest(
+    tree: Path, patterns: List[str], scratch: Path
+) -> Tuple[int, int, float]:
+    """Adapt the manifest patterns repeatedly."""
+
+    def operation():
+        for _ in range(ADAPT_REGEX_CALLS):
+            adapt_regex_from_manifest(patterns)
+
+    return ADAPT_REGEX_CALLS * len(patterns), 0, _timed(operation)
+
+
+def bench_copy_tree(
+    tree: Path, patterns: List[str], scratch: Path, strategy: str = "copy"
+) -> Tuple[int, int, float]:
+    """Copy the whole tree into an empty destination."""
+    destination = scratch / "copy"
+    _reset(destination)
+    stats = []
+    seconds = _timed(lambda: stats.append(copy_tree(tree, destination, strategy=strategy)))
+    _reset(destination)
+    return stats[0].written, stats[0].bytes_written + stats[0].bytes_shared, seconds
+
+
+def bench_copy_tree_auto(tree: Path, patterns: List[str], scratch: Path) -> Tuple[int, int, float]:
+    """Reflink or hard link the whole tree into an empty destination on the same file system."""
+    return bench_copy_tree(tree, patterns, scratch, strategy="auto")
+
+
+def bench_copy_tree_incremental(
+    tree: Path, patterns: List[str], scratch: Path
+) -> Tuple[int, int, float]:
+    """Copy the tree into a destination where all files are already identical."""
+    destination = scratch / "copy"
+    _reset(destination)
+    total_bytes = copy_tree(tree, destination).bytes_written
+    stats = []
+    seconds = _timed(lambda: stats.append(copy_tree(tree, destination)))
+    _reset(destination)
+    return stats[0].skipped, total_bytes, seconds
+
+
+def bench_delete_folder_contents(
+    tree: Path, patterns: List[str], scratch: Path
+) -> Tuple[int, int, float]:
+    """Delete the files of the tree matching the manifest."""
+    destination = scratch / "delete"
+    _reset(destination)
+    copy_tree(tree, destination)
+    matcher = ManifestMatcher(patterns)
+    deleted_sizes = [
+        (Path(directory) / name).stat().st_size
+        for directory, _, names in os.walk(destination)
+        for name in names
+        if matcher.match(name)
+    ]
+
+    seconds = _timed(lambda: delete_folder_contents(destination, matcher, True))
+    _reset(destination)
+    return len(deleted_sizes), sum(deleted_sizes), seconds
+
+
+CASES: Dict[str, Callable[[Path, List[str], Path], Tuple[int, int, float]]] = {
+    "include_patterns": bench_include_patterns,
+    "adapt_regex_from_manifest": bench_adapt_regex_from_manifest,
+    "copy_tree": bench_copy_tree,
+    "copy_tree_auto": bench_copy_tree_auto,
+    "copy_tree_incremental": bench_copy_tree_incremental,
+    "delete_folder_contents": bench_delete_folder_contents,
+}
+"""Benchmarked operations, by name."""
+
+MANIFEST_CASES = ("include_patterns", "adapt_regex_from_manifest", "delete_folder_contents")
+"""Cases measured for each manifest size."""
+
+TREE_CASES = (
+    "include_patterns",
+    "copy_tree",
+    "copy_tree_auto",
+    "copy_tree_incremental",
+    "delete_folder_contents",
+)
+"""Cases measured for each synthetic tree."""
+
+
+def run_case(
+    case_id: str, name: str, tree: Path, patterns: List[str], scratch: Path, repeat: int
+) -> dict:
+    """Run a case several times and keep its fastest run.
+
+    This function is meant to run in a fresh process, so that the peak
+    memory reported belongs to the case only.
+
+    Parameters
+    ----------
+    case_id : str
+        Identifier of the case, including the tree and manifest it runs on.
+    name : str
+        Name of the operation in :data:`CASES`.
+    tree : Path
+        Root of the synthetic tree.
+    patterns : List[str]
+        Lines of the manifest.
+    scratch : Path
+        Directory receiving the temporary copies of the tree.
+    repeat : int
+        Number of runs.
+
+    Returns
+    -------
+    dict
+        The :class:`Measurement`, as a dictionary.
+
+    """
+    runs = [CASES[name](tree, patterns, scratch) for _ in range(repeat)]
+    items, size, seconds = min(runs, key=lambda run: run[2])
+    return Measurement(case_id, items, size, seconds, peak_rss_bytes()).as_dict()
@@ -0,0 +1,274 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Timed end-to-end synchronization scenarios, without any network access.
+
+The synchronizations run against a local bare repository, cloned from and
+pushed to with a ``file://`` URL, and a local HTTP server standing in for the
+GitHub API. Run from the root of the repository with:
+
+.. code::
+
+    python -m benchmarks.end_to_end --files 10000 --backend clone --backend api
+
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+import os
+from pathlib import Path
+import shutil
+import subprocess
+import tempfile
+import time
+from typing import List, Tuple
+
+import click
+
+from ansys.tools.repo_sync.client import create_client
+from ansys.tools.repo_sync.constants import SYNC_BACKENDS
+from ansys.tools.repo_sync.metrics import METRICS_FORMATS, Metrics, write_metrics
+from ansys.tools.repo_sync.repo_sync import synchronize
+from tests.fake_github import LocalGitHub
+
+from .cases import Measurement
+from .report import report, report_options
+from .trees import TreeSpec, generate_tree
+
+SCENARIOS = ("first_sync", "noop_resync", "one_percent_change", "clean_to_dir")
+"""Scenarios, run in this order against the same repository."""
+
+TO_DIR = "src/ansys/package"
+"""Folder of the repository receiving the files."""
+
+GIT_IDENTITY = {
+    "GIT_AUTHOR_NAME": "repo-sync",
+    "GIT_AUTHOR_EMAIL": "repo-sync@example.com",
+    "GIT_COMMITTER_NAME": "repo-sync",
+    "GIT_COMMITTER_EMAIL": "repo-sync@example.com",
+}
+
+
+def _git(path: Path, *args: str):
+    subprocess.run(["git", "-C", str(path), *args], env={**os.environ, **GIT_IDENTITY}, check=True)
+
+
+def _create_remote(path: Path) -> Path:
+    """Create a bare repository with an initial commit on ``main``."""
+    remote = path / "remote.git"
+    work = path / "work"
+    _git(path, "init", "--quiet", "--bare", "--initial-branch=main", str(remote))
+    _git(path, "init", "--quiet", "--initial-branch=main", str(work))
+    _git(work, "remote", "add", "origin", str(remote))
+    (work / "README.md").write_text("Hello world\n")
+    _git(work, "add", "--all")
+    _git(work, "commit", "--quiet", "-m", "Initial commit")
+    _git(work, "push", "--quiet", "origin", "HEAD:main")
+    return remote
+
+
+def _merge(remote: Path):
+    """Merge the synchronization branch into ``main``, as a reviewer would."""
+    _git(remote, "update-ref", "refs/heads/main", "refs/heads/sync/file-sync")
+
+
+def _add_stale_files(remote: Path, count: int):
+    """Commit files that are not part of the source to the ``main`` branch."""
+    work = remote.parent / "work"
+    _git(work, "pull", "--quiet", "origin", "main")
+    stale = work / TO_DIR / "stale"
+    stale.mkdir(parents=True, exist_ok=True)
+    for index in range(count):
+        (stale / f"stale_{index}.py").write_text(f"{index}\n")
+    _git(work, "add", "--all")
+    _git(work, "commit", "--quiet", "-m", "Add stale files")
+    _git(work, "push", "--quiet", "origin", "HEAD:main")
+
+
+def run_scenarios(
+    backend: str, tree: Path, spec: TreeSpec, scratch: Path
+) -> List[Tuple[dict, Metrics]]:
+    """Run all scenarios in order with a backend.
+
+    This function is meant to run in a fresh process, so that the peak
+    memory reported belongs to the scenarios of the backend only.
+
+    Parameters
+    ----------
+    backend : str
+        Backend of the synchronizations.
+    tree : Path
+        Synthetic tree to synchronize.
+    spec : TreeSpec
+        Shape of the synthetic tree.
+    scratch : Path
+        Directory receiving the repository and the copy of the tree.
+
+    Returns
+    -------
+    List[Tuple[dict, Metrics]]
+        Measurement of each scenario, and the metrics of its synchronization.
+
+    """
+    shutil.rmtree(scratch, ignore_errors=True)
+    scratch.mkdir(parents=True)
+    source = scratch / "source"
+    shutil.copytree(tree, source)
+    manifest = scratch / "manifest.txt"
+    manifest.write_text("*\n")
+    remote = _create_remote(scratch)
+
+    results = []
+    with LocalGitHub(remote) as github:
+        # No secondary rate limit to honor on the local API
+        client = create_client("token", base_url=github.api_url, throttle=False)
+
+        def run(scenario: str, **options):
+            metrics = Metrics()
+            start = time.perf_counter()
+            synchronize(
+                owner="owner",
+                repository="repository",
+                token="token",
+                from_dir=source,
+                to_dir=TO_DIR,
+                include_manifest=manifest,
+                backend=backend,
+                client=client,
+                remote_url=github.remote_url,
+                metrics=metrics,
+                **options,
+            )
+            seconds = time.perf_counter() - start
+            case_id = f"end_to_end[{backend}, {scenario}, {spec.name}]"
+            measurement = Measurement(
+                case_id, spec.files, spec.total_bytes, seconds, metrics.peak_rss_bytes
+            )
+            results.append((measurement.as_dict(), metrics))
+
+        run("first_sync")
+        _merge(remote)
+        run("noop_resync")
+
+        # Modify one file in a hundred
+        files = sorted(path for path in source.rglob("*") if path.is_file())
+        for path in files[::100]:
+            path.write_bytes(path.read_bytes() + b"changed\n")
+        run("one_percent_change")
+        _merge(remote)
+
+        _add_stale_files(remote, max(spec.files // 100, 1))
+        run("clean_to_dir", clean_to_dir=True)
+
+    shutil.rmtree(scratch, ignore_errors=True)
+    return results
+
+
+@click.command(short_help="Time end-to-end synchronizations against a local GitHub.")
+@click.option(
+    "--files",
+    type=click.IntRange(min=1),
+    default=10_000,
+    show_default=True,
+    help="Number of files of the synchronized tree.",
+)
+@click.option(
+    "--file-size",
+    type=click.IntRange(min=1),
+    default=1024,
+    show_default=True,
+    help="Size of each file, in bytes.",
+)
+@click.option(
+    "--backend",
+    "backends",
+    type=click.Choice(SYNC_BACKENDS),
+    multiple=True,
+    default=list(SYNC_BACKENDS),
+    help="Backends to time. By default, all of them.",
+)
+@click.option(
+    "--work-dir",
+    type=click.Path(file_okay=False),
+    default=str(Path(tempfile.gettempdir()) / "repo-sync-benchmarks"),
+    show_default=True,
+    help="Directory holding the generated trees, reused between invocations.",
+)
+@click.option(
+    "--metrics-file",
+    type=click.Path(dir_okay=False),
+    default=None,
+    help="File receiving the phases and counters of each synchronization.",
+)
+@click.option(
+    "--metrics-format",
+    type=click.Choice(METRICS_FORMATS),
+    default="json",
+    show_default=True,
+    help="Format of the file defined in --metrics-file.",
+)
+@report_options
+def end_to_end(
+    files,
+    file_size,
+    backends,
+    work_dir,
+    metrics_file,
+    metrics_format,
+    baseline,
+    save_baseline,
+    tolerance,
+    check,
+    output,
+):
+    """Run the scenarios with each backend and compare them with the baselines."""
+    work_dir = Path(work_dir)
+    spec = TreeSpec(files, "wide", file_size)
+    tree = generate_tree(spec, work_dir)
+
+    results = []
+    context = multiprocessing.get_context("spawn")
+    for backend in backends:
+        print(f">>> Running the scenarios with the '{backend}' backend ...")
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+            results.extend(
+                executor.submit(
+                    run_scenarios, backend, tree, spec, work_dir / f"end-to-end-{backend}"
+                ).result()
+            )
+
+    if metrics_file is not None:
+        runs = [({"case": measurement["case"]}, metrics) for measurement, metrics in results]
+        write_metrics(metrics_file, runs, metrics_format)
+
+    report(
+        [measurement for measurement, _ in results],
+        baseline,
+        save_baseline,
+        tolerance,
+        check,
+        output,
+    )
+
+
+if __name__ == "__main__":
+    end_to_end()
@@ -0,0 +1,195 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Reporting of the benchmark measurements and comparison with the stored baselines."""
+
+import json
+from pathlib import Path
+from typing import Callable, Dict, List
+
+import click
+
+BASELINES_PATH = Path(__file__).resolve().parent / "baselines.json"
+"""Baselines stored alongside the benchmarks."""
+
+
+def compare(measurement: dict, baseline: dict | None, tolerance: float) -> str:
+    """Compare a measurement with its baseline.
+
+    Parameters
+    ----------
+    measurement : dict
+        Measurement of the case.
+    baseline : dict, optional
+        Stored measurement of the case.
+    tolerance : float
+        Relative slowdown (or memory increase) accepted before reporting a regression.
+
+    Returns
+    -------
+    str
+        Throughput ratio with the baseline, suffixed with ``REGRESSION`` when
+        the case is slower or uses more memory than tolerated.
+
+    """
+    if not baseline or not baseline.get("items_per_second"):
+        return "no baseline"
+
+    ratio = measurement["items_per_second"] / baseline["items_per_second"]
+    status = f"x{ratio:.2f}"
+    memory = measurement["peak_rss_bytes"]
+    if ratio < 1 - tolerance or (
+        memory
+        and baseline.get("peak_rss_bytes")
+        and memory > baseline["peak_rss_bytes"] * (1 + tolerance)
+    ):
+        status += " REGRESSION"
+    return status
+
+
+def format_measurements(measurements: List[dict], comparisons: List[str]) -> str:
+    """Format the measurements as a table.
+
+    Parameters
+    ----------
+    measurements : List[dict]
+        Measurements of the cases.
+    comparisons : List[str]
+        Comparison of each measurement with its baseline.
+
+    Returns
+    -------
+    str
+        One line per case.
+
+    """
+    rows = [("Case", "Files/s", "MB/s", "Peak RSS", "Baseline")]
+    for measurement, comparison in zip(measurements, comparisons):
+        rss = measurement["peak_rss_bytes"]
+        rows.append(
+            (
+                measurement["case"],
+                f"{measurement['items_per_second']:,.0f}",
+                f"{measurement['mb_per_second']:,.1f}" if measurement["bytes"] else "-",
+                "-" if rss is None else f"{rss / 1024**2:,.0f} MB",
+                comparison,
+            )
+        )
+    widths = [max(len(row[column]) for row in rows) for column in range(len(rows[0]))]
+    return "\n".join(
+        "  ".join(
+            cell.ljust(width) if column == 0 else cell.rjust(width)
+            for column, (cell, width) in enumerate(zip(row, widths))
+        )
+        for row in rows
+    )
+
+
+REPORT_OPTIONS = [
+    click.option(
+        "--baseline",
+        type=click.Path(dir_okay=False),
+        default=str(BASELINES_PATH),
+        help="JSON file holding the baselines. By default, the one stored with the benchmarks.",
+    ),
+    click.option(
+        "--save-baseline",
+        is_flag=True,
+        default=False,
+        help="Store the measurements as the new baselines of their cases.",
+    ),
+    click.option(
+        "--tolerance",
+        type=click.FloatRange(min=0),
+        default=0.25,
+        show_default=True,
+        help="Relative slowdown or memory increase tolerated before reporting a regression.",
+    ),
+    click.option(
+        "--check",
+        is_flag=True,
+        default=False,
+        help="Exit with an error if a regression is reported.",
+    ),
+    click.option(
+        "--output",
+        type=click.Path(dir_okay=False),
+        default=None,
+        help="JSON file receiving the measurements.",
+    ),
+]
+"""Command line options of :func:`report`."""
+
+
+def report_options(command: Callable) -> Callable:
+    """Add the options of :func:`report` to a command."""
+    for option in reversed(REPORT_OPTIONS):
+        command = option(command)
+    return command
+
+
+def report(
+    measurements: List[dict],
+    baseline: str | Path,
+    save_baseline: bool,
+    tolerance: float,
+    check: bool,
+    output: str | Path | None,
+):
+    """Print the measurements, compare them with the baselines and store them.
+
+    Parameters
+    ----------
+    measurements : List[dict]
+        Measurements of the cases.
+    baseline : str | Path
+        JSON file holding the baselines.
+    save_baseline : bool
+        Whether to store the measurements as the new baselines of their cases.
+    tolerance : float
+        Relative slowdown (or memory increase) accepted before reporting a regression.
+    check : bool
+        Whether to raise an error if a regression is reported.
+    output : str | Path, optional
+        JSON file receiving the measurements.
+
+    """
+    baseline_path = Path(baseline)
+    baselines: Dict[str, dict] = (
+        json.loads(baseline_path.read_text())["cases"] if baseline_path.exists() else {}
+    )
+    comparisons = [compare(m, baselines.get(m["case"]), tolerance) for m in measurements]
+    print(format_measurements(measurements, comparisons))
+
+    if output is not None:
+        Path(output).write_text(json.dumps({"measurements": measurements}, indent=2))
+
+    if save_baseline:
+        fields = ("items_per_second", "mb_per_second", "peak_rss_bytes")
+        baselines.update({m["case"]: {key: m[key] for key in fields} for m in measurements})
+        baseline_path.write_text(
+            json.dumps({"cases": dict(sorted(baselines.items()))}, indent=2) + "\n"
+        )
+        print(f">>> Baselines stored in {baseline_path}.")
+
+    if check and any("REGRESSION" in comparison for comparison in comparisons):
+        raise click.ClickException("Some cases regressed compared with the baselines.")
@@ -0,0 +1,156 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Generation of the synthetic trees and manifests used by the benchmarks."""
+
+from dataclasses import dataclass
+import json
+import os
+from pathlib import Path
+import shutil
+from typing import Iterator, List, Tuple
+
+EXTENSIONS = (".py", ".proto", ".txt", ".json", ".md", ".bin", ".h", ".cpp", ".yml", ".csv")
+"""Extensions of the generated files, assigned in turn."""
+
+LAYOUTS = {"wide": (1000, 16), "deep": (8, 2)}
+"""Number of files and of subdirectories per directory, for each layout."""
+
+
+@dataclass(frozen=True)
+class TreeSpec:
+    """Shape of a synthetic tree."""
+
+    files: int
+    """Number of files."""
+
+    layout: str = "wide"
+    """Either ``"wide"`` (many files per directory) or ``"deep"`` (long directory chains)."""
+
+    file_size: int = 64
+    """Size of each file, in bytes."""
+
+    @property
+    def name(self) -> str:
+        """Identifier of the tree, also used as the name of its directory."""
+        return f"{self.layout}-{self.files}x{self.file_size}B"
+
+    @property
+    def total_bytes(self) -> int:
+        """Total size of the files, in bytes."""
+        return self.files * self.file_size
+
+
+def iter_tree_files(spec: TreeSpec) -> Iterator[Tuple[str, int]]:
+    """Yield the relative path and the index of each file of a tree.
+
+    Directories are numbered breadth-first: directory ``d`` is a child of
+    directory ``(d - 1) // dirs_per_dir``, so the same layout yields shallow
+    trees with many files per directory or deep trees with few of them.
+
+    Parameters
+    ----------
+    spec : TreeSpec
+        Shape of the tree.
+
+    Yields
+    ------
+    Tuple[str, int]
+        Relative path of the file (with ``/`` separators) and its index.
+
+    """
+    files_per_dir, dirs_per_dir = LAYOUTS[spec.layout]
+    parents: List[str] = [""]
+    for index in range(spec.files):
+        directory = index // files_per_dir
+        while len(parents) <= directory:
+            child = len(parents)
+            parent = parents[(child - 1) // dirs_per_dir]
+            parents.append(f"{parent}dir_{child}/")
+        extension = EXTENSIONS[index % len(EXTENSIONS)]
+        yield f"{parents[directory]}file_{index}{extension}", index
+
+
+def generate_tree(spec: TreeSpec, work_dir: str | Path) -> Path:
+    """Generate a synthetic tree, or reuse it if it was already generated.
+
+    Parameters
+    ----------
+    spec : TreeSpec
+        Shape of the tree.
+    work_dir : str | Path
+        Directory holding the generated trees.
+
+    Returns
+    -------
+    Path
+        Root of the tree.
+
+    """
+    root = Path(work_dir) / spec.name
+    marker = Path(work_dir) / f"{spec.name}.json"
+    if marker.exists() and root.exists():
+        return root
+
+    print(f">>> Generating {spec.files} files in {root} ...")
+    shutil.rmtree(root, ignore_errors=True)
+    created = set()
+    for relative_path, index in iter_tree_files(spec):
+        path = root / relative_path
+        if path.parent not in created:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            created.add(path.parent)
+        # Large files are random so that no layer can deduplicate or compress them
+        content = (
+            os.urandom(spec.file_size)
+            if spec.file_size > 4096
+            else (f"{index}\n".encode() * spec.file_size)[: spec.file_size]
+        )
+        path.write_bytes(content)
+
+    marker.write_text(json.dumps({"files": spec.files, "bytes": spec.total_bytes}))
+    return root
+
+
+def generate_manifest(patterns: int) -> List[str]:
+    """Generate manifest patterns.
+
+    Half of the patterns are plain extension rules (``*.<ext>``), the other
+    half are glob patterns using ``*`` and ``?`` wildcards, matched against
+    file names as by :mod:`fnmatch`. The first pattern, ``*.py``, always
+    matches a tenth of the generated files.
+
+    Parameters
+    ----------
+    patterns : int
+        Number of patterns.
+
+    Returns
+    -------
+    List[str]
+        Lines of the manifest.
+
+    """
+    lines = ["*.py"]
+    for index in range(1, patterns):
+        lines.append(f"*.ext{index}" if index % 2 else f"generated_{index}_*.t?t")
+    return lines
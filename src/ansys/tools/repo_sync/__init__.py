@@ -22,20 +22,32 @@
 
 """Tool to synchronize the content of different repositories."""
 
-# Version
-# ------------------------------------------------------------------------------
-import importlib.metadata as importlib_metadata
-
-__version__ = importlib_metadata.version("ansys-tools-repo-sync")
-
 # Ease import statements
 # ------------------------------------------------------------------------------
 
 from .constants import DEFAULT_BRANCH_NAME, DEFAULT_PULL_REQUEST_TITLE
-from .repo_sync import synchronize
 
 __all__ = [
     "synchronize",
     "DEFAULT_BRANCH_NAME",
     "DEFAULT_PULL_REQUEST_TITLE",
 ]
+
+
+def __getattr__(name: str):
+    """Resolve the version and import ``synchronize`` on first access.
+
+    Importing the package (for instance to run the command line) does not
+    import GitPython and PyGithub, nor read the package metadata.
+    """
+    if name == "__version__":
+        import importlib.metadata as importlib_metadata
+
+        value = importlib_metadata.version("ansys-tools-repo-sync")
+    elif name == "synchronize":
+        from .repo_sync import synchronize as value
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value
+    return value
@@ -34,94 +34,367 @@ Run with:
 --to-dir <target-dir-for-sync> \
 --include-manifest <path-to-manifest>
 
+To synchronize the files whenever they change, run ``repo-sync watch`` with the
+same options.
+
 """
 
+from pathlib import Path
+import tempfile
+
 import click
 
-from .constants import DEFAULT_BRANCH_NAME, DEFAULT_PULL_REQUEST_TITLE
-from .repo_sync import synchronize as _synchronize
+from .changes import ChangeReport
+from .clone import CLONE_STRATEGIES
+from .constants import (
+    DEFAULT_API_WORKERS,
+    DEFAULT_BRANCH_NAME,
+    DEFAULT_POLL_INTERVAL,
+    DEFAULT_PULL_REQUEST_TITLE,
+    DEFAULT_TARGET_WORKERS,
+    DEFAULT_WATCH_DEBOUNCE,
+    SYNC_BACKENDS,
+)
+from .copier import COPY_STRATEGIES
+from .mapping import load_mappings
+from .metrics import METRICS_FORMATS, Metrics, write_metrics
+from .watch import WATCH_METHODS, watch_folders
 
 
-@click.command(short_help="Copy the content of a repository into an other repository.")
-@click.option("--owner", "-o", type=str, help="Name of the owner or organization.", required=True)
-@click.option("--repository", "-r", type=str, help="Name of the repository.", required=True)
-@click.option("--token", "-t", type=str, help="Personal access token.", required=True)
-@click.option(
-    "--from-dir",
-    type=click.Path(file_okay=False, exists=True),
-    help="Path to the folder containing the files to copy.",
-    required=True,
-)
-@click.option(
-    "--to-dir",
-    type=click.Path(file_okay=False),
-    help="Path of the folder that will contain the files (w.r.t. the root of the repository).",
-    required=True,
-)
+class _DefaultCommandGroup(click.Group):
+    """Group running the ``sync`` command when no command is given.
+
+    ``repo-sync --help`` also shows the help of the ``sync`` command, as it did
+    before the CLI became a group.
+    """
+
+    def parse_args(self, ctx, args):
+        """Insert the ``sync`` command before the arguments if they do not name a command."""
+        if not args or args[0] not in self.commands:
+            args = ["sync", *args]
+        return super().parse_args(ctx, args)
+
+
+@click.group(cls=_DefaultCommandGroup)
+def main():
+    """Copy the content of a folder into a repository, once or whenever it changes.
+
+    Without any command, the 'sync' command is run.
+    """
+
+
+def _check_required(owner, repository, from_dir, to_dir, include_manifest, mappings_config):
+    """Check that the options of a single repository synchronization are given."""
+    required = [("owner", owner), ("repository", repository)]
+    if mappings_config is None or from_dir is not None or to_dir is not None:
+        required.extend(
+            [("from_dir", from_dir), ("to_dir", to_dir), ("include_manifest", include_manifest)]
+        )
+    missing = [f"--{name.replace('_', '-')}" for name, value in required if value is None]
+    if missing:
+        raise click.UsageError(f"Missing option(s): {', '.join(missing)}.")
+
+
+def _apply_options(*options):
+    """Combine option decorators, listed in the order they appear in the help."""
+
+    def decorator(command):
+        for option in reversed(options):
+            command = option(command)
+        return command
+
+    return decorator
+
+
+def _repository_options(multi_target: bool):
+    """Build the options selecting the files, the repository and how they are synchronized.
+
+    Each command builds its own options, so that their help only mentions the
+    options the command accepts.
+
+    Parameters
+    ----------
+    multi_target : bool
+        Whether the command also accepts --targets-config.
+
+    """
+
+    def required_unless(*names):
+        names = [name for name in names if multi_target or name != "--targets-config"]
+        return f" Required unless {' or '.join(names)} is passed." if names else " Required."
+
+    return _apply_options(
+        click.option(
+            "--owner",
+            "-o",
+            type=str,
+            help="Name of the owner or organization." + required_unless("--targets-config"),
+        ),
+        click.option(
+            "--repository",
+            "-r",
+            type=str,
+            help="Name of the repository." + required_unless("--targets-config"),
+        ),
+        click.option("--token", "-t", type=str, help="Personal access token.", required=True),
+        click.option(
+            "--from-dir",
+            type=click.Path(file_okay=False, exists=True),
+            help="Path to the folder containing the files to copy."
+            + required_unless("--mappings-config"),
+        ),
+        click.option(
+            "--to-dir",
+            type=click.Path(file_okay=False),
+            help=(
+                "Path of the folder that will contain the files"
+                " (w.r.t. the root of the repository)."
+                + required_unless("--targets-config", "--mappings-config")
+            ),
+        ),
+        click.option(
+            "--include-manifest",
+            "-m",
+            type=click.Path(dir_okay=False, exists=True),
+            help="Manifest to mention accepted extension files."
+            + required_unless("--mappings-config"),
+        ),
+        click.option(
+            "--branch_checked_out", "-b", type=str, help="Branch to check out.", default="main"
+        ),
+        click.option(
+            "--clean-to-dir",
+            is_flag=True,
+            default=False,
+            help="Clean the folder defined in --to-dir before synchronizing.",
+        ),
+        click.option(
+            "--clean-to-dir-based-on-manifest",
+            is_flag=True,
+            default=False,
+            help=(
+                "Deletion of target directory is performed based on manifest file"
+                " (i.e. only those files matching the extensions on it are deleted)."
+                " Only has an effect if --clean-to-dir is passed."
+            ),
+        ),
+        click.option(
+            "--dry-run",
+            "-d",
+            is_flag=True,
+            default=False,
+            help="Simulate the behavior of the synchronization without performing it.",
+        ),
+        click.option(
+            "--skip-ci",
+            is_flag=True,
+            default=False,
+            help="Adds a ``[skip ci]`` prefix to the commit message or not.",
+        ),
+        click.option(
+            "--random-branch-name",
+            is_flag=True,
+            default=False,
+            help=(
+                "Generates a random branch name instead of the typical ``sync/file-sync``. "
+                "Used for testing purposes mainly."
+            ),
+        ),
+        click.option(
+            "--target-branch-name",
+            type=str,
+            default=DEFAULT_BRANCH_NAME,
+            help=(
+                "Name of the branch to create for the synchronization. "
+                f"By default it is '{DEFAULT_BRANCH_NAME}'."
+            ),
+        ),
+        click.option(
+            "--pull-request-title",
+            type=str,
+            default=DEFAULT_PULL_REQUEST_TITLE,
+            help=(
+                "Title of the pull request created after synchronization. "
+                f"By default it is {DEFAULT_PULL_REQUEST_TITLE}."
+            ),
+        ),
+        click.option(
+            "--cache-dir",
+            type=click.Path(file_okay=False),
+            default=None,
+            help=(
+                "Directory holding a persistent mirror of the repository. When provided, the mirror"
+                " is incrementally fetched instead of cloning the whole repository on every run."
+            ),
+        ),
+        click.option(
+            "--cache-max-size",
+            type=click.IntRange(min=0),
+            default=None,
+            help=(
+                "Maximum size of the cache directory (in MB). Least recently used mirrors are"
+                " evicted when it is exceeded. Only has an effect if --cache-dir is passed."
+            ),
+        ),
+        click.option(
+            "--clone-strategy",
+            type=click.Choice(CLONE_STRATEGIES),
+            default="full",
+            show_default=True,
+            help=(
+                "Strategy used to clone the repository. With 'sparse', only the tip of the checked"
+                " out branch is fetched and only the folder defined in --to-dir is checked out."
+            ),
+        ),
+        click.option(
+            "--check-remote-tree",
+            is_flag=True,
+            default=False,
+            help=(
+                "Compare the files to sync with the remote repository through the GitHub API before"
+                " cloning it. If they are already identical, no clone is performed."
+            ),
+        ),
+        click.option(
+            "--hash-cache",
+            type=click.Path(dir_okay=False),
+            default=None,
+            help=(
+                "File holding a persistent cache of the hashes of the files to sync. Only the files"
+                " modified since the previous run are hashed again."
+            ),
+        ),
+        click.option(
+            "--hash-workers",
+            type=click.IntRange(min=1),
+            default=None,
+            help="Number of processes used to hash the files to sync.",
+        ),
+        click.option(
+            "--backend",
+            type=click.Choice(SYNC_BACKENDS),
+            default="clone",
+            show_default=True,
+            help=(
+                "Backend used to commit the files. With 'api', the repository is not cloned: only"
+                " the changed files are uploaded and the commit is created through the GitHub API."
+                " With 'fast-import', the changed files are streamed into a clone without working"
+                " tree."
+            ),
+        ),
+        click.option(
+            "--api-workers",
+            type=click.IntRange(min=1),
+            default=DEFAULT_API_WORKERS,
+            show_default=True,
+            help="Number of files uploaded concurrently with the 'api' backend.",
+        ),
+        click.option(
+            "--api-cache",
+            type=click.Path(file_okay=False),
+            default=None,
+            help=(
+                "Directory caching the GitHub API responses between runs. Unchanged resources are"
+                " revalidated with conditional requests, which do not count against the rate limit."
+            ),
+        ),
+    )
+
+
+def _run_options():
+    """Build the options of the mappings, metrics, report and remote of a synchronization."""
+    return _apply_options(
+        click.option(
+            "--mappings-config",
+            type=click.Path(dir_okay=False, exists=True),
+            default=None,
+            help=(
+                "TOML file listing several folders to synchronize in a single commit and pull"
+                " request, as [[mappings]] tables with 'from_dir', 'to_dir', 'manifest' and"
+                " optionally 'clean_to_dir' and 'clean_to_dir_based_on_manifest' keys. Applied in"
+                " addition to --from-dir, --to-dir and --include-manifest, if passed."
+            ),
+        ),
+        click.option(
+            "--metrics-file",
+            type=click.Path(dir_okay=False),
+            default=None,
+            help=(
+                "File receiving the duration of each phase of the synchronization and its counters"
+                " (files hashed, copied, deleted, git subprocesses, API calls...)."
+            ),
+        ),
+        click.option(
+            "--report-file",
+            type=click.Path(dir_okay=False),
+            default=None,
+            help=(
+                "File receiving every file added, modified and deleted by the synchronization, as"
+                " newline-delimited JSON, followed by the counts per directory and the totals."
+                " Only a truncated summary is printed."
+            ),
+        ),
+        click.option(
+            "--metrics-format",
+            type=click.Choice(METRICS_FORMATS),
+            default="json",
+            show_default=True,
+            help="Format of the file defined in --metrics-file.",
+        ),
+        click.option(
+            "--api-url",
+            type=str,
+            default=None,
+            help=(
+                "URL of the GitHub API, for GitHub Enterprise Server."
+                " By default, the one of github.com."
+            ),
+        ),
+        click.option(
+            "--remote-url",
+            type=str,
+            default=None,
+            help=(
+                "URL of the git remote to clone from and push to. By default, the HTTPS URL of the"
+                " repository, authenticated with --token."
+            ),
+        ),
+        click.option(
+            "--copy-strategy",
+            type=click.Choice(COPY_STRATEGIES),
+            default="copy",
+            show_default=True,
+            help=(
+                "Strategy used to copy the files into the clone. With 'reflink' or 'hardlink',"
+                " files on the same file system as the clone are cloned or hard linked instead of"
+                " written, and copied otherwise. With 'auto', reflinks are tried first, then hard"
+                " links."
+            ),
+        ),
+    )
+
+
+@main.command("sync", short_help="Copy the content of a repository into an other repository.")
+@_repository_options(multi_target=True)
 @click.option(
-    "--include-manifest",
-    "-m",
+    "--targets-config",
     type=click.Path(dir_okay=False, exists=True),
-    help="Manifest to mention accepted extension files.",
-    required=True,
-)
-@click.option("--branch_checked_out", "-b", type=str, help="Branch to check out.", default="main")
-@click.option(
-    "--clean-to-dir",
-    is_flag=True,
-    default=False,
-    help="Clean the folder defined in --to-dir before synchronizing.",
-)
-@click.option(
-    "--clean-to-dir-based-on-manifest",
-    is_flag=True,
-    default=False,
-    help=(
-        "Deletion of target directory is performed based on manifest file"
-        " (i.e. only those files matching the extensions on it are deleted)."
-        " Only has an effect if --clean-to-dir is passed."
-    ),
-)
-@click.option(
-    "--dry-run",
-    "-d",
-    is_flag=True,
-    default=False,
-    help="Simulate the behavior of the synchronization without performing it.",
-)
-@click.option(
-    "--skip-ci",
-    is_flag=True,
-    default=False,
-    help="Adds a ``[skip ci]`` prefix to the commit message or not.",
-)
-@click.option(
-    "--random-branch-name",
-    is_flag=True,
-    default=False,
-    help=(
-        "Generates a random branch name instead of the typical ``sync/file-sync``. "
-        "Used for testing purposes mainly."
-    ),
-)
-@click.option(
-    "--target-branch-name",
-    type=str,
-    default=DEFAULT_BRANCH_NAME,
+    default=None,
     help=(
-        "Name of the branch to create for the synchronization. "
-        f"By default it is '{DEFAULT_BRANCH_NAME}'."
+        "TOML file listing several repositories to synchronize concurrently, as [[targets]]"
+        " tables with 'owner', 'repository', 'to_dir' and optionally 'branch', 'manifest' and"
+        " 'remote_url' keys. Replaces --owner, --repository, --to-dir, --branch_checked_out"
+        " and --remote-url."
     ),
 )
 @click.option(
-    "--pull-request-title",
-    type=str,
-    default=DEFAULT_PULL_REQUEST_TITLE,
-    help=(
-        "Title of the pull request created after synchronization. "
-        f"By default it is {DEFAULT_PULL_REQUEST_TITLE}."
-    ),
+    "--target-workers",
+    type=click.IntRange(min=1),
+    default=DEFAULT_TARGET_WORKERS,
+    show_default=True,
+    help="Number of repositories synchronized concurrently with --targets-config.",
 )
+@_run_options()
 def synchronize(
     owner,
     repository,
@@ -137,25 +410,194 @@ def synchronize(
     random_branch_name,
     target_branch_name,
     pull_request_title,
+    cache_dir,
+    cache_max_size,
+    clone_strategy,
+    check_remote_tree,
+    hash_cache,
+    hash_workers,
+    backend,
+    api_workers,
+    targets_config,
+    target_workers,
+    mappings_config,
+    api_cache,
+    metrics_file,
+    report_file,
+    metrics_format,
+    api_url,
+    remote_url,
+    copy_strategy,
 ):
-    """CLI command to execute the repository synchronization."""
-    _synchronize(
-        owner=owner,
-        repository=repository,
-        token=token,
-        from_dir=from_dir,
-        to_dir=to_dir,
+    """CLI command to execute the repository synchronization.
+
+    Run 'repo-sync watch --help' to synchronize the folders whenever they change.
+    """
+    options = dict(
         clean_to_dir=clean_to_dir,
         clean_to_dir_based_on_manifest=clean_to_dir_based_on_manifest,
-        include_manifest=include_manifest,
-        branch_checked_out=branch_checked_out,
         dry_run=dry_run,
         skip_ci=skip_ci,
         random_branch_name=random_branch_name,
         target_branch_name=target_branch_name,
         pull_request_title=pull_request_title,
+        cache_dir=cache_dir,
+        cache_max_size=cache_max_size,
+        clone_strategy=clone_strategy,
+        check_remote_tree=check_remote_tree,
+        hash_cache=hash_cache,
+        hash_workers=hash_workers,
+        backend=backend,
+        api_workers=api_workers,
+        api_cache=api_cache,
+        copy_strategy=copy_strategy,
+    )
+
+    if targets_config is not None:
+        if mappings_config is not None:
+            raise click.UsageError("--targets-config and --mappings-config are exclusive.")
+        if from_dir is None:
+            raise click.UsageError("Missing option: --from-dir.")
+        if report_file is not None:
+            raise click.UsageError("--report-file is not supported with --targets-config.")
+
+        # GitPython and PyGithub are only imported once the options are validated
+        from .fanout import fan_out, format_results, load_targets
+
+        shared_metrics = Metrics()
+        results = fan_out(
+            load_targets(targets_config),
+            token,
+            from_dir,
+            include_manifest,
+            workers=target_workers,
+            metrics=shared_metrics,
+            api_url=api_url,
+            **options,
+        )
+        if metrics_file is not None:
+            runs = [({}, shared_metrics)]
+            runs.extend(
+                (
+                    {"repository": result.target.name, "to_dir": result.target.to_dir},
+                    result.metrics,
+                )
+                for result in results
+            )
+            write_metrics(metrics_file, runs, metrics_format)
+        print(">>> Summary of synchronized repositories...")
+        print(format_results(results))
+        if any(result.error is not None for result in results):
+            raise click.ClickException("Some repositories could not be synchronized.")
+        return
+
+    _check_required(owner, repository, from_dir, to_dir, include_manifest, mappings_config)
+
+    from .repo_sync import synchronize as _synchronize
+
+    metrics = Metrics()
+    report = ChangeReport(report_file)
+    try:
+        _synchronize(
+            owner=owner,
+            repository=repository,
+            token=token,
+            from_dir=from_dir,
+            to_dir=to_dir,
+            include_manifest=include_manifest,
+            branch_checked_out=branch_checked_out,
+            mappings=None if mappings_config is None else load_mappings(mappings_config),
+            metrics=metrics,
+            api_url=api_url,
+            remote_url=remote_url,
+            report=report,
+            **options,
+        )
+    finally:
+        report.close()
+        if metrics_file is not None:
+            write_metrics(metrics_file, [({}, metrics)], metrics_format)
+
+
+@main.command(short_help="Synchronize the content of a folder whenever it changes.")
+@_repository_options(multi_target=False)
+@_run_options()
+@click.option(
+    "--debounce",
+    type=click.FloatRange(min=0),
+    default=DEFAULT_WATCH_DEBOUNCE,
+    show_default=True,
+    help="Number of seconds without any change in the folders before synchronizing them.",
+)
+@click.option(
+    "--watch-method",
+    type=click.Choice(WATCH_METHODS),
+    default="auto",
+    show_default=True,
+    help="Method used to detect the changes. With 'auto', inotify is used when available.",
+)
+@click.option(
+    "--poll-interval",
+    type=click.FloatRange(min=0, min_open=True),
+    default=DEFAULT_POLL_INTERVAL,
+    show_default=True,
+    help="Number of seconds between two scans of the folders, when they are polled.",
+)
+def watch(
+    debounce,
+    watch_method,
+    poll_interval,
+    mappings_config,
+    metrics_file,
+    report_file,
+    metrics_format,
+    **params,
+):
+    """Synchronize the folders now, and then whenever they change.
+
+    The GitHub client is kept between synchronizations. Unless --cache-dir and
+    --hash-cache are given, the mirror of the repository and the hashes of the
+    files are kept in a temporary folder until the command is interrupted.
+
+    No clone is kept between synchronizations: each one fetches into the
+    mirror and clones it locally, so it starts from a clean working tree.
+    """
+    _check_required(
+        params["owner"],
+        params["repository"],
+        params["from_dir"],
+        params["to_dir"],
+        params["include_manifest"],
+        mappings_config,
     )
+    mappings = [] if mappings_config is None else load_mappings(mappings_config)
+    folders = [params["from_dir"]] if params["from_dir"] is not None else []
+    folders.extend(mapping.from_dir for mapping in mappings)
+
+    from .client import create_client
+    from .repo_sync import synchronize as _synchronize
+
+    client = create_client(params["token"], params["api_cache"], base_url=params["api_url"])
+    with tempfile.TemporaryDirectory(prefix="repo_sync_watch_") as session:
+        if params["cache_dir"] is None:
+            params["cache_dir"] = Path(session) / "mirrors"
+        if params["hash_cache"] is None:
+            params["hash_cache"] = Path(session) / "hashes.sqlite"
+
+        def sync():
+            metrics = Metrics()
+            report = ChangeReport(report_file)
+            try:
+                _synchronize(
+                    mappings=mappings, metrics=metrics, report=report, client=client, **params
+                )
+            finally:
+                report.close()
+                if metrics_file is not None:
+                    write_metrics(metrics_file, [({}, metrics)], metrics_format)
+
+        watch_folders(folders, sync, debounce, watch_method, poll_interval)
 
 
 if __name__ == "__main__":
-    synchronize()
+    main()
@@ -0,0 +1,334 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Module containing the persistent mirror cache used to avoid full clones."""
+
+from contextlib import contextmanager
+import os
+from pathlib import Path
+import shutil
+import tempfile
+import time
+from typing import Iterator, List
+
+from git import GitCommandError, Repo
+
+from .constants import DEFAULT_CACHE_MAINTENANCE_INTERVAL
+from .instrumented import InstrumentedRepo
+
+try:  # pragma: no cover - platform dependent
+    import fcntl
+except ImportError:  # pragma: no cover - platform dependent
+    fcntl = None
+    import msvcrt
+
+MIRROR_REFSPECS = ["+refs/heads/*:refs/heads/*", "+refs/tags/*:refs/tags/*"]
+"""Refspecs fetched into the mirrors. Pull request refs are deliberately left out."""
+
+_MAINTENANCE_STAMP = "repo-sync-maintenance"
+_MAINTENANCE_TASKS = ["commit-graph", "loose-objects", "incremental-repack"]
+
+
+class FileLock:
+    """Advisory lock on a file, shared between processes.
+
+    On Windows, shared locks are not supported and are taken as exclusive locks.
+
+    Parameters
+    ----------
+    path : str | Path
+        Path to the lock file. It is created if it does not exist.
+
+    """
+
+    def __init__(self, path: str | Path):
+        """Initialize the lock without acquiring it."""
+        self.path = Path(path)
+        self._fd = None
+
+    @property
+    def locked(self) -> bool:
+        """Whether the lock is currently held by this object."""
+        return self._fd is not None
+
+    def acquire(self, shared: bool = False, blocking: bool = True) -> bool:
+        """Acquire the lock, or convert the held lock to the requested mode.
+
+        Parameters
+        ----------
+        shared : bool, optional
+            Take a shared (reader) lock instead of an exclusive one, by default ``False``.
+        blocking : bool, optional
+            Wait until the lock is available, by default ``True``.
+
+        Returns
+        -------
+        bool
+            ``True`` if the lock was acquired, ``False`` if it is busy and
+            ``blocking`` is ``False``.
+
+        """
+        if self._fd is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT)
+        elif fcntl is None:  # pragma: no cover - Windows only
+            # Locks cannot be converted with msvcrt, keep the exclusive one
+            return True
+
+        try:
+            if fcntl is not None:
+                flags = fcntl.LOCK_SH if shared else fcntl.LOCK_EX
+                if not blocking:
+                    flags |= fcntl.LOCK_NB
+                fcntl.flock(self._fd, flags)
+            else:  # pragma: no cover - Windows only
+                self._acquire_windows(blocking)
+        except OSError:
+            os.close(self._fd)
+            self._fd = None
+            if blocking:  # pragma: no cover
+                raise
+            return False
+
+        return True
+
+    def _acquire_windows(self, blocking: bool):  # pragma: no cover - Windows only
+        """Acquire an exclusive lock with ``msvcrt``, which has no shared locks."""
+        while True:
+            try:
+                msvcrt.locking(self._fd, msvcrt.LK_NBLCK, 1)
+                return
+            except OSError:
+                if not blocking:
+                    raise
+                time.sleep(0.1)
+
+    def release(self):
+        """Release the lock if it is held."""
+        if self._fd is None:
+            return
+
+        try:
+            if fcntl is not None:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+            else:  # pragma: no cover - Windows only
+                os.lseek(self._fd, 0, os.SEEK_SET)
+                msvcrt.locking(self._fd, msvcrt.LK_UNLCK, 1)
+        finally:
+            os.close(self._fd)
+            self._fd = None
+
+    def __enter__(self) -> "FileLock":
+        """Acquire an exclusive lock."""
+        self.acquire()
+        return self
+
+    def __exit__(self, *args):
+        """Release the lock."""
+        self.release()
+
+
+class MirrorCache:
+    """On-disk cache holding one bare mirror per ``owner/repository``.
+
+    Mirrors are updated with an incremental fetch and are meant to be used as
+    the source of cheap ``--shared`` clones. Each mirror is protected by a lock
+    file so that several processes can share the cache: updates take an
+    exclusive lock, while readers hold a shared lock until they are done with
+    the mirror.
+
+    Parameters
+    ----------
+    cache_dir : str | Path
+        Directory holding the mirrors.
+    max_size : int, optional
+        Maximum size of the cache in bytes. Least recently used mirrors are
+        evicted once it is exceeded. By default, the cache is not bounded.
+    maintenance_interval : float, optional
+        Minimum number of seconds between two ``git maintenance`` runs on a
+        mirror, by default one day.
+
+    """
+
+    def __init__(
+        self,
+        cache_dir: str | Path,
+        max_size: int | None = None,
+        maintenance_interval: float = DEFAULT_CACHE_MAINTENANCE_INTERVAL,
+    ):
+        """Initialize the cache, creating its directory if needed."""
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_size = max_size
+        self.maintenance_interval = maintenance_interval
+
+    def mirror_path(self, owner: str, repository: str) -> Path:
+        """Path of the bare mirror of ``owner/repository``."""
+        return self.cache_dir / owner / f"{repository}.git"
+
+    @staticmethod
+    def _lock_path(mirror_path: Path) -> Path:
+        return mirror_path.with_name(f"{mirror_path.name}.lock")
+
+    @contextmanager
+    def mirror(self, owner: str, repository: str, url: str) -> Iterator[Path]:
+        """Update the mirror of a repository and provide its path.
+
+        The mirror is created on first use and incrementally fetched afterwards.
+        A shared lock is held on it until the context exits, which prevents
+        other processes from updating or evicting it in the meantime.
+
+        Parameters
+        ----------
+        owner : str
+            Repository owner (user or organization).
+        repository : str
+            Repository name.
+        url : str
+            URL to fetch from. It is only passed on the command line and is
+            never stored in the mirror configuration.
+
+        Yields
+        ------
+        Path
+            Path to the up-to-date bare mirror.
+
+        """
+        mirror_path = self.mirror_path(owner, repository)
+        lock = FileLock(self._lock_path(mirror_path))
+        lock.acquire()
+        try:
+            self._update(mirror_path, url)
+            # Mark the mirror as recently used for the eviction policy
+            os.utime(lock.path)
+            # Let other processes read the mirror while it is in use
+            lock.acquire(shared=True)
+            yield mirror_path
+        finally:
+            lock.release()
+
+        if self.max_size is not None:
+            self.evict(keep=[mirror_path])
+
+    def _update(self, mirror_path: Path, url: str):
+        """Create or fetch the mirror. Requires the exclusive lock."""
+        if not (mirror_path / "HEAD").exists():
+            print(f">>> Creating mirror at '{mirror_path}'...")
+            # Fetch into a temporary location first so that an interrupted
+            # initial fetch never leaves a half-populated mirror behind.
+            mirror_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = Path(tempfile.mkdtemp(prefix=".tmp_", dir=mirror_path.parent))
+            try:
+                with InstrumentedRepo.init(tmp_path, bare=True) as repo:
+                    repo.git.fetch("--prune", url, *MIRROR_REFSPECS)
+                    self._set_head(repo, url)
+                shutil.rmtree(mirror_path, ignore_errors=True)
+                tmp_path.rename(mirror_path)
+            finally:
+                shutil.rmtree(tmp_path, ignore_errors=True)
+        else:
+            print(f">>> Updating mirror at '{mirror_path}'...")
+            with InstrumentedRepo(mirror_path) as repo:
+                repo.git.fetch("--prune", url, *MIRROR_REFSPECS)
+                self._maintain(repo, mirror_path)
+
+    @staticmethod
+    def _set_head(repo: Repo, url: str):
+        """Point the mirror ``HEAD`` to the default branch of the remote."""
+        for line in repo.git.ls_remote("--symref", url, "HEAD").splitlines():
+            if line.startswith("ref:"):
+                repo.git.symbolic_ref("HEAD", line.split()[1])
+                break
+
+    def _maintain(self, repo: Repo, mirror_path: Path):
+        """Run ``git maintenance`` on the mirror if it is due."""
+        stamp = mirror_path / _MAINTENANCE_STAMP
+        if stamp.exists() and time.time() - stamp.stat().st_mtime < self.maintenance_interval:
+            return
+
+        print(f">>> Running maintenance on mirror '{mirror_path}'...")
+        try:
+            repo.git.maintenance("run", *(f"--task={task}" for task in _MAINTENANCE_TASKS))
+        except GitCommandError as err:
+            print(f"Maintenance failed: {err.stderr.strip()} - process will continue.")
+        stamp.touch()
+
+    def evict(self, keep: List[Path] | None = None) -> List[Path]:
+        """Evict least recently used mirrors until the cache fits in ``max_size``.
+
+        Mirrors currently in use by another process are never evicted.
+
+        Parameters
+        ----------
+        keep : List[Path], optional
+            Mirrors that must not be evicted.
+
+        Returns
+        -------
+        List[Path]
+            Paths of the evicted mirrors.
+
+        """
+        if self.max_size is None:
+            return []
+
+        keep = keep or []
+        mirrors = []
+        for lock_path in self.cache_dir.glob("*/*.git.lock"):
+            mirror_path = lock_path.with_suffix("")
+            if mirror_path.is_dir():
+                mirrors.append(
+                    (lock_path.stat().st_mtime, mirror_path, _directory_size(mirror_path))
+                )
+
+        total_size = sum(size for _, _, size in mirrors)
+        evicted = []
+        for _, mirror_path, size in sorted(mirrors, key=lambda mirror: mirror[0]):
+            if total_size <= self.max_size:
+                break
+            if mirror_path in keep:
+                continue
+
+            lock = FileLock(self._lock_path(mirror_path))
+            if not lock.acquire(blocking=False):
+                continue
+            try:
+                print(f">>> Evicting mirror '{mirror_path}' from cache...")
+                shutil.rmtree(mirror_path, ignore_errors=True)
+                total_size -= size
+                evicted.append(mirror_path)
+            finally:
+                lock.release()
+
+        return evicted
+
+
+def _directory_size(path: Path) -> int:
+    """Compute the apparent size of all files inside a directory."""
+    size = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            try:
+                size += (Path(root) / name).lstat().st_size
+            except OSError:  # pragma: no cover
+                pass
+    return size
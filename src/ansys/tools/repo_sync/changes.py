@@ -0,0 +1,188 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Module containing the set of changes performed by a synchronization."""
+
+from dataclasses import dataclass, field
+import json
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from .constants import DEFAULT_SUMMARY_FILES
+
+CHANGE_STATUSES = ("added", "modified", "deleted")
+"""Statuses of the files changed by a synchronization."""
+
+_SUFFIXES = {"added": " (new)", "modified": "", "deleted": " (gone)"}
+
+
+@dataclass
+class ChangeSet:
+    """Files added, modified and deleted by a synchronization.
+
+    Paths are relative to the target directory, with ``/`` separators.
+    """
+
+    added: List[str] = field(default_factory=list)
+    """Files that did not exist in the target directory."""
+
+    modified: List[str] = field(default_factory=list)
+    """Files whose content or mode changed."""
+
+    deleted: List[str] = field(default_factory=list)
+    """Files removed from the target directory."""
+
+    def __bool__(self) -> bool:
+        """Whether there is at least one change."""
+        return bool(self.added or self.modified or self.deleted)
+
+    def __len__(self) -> int:
+        """Total number of changed files."""
+        return len(self.added) + len(self.modified) + len(self.deleted)
+
+
+class ChangeReport:
+    """Report of the changes of a synchronization, built as they are computed.
+
+    Only the totals, the counts per directory and the first changed files are
+    kept in memory. If a path is given, every change is also written to it as
+    it is reported, as newline-delimited JSON records:
+
+    - ``{"type": "file", "status": ..., "path": ...}`` for each changed file,
+    - ``{"type": "directory", "path": ..., "added": ..., "modified": ..., "deleted": ...}``
+      for each directory containing changed files, once the report is closed,
+    - ``{"type": "totals", "added": ..., "modified": ..., "deleted": ...}`` last.
+
+    Parameters
+    ----------
+    path : str | Path, optional
+        File receiving the full report. By default, no file is written.
+    max_files : int, optional
+        Number of changed files (and directories) listed in :meth:`summary`.
+
+    """
+
+    def __init__(self, path: str | Path | None = None, max_files: int = DEFAULT_SUMMARY_FILES):
+        """Open the file receiving the full report, if any."""
+        self.path = None if path is None else Path(path)
+        self.max_files = max_files
+        self.totals: Dict[str, int] = dict.fromkeys(CHANGE_STATUSES, 0)
+        """Number of changed files, per status."""
+        self.directories: Dict[str, Dict[str, int]] = {}
+        """Number of changed files per status, for each directory containing changed files."""
+        self.files: List[Tuple[str, str]] = []
+        """Status and path of the first ``max_files`` changed files."""
+        self._file = None if self.path is None else self.path.open("w", encoding="utf-8")
+
+    def __len__(self) -> int:
+        """Total number of changed files."""
+        return sum(self.totals.values())
+
+    def add(self, status: str, path: str):
+        """Report a changed file.
+
+        Parameters
+        ----------
+        status : str
+            One of :data:`CHANGE_STATUSES`.
+        path : str
+            Path of the file (w.r.t. the root of the repository, with ``/`` separators).
+
+        """
+        self.totals[status] += 1
+        directory = path.rpartition("/")[0]
+        if directory not in self.directories:
+            self.directories[directory] = dict.fromkeys(CHANGE_STATUSES, 0)
+        self.directories[directory][status] += 1
+        if len(self.files) < self.max_files:
+            self.files.append((status, path))
+        if self._file is not None:
+            self._write({"type": "file", "status": status, "path": path})
+
+    def add_changes(self, changes: ChangeSet, prefix: str = ""):
+        """Report the changes of a directory.
+
+        Parameters
+        ----------
+        changes : ChangeSet
+            Files added, modified and deleted in the directory.
+        prefix : str, optional
+            Prefix prepended to each path, such as the directory.
+
+        """
+        for status in CHANGE_STATUSES:
+            for path in sorted(getattr(changes, status)):
+                self.add(status, f"{prefix}{path}")
+
+    def summary(self) -> str:
+        """Describe the changes, truncated to ``max_files`` files and directories.
+
+        Returns
+        -------
+        str
+            Summary in the spirit of ``git diff --compact-summary``, followed by
+            the directories with the most changes.
+
+        """
+        lines = [f" {path}{_SUFFIXES[status]}" for status, path in self.files]
+        if len(self) > len(self.files):
+            lines.append(f" ... and {len(self) - len(self.files)} more files")
+
+        if len(self.directories) > 1:
+            lines.append(" Changes per directory:")
+            busiest = sorted(
+                self.directories.items(), key=lambda item: (-sum(item[1].values()), item[0])
+            )
+            lines.extend(
+                f"  {directory or '.'}: {counts['added']} added,"
+                f" {counts['modified']} modified, {counts['deleted']} deleted"
+                for directory, counts in busiest[: self.max_files]
+            )
+            if len(busiest) > self.max_files:
+                lines.append(f"  ... and {len(busiest) - self.max_files} more directories")
+
+        lines.append(
+            f" {len(self)} files changed: {self.totals['added']} added,"
+            f" {self.totals['modified']} modified, {self.totals['deleted']} deleted"
+        )
+        return "\n".join(lines)
+
+    def _write(self, record: dict):
+        self._file.write(json.dumps(record) + "\n")
+
+    def close(self):
+        """Write the counts per directory and the totals, and close the file."""
+        if self._file is None:
+            return
+        for directory, counts in sorted(self.directories.items()):
+            self._write({"type": "directory", "path": directory, **counts})
+        self._write({"type": "totals", **self.totals})
+        self._file.close()
+        self._file = None
+
+    def __enter__(self):
+        """Return the report itself."""
+        return self
+
+    def __exit__(self, *exc_info):
+        """Close the report."""
+        self.close()
@@ -0,0 +1,448 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Module containing the HTTP layer used to talk to the GitHub API.
+
+Requests go through :class:`GitHubAdapter`, which:
+
+- keeps an on-disk cache of ``GET`` responses, revalidated with ``ETag`` and
+  ``Last-Modified`` conditional requests. GitHub does not count the resulting
+  ``304 Not Modified`` responses against the rate limit.
+- paces requests according to the ``X-RateLimit-*`` headers.
+- retries rate-limited requests, and transient server errors of idempotent
+  requests, with jittered exponential backoff, honoring ``Retry-After``.
+"""
+
+import base64
+from datetime import timezone
+import email.utils
+import functools
+import hashlib
+import json
+from pathlib import Path
+import random
+import tempfile
+import threading
+import time
+
+from github import Auth, Github
+from github.Requester import (
+    HTTPRequestsConnectionClass,
+    HTTPSRequestsConnectionClass,
+    Requester,
+)
+import requests
+from requests.adapters import HTTPAdapter
+
+from .constants import DEFAULT_API_MAX_RETRIES
+from .metrics import count
+
+RETRIED_STATUSES = frozenset({500, 502, 503, 504})
+"""Server errors considered transient."""
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+"""Methods that can be repeated after a server error without side effects."""
+
+RATE_LIMITED_STATUSES = frozenset({403, 429})
+"""Statuses GitHub uses for primary and secondary rate limits."""
+
+MAX_BACKOFF = 60.0
+"""Maximum delay between two attempts, in seconds."""
+
+_CACHED_HEADERS = ("Content-Type", "ETag", "Last-Modified", "Link")
+
+_CONNECTION_ATTRIBUTES = (
+    "_Requester__httpConnectionClass",
+    "_Requester__httpsConnectionClass",
+    "_Requester__connectionClass",
+)
+"""Attributes of a PyGithub requester holding its connection classes."""
+
+_DERIVING_METHODS = ("withAuth", "withLazy", "withApiVersion")
+"""Methods creating a new requester with the configuration of an existing one."""
+
+
+def _parse_retry_after(value: str) -> float | None:
+    """Parse a ``Retry-After`` header, given in seconds or as an HTTP date.
+
+    Returns the number of seconds to wait, or ``None`` if the value is invalid.
+    """
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        date = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+    return max(date.timestamp() - time.time(), 0.0)
+
+
+class ResponseCache:
+    """On-disk cache of API responses, with their validators.
+
+    Each response is stored in its own JSON file, named after a hash of the
+    URL and of the credentials used to request it. Files are replaced
+    atomically, so the cache can be shared by concurrent threads and processes.
+
+    Parameters
+    ----------
+    directory : str | Path
+        Directory holding the cached responses. It is created if it does not exist.
+
+    """
+
+    def __init__(self, directory: str | Path):
+        """Create the cache directory if needed."""
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, request: requests.PreparedRequest) -> Path:
+        key = f"{request.url}\n{request.headers.get('Authorization', '')}"
+        return self.directory / f"{hashlib.sha256(key.encode()).hexdigest()}.json"
+
+    def get(self, request: requests.PreparedRequest) -> dict | None:
+        """Return the cached response of a request, if any.
+
+        Parameters
+        ----------
+        request : requests.PreparedRequest
+            Request to look up.
+
+        Returns
+        -------
+        dict | None
+            Cached ``headers`` and ``content`` (base64-encoded) of the response.
+
+        """
+        try:
+            return json.loads(self._path(request).read_text())
+        except (OSError, ValueError):
+            return None
+
+    def put(self, request: requests.PreparedRequest, response: requests.Response):
+        """Store a response, if it carries a validator.
+
+        Parameters
+        ----------
+        request : requests.PreparedRequest
+            Request that produced the response.
+        response : requests.Response
+            Successful response to store.
+
+        """
+        headers = {
+            name: response.headers[name] for name in _CACHED_HEADERS if name in response.headers
+        }
+        if "ETag" not in headers and "Last-Modified" not in headers:
+            return
+
+        entry = {"headers": headers, "content": base64.b64encode(response.content).decode("ascii")}
+        path = self._path(request)
+        with tempfile.NamedTemporaryFile("w", dir=self.directory, delete=False) as entry_file:
+            json.dump(entry, entry_file)
+        Path(entry_file.name).replace(path)
+
+
+class RateLimitPacer:
+    """Spread requests over the remaining rate-limit window.
+
+    While plenty of requests remain, no delay is added. Once fewer than
+    ``reserve`` requests remain, requests are spaced so that the budget lasts
+    until the window resets.
+
+    Parameters
+    ----------
+    reserve : int, optional
+        Number of remaining requests below which requests are paced.
+
+    """
+
+    def __init__(self, reserve: int = 100):
+        """Initialize the pacer without any rate-limit information."""
+        self.reserve = reserve
+        self._lock = threading.Lock()
+        self._remaining: int | None = None
+        self._reset = 0.0
+        self._next_request = 0.0
+
+    def update(self, response: requests.Response):
+        """Record the rate-limit headers of a response."""
+        try:
+            remaining = int(response.headers["X-RateLimit-Remaining"])
+            reset = float(response.headers["X-RateLimit-Reset"])
+        except (KeyError, ValueError):
+            return
+        with self._lock:
+            self._remaining, self._reset = remaining, reset
+
+    def wait(self):
+        """Sleep as long as needed before sending the next request."""
+        with self._lock:
+            now = time.time()
+            if self._remaining is None or self._remaining >= self.reserve or now >= self._reset:
+                return
+            if self._remaining <= 0:
+                # Budget exhausted: wait for the window to reset
+                delay = self._reset - now
+            else:
+                # Give each remaining request its own slot until the window resets
+                slot = max(now, self._next_request)
+                self._next_request = slot + (self._reset - now) / self._remaining
+                self._remaining -= 1
+                delay = slot - now
+        time.sleep(delay)
+
+
+class GitHubAdapter(HTTPAdapter):
+    """HTTP adapter adding caching, pacing and retries to the GitHub API requests.
+
+    Parameters
+    ----------
+    cache_dir : str | Path, optional
+        Directory of the :class:`ResponseCache`. By default, responses are not cached.
+    max_retries : int, optional
+        Maximum number of retries of a failed request.
+    backoff_factor : float, optional
+        Base delay of the exponential backoff, in seconds.
+    pool_size : int, optional
+        Maximum number of connections kept open per host.
+
+    """
+
+    def __init__(
+        self,
+        cache_dir: str | Path | None = None,
+        max_retries: int = DEFAULT_API_MAX_RETRIES,
+        backoff_factor: float = 1.0,
+        pool_size: int = requests.adapters.DEFAULT_POOLSIZE,
+    ):
+        """Initialize the adapter and its connection pool."""
+        # Retries are handled in ``send``, not by urllib3
+        super().__init__(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+        self.cache = None if cache_dir is None else ResponseCache(cache_dir)
+        self.retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.pacer = RateLimitPacer()
+        self.cache_hits = 0
+
+    def _retry_delay(
+        self, request: requests.PreparedRequest, response: requests.Response, attempt: int
+    ) -> float | None:
+        """Return the delay before retrying a response, or ``None`` if it is final."""
+        if response.status_code in RETRIED_STATUSES:
+            # The server may have applied a non-idempotent request (e.g. created a commit)
+            if request.method not in IDEMPOTENT_METHODS:
+                return None
+        elif response.status_code not in RATE_LIMITED_STATUSES:
+            return None
+
+        if response.status_code in RATE_LIMITED_STATUSES:
+            if "Retry-After" in response.headers:
+                delay = _parse_retry_after(response.headers["Retry-After"])
+                if delay is not None:
+                    return delay
+                # Still rate limited: fall back to the exponential backoff
+                return self._backoff(attempt)
+            if response.headers.get("X-RateLimit-Remaining") == "0":
+                reset = float(response.headers.get("X-RateLimit-Reset", 0))
+                return max(reset - time.time(), 0.0) + 1.0
+            if "rate limit" not in response.text.lower():
+                # Permission errors are final
+                return None
+
+        return self._backoff(attempt)
+
+    def _backoff(self, attempt: int) -> float:
+        """Return the delay of an exponential backoff with "full jitter"."""
+        return random.uniform(0, min(MAX_BACKOFF, self.backoff_factor * 2**attempt))
+
+    def send(self, request: requests.PreparedRequest, **kwargs) -> requests.Response:
+        """Send a request, revalidating cached responses and retrying transient errors."""
+        cached = None
+        if self.cache is not None and request.method == "GET" and not kwargs.get("stream"):
+            cached = self.cache.get(request)
+            if cached is not None:
+                if "ETag" in cached["headers"]:
+                    request.headers["If-None-Match"] = cached["headers"]["ETag"]
+                if "Last-Modified" in cached["headers"]:
+                    request.headers["If-Modified-Since"] = cached["headers"]["Last-Modified"]
+
+        for attempt in range(self.retries + 1):
+            self.pacer.wait()
+            response = super().send(request, **kwargs)
+            count("api_calls")
+            self.pacer.update(response)
+            delay = self._retry_delay(request, response, attempt)
+            if delay is None or attempt == self.retries:
+                break
+            response.close()
+            count("api_retries")
+            time.sleep(delay)
+
+        if cached is not None and response.status_code == 304:
+            # Serve the cached content, as if it had been requested unconditionally
+            self.cache_hits += 1
+            count("api_cache_hits")
+            response.status_code = 200
+            response.reason = "OK"
+            response.headers.update(cached["headers"])
+            response._content = base64.b64decode(cached["content"])
+            response._content_consumed = True
+        elif (
+            self.cache is not None
+            and request.method == "GET"
+            and response.status_code == 200
+            and not kwargs.get("stream")
+        ):
+            self.cache.put(request, response)
+
+        return response
+
+
+def _connection_classes(session: requests.Session):
+    """Create PyGithub connection classes sending their requests through a given session."""
+
+    class _SharedSessionMixin:
+        def __init__(self, host, port=None, strict=False, timeout=None, **kwargs):
+            self.host = host
+            self.port = port if port else self.default_port
+            self.timeout = timeout
+            self.verify = kwargs.get("verify", True)
+            self.session = session
+
+        def close(self):
+            # The session outlives the connections
+            pass
+
+    class HTTPConnection(_SharedSessionMixin, HTTPRequestsConnectionClass):
+        protocol = "http"
+        default_port = 80
+
+    class HTTPSConnection(_SharedSessionMixin, HTTPSRequestsConnectionClass):
+        protocol = "https"
+        default_port = 443
+
+    return HTTPConnection, HTTPSConnection
+
+
+def _use_session(requester: Requester, session: requests.Session):
+    """Make a requester, and the requesters derived from it, send their requests through a session.
+
+    PyGithub only offers a process-wide hook to replace its connection classes,
+    so they are set on this requester instance instead. The requesters PyGithub
+    derives from it (with another authentication, laziness or API version) are
+    set up the same way. A :class:`RuntimeError` is raised if the installed
+    PyGithub does not store its connection classes as expected, rather than
+    silently bypassing the adapter.
+    """
+    missing = [name for name in _CONNECTION_ATTRIBUTES if not hasattr(requester, name)]
+    if missing:
+        raise RuntimeError(
+            f"Unsupported PyGithub version: requesters have no {', '.join(missing)} attribute."
+        )
+
+    http_class, https_class = _connection_classes(session)
+    requester._Requester__httpConnectionClass = http_class
+    requester._Requester__httpsConnectionClass = https_class
+    requester._Requester__connectionClass = (
+        https_class if requester.scheme == "https" else http_class
+    )
+
+    for name in _DERIVING_METHODS:
+        method = getattr(requester, name, None)
+        if method is not None:
+            setattr(requester, name, _deriving_with_session(method, session))
+
+
+def _deriving_with_session(method, session: requests.Session):
+    """Wrap a method deriving requesters, so that new requesters use the session too."""
+
+    @functools.wraps(method)
+    def derive(*args, **kwargs):
+        derived = method(*args, **kwargs)
+        if derived is not method.__self__:
+            _use_session(derived, session)
+        return derived
+
+    return derive
+
+
+def create_client(
+    token: str,
+    cache_dir: str | Path | None = None,
+    pool_size: int | None = None,
+    base_url: str | None = None,
+    max_retries: int = DEFAULT_API_MAX_RETRIES,
+    backoff_factor: float = 1.0,
+    throttle: bool = True,
+) -> Github:
+    """Create a GitHub client whose requests go through a :class:`GitHubAdapter`.
+
+    Each client has its own session and adapter, hence its own cache, pacing and
+    retries. Other PyGithub clients of the process are not affected.
+
+    Parameters
+    ----------
+    token : str
+        GitHub access token.
+    cache_dir : str | Path, optional
+        Directory caching the API responses between runs. By default, responses
+        are not cached.
+    pool_size : int, optional
+        Maximum number of concurrent connections, for clients shared by threads.
+    base_url : str, optional
+        URL of the API, by default the one of github.com.
+    max_retries : int, optional
+        Maximum number of retries of a failed request.
+    backoff_factor : float, optional
+        Base delay of the exponential backoff, in seconds.
+    throttle : bool, optional
+        Whether to space the requests as recommended by GitHub to avoid its secondary
+        rate limits. Can be disabled for servers without such limits.
+
+    Returns
+    -------
+    Github
+        Authenticated client.
+
+    """
+    adapter = GitHubAdapter(
+        cache_dir,
+        max_retries=max_retries,
+        backoff_factor=backoff_factor,
+        pool_size=pool_size or requests.adapters.DEFAULT_POOLSIZE,
+    )
+    session = requests.Session()
+    session.auth = Requester.noopAuth
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+    options = {} if base_url is None else {"base_url": base_url}
+    if not throttle:
+        options.update(seconds_between_requests=None, seconds_between_writes=None)
+    # Retries are handled by the adapter
+    client = Github(auth=Auth.Token(token), pool_size=pool_size, retry=0, **options)
+    _use_session(client.requester, session)
+    return client
@@ -0,0 +1,132 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Module containing the strategies used to clone the target repository."""
+
+from pathlib import Path, PurePosixPath
+from typing import TYPE_CHECKING, Sequence
+
+if TYPE_CHECKING:  # pragma: no cover
+    from git import Repo
+
+CLONE_STRATEGIES = ("full", "sparse")
+"""Available clone strategies.
+
+- ``full``: clone the whole history of the checked out branch and its working tree.
+- ``sparse``: clone only the tip of the checked out branch (depth 1), without
+  downloading blobs upfront, and materialize only the target directory on disk.
+"""
+
+
+def normalize_repository_path(path: str | Path) -> str:
+    """Normalize a path relative to the root of a repository.
+
+    Parameters
+    ----------
+    path : str | Path
+        Path relative to the root of the repository.
+
+    Returns
+    -------
+    str
+        Path with ``/`` separators, as used by git. The root of the repository
+        is represented by the empty string.
+
+    """
+    posix_path = str(PurePosixPath(Path(path).as_posix()))
+    return "" if posix_path == "." else posix_path
+
+
+def clone_repository(
+    url: str | Path,
+    repo_path: str | Path,
+    branch: str,
+    to_dir: str | Path | Sequence[str | Path],
+    strategy: str = "full",
+    shared: bool = False,
+    bare: bool = False,
+) -> "Repo":
+    """Clone a repository with the requested strategy.
+
+    The requested branch is checked out directly, without checking out the
+    default branch of the repository first.
+
+    Parameters
+    ----------
+    url : str | Path
+        URL of the repository to clone, or path to a local repository.
+    repo_path : str | Path
+        Path where the repository is cloned.
+    branch : str
+        Branch to check out.
+    to_dir : str | Path | Sequence[str | Path]
+        Directory or directories of interest (w.r.t. the root of the repository).
+        Only these directories are materialized on disk with the ``sparse`` strategy.
+    strategy : str, optional
+        One of :data:`CLONE_STRATEGIES`, by default ``"full"``.
+    shared : bool, optional
+        Whether ``url`` is a local repository whose objects are shared with the
+        clone (see ``git clone --shared``), by default ``False``. History and
+        blob filtering are skipped in that case since no object is transferred.
+    bare : bool, optional
+        Whether to clone the repository without any working tree, by default ``False``.
+        Only ``branch`` is then cloned, and ``to_dir`` has no effect.
+
+    Returns
+    -------
+    Repo
+        The cloned repository.
+
+    """
+    if strategy not in CLONE_STRATEGIES:
+        raise ValueError(
+            f"Unknown clone strategy '{strategy}'. Available strategies: {CLONE_STRATEGIES}."
+        )
+
+    # GitPython is only imported when a repository is cloned
+    from .instrumented import InstrumentedRepo
+
+    if strategy == "full" and not bare:
+        return InstrumentedRepo.clone_from(url, repo_path, branch=branch, shared=shared)
+
+    options = {"branch": branch, "single_branch": True}
+    if bare:
+        options["bare"] = True
+    else:
+        options["no_checkout"] = True
+    if shared:
+        options["shared"] = True
+    elif strategy == "sparse":
+        options["depth"] = 1
+        options["filter"] = "blob:none"
+
+    repo = InstrumentedRepo.clone_from(url, repo_path, **options)
+    if bare:
+        return repo
+
+    directories = [to_dir] if isinstance(to_dir, (str, Path)) else to_dir
+    sparse_dirs = [normalize_repository_path(directory) for directory in directories]
+    if all(sparse_dirs):
+        repo.git.sparse_checkout("set", "--cone", *sparse_dirs)
+    repo.git.checkout(branch)
+
+    return repo
@@ -27,3 +27,34 @@ DEFAULT_BRANCH_NAME = "sync/file-sync"
 
 DEFAULT_PULL_REQUEST_TITLE = "sync: file sync performed by ansys-tools-repo-sync"
 """Default title for the pull request created during synchronization."""
+
+DEFAULT_CACHE_MAINTENANCE_INTERVAL = 24 * 60 * 60
+"""Minimum number of seconds between two ``git maintenance`` runs on a cached mirror."""
+
+SYNC_BACKENDS = ("clone", "api", "fast-import")
+"""Available backends to commit the synchronized files.
+
+- ``clone``: clone the repository, copy the files, then commit and push the changes.
+- ``api``: upload the changed files and create the commit through the GitHub Git Data API,
+  without cloning the repository.
+- ``fast-import``: clone the repository without any working tree, and stream the changed files
+  into ``git fast-import`` to create the commit.
+"""
+
+DEFAULT_API_WORKERS = 8
+"""Default number of concurrent requests sent to the GitHub API."""
+
+DEFAULT_TARGET_WORKERS = 4
+"""Default number of repositories synchronized concurrently from a targets configuration."""
+
+DEFAULT_API_MAX_RETRIES = 5
+"""Default number of retries of a GitHub API request failing transiently."""
+
+DEFAULT_WATCH_DEBOUNCE = 2.0
+"""Default number of seconds without any change before a watched folder is synchronized."""
+
+DEFAULT_POLL_INTERVAL = 1.0
+"""Default number of seconds between two scans of a watched folder, when it is polled."""
+
+DEFAULT_SUMMARY_FILES = 100
+"""Default number of changed files (and directories) listed in the summary of a synchronization."""
@@ -0,0 +1,318 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Module containing the incremental copy engine."""
+
+from dataclasses import dataclass, field
+import errno
+import mmap
+import os
+from pathlib import Path
+import shutil
+import stat
+import tempfile
+from typing import Dict, List, Set, Tuple
+
+from .manifest import ManifestMatcher
+from .walker import iter_source_files
+
+MMAP_THRESHOLD = 1024 * 1024
+"""Size (in bytes) from which files are compared through memory maps."""
+
+_CHUNK_SIZE = 64 * 1024
+
+COPY_STRATEGIES = ("copy", "reflink", "hardlink", "auto")
+"""Available copy strategies.
+
+- ``copy``: write the content of the files.
+- ``reflink``: clone the files (copy-on-write), on file systems supporting it
+  such as Btrfs or XFS. Falls back to ``copy``.
+- ``hardlink``: hard link the files, on the same file system. Falls back to ``copy``.
+  The destination files share their content with the source files: they must
+  not be modified in place afterwards.
+- ``auto``: try ``reflink``, then ``hardlink``, then ``copy``.
+"""
+
+FICLONE = 0x40049409
+"""Linux ``ioctl`` request cloning the content of a file into another one."""
+
+_UNSUPPORTED_ERRNOS = {
+    errno.EOPNOTSUPP,
+    errno.ENOTSUP,
+    errno.ENOTTY,
+    errno.EXDEV,
+    errno.EINVAL,
+    errno.ENOSYS,
+    errno.EPERM,
+    errno.EMLINK,
+}
+
+_unsupported: Dict[Tuple[int, int], Set[str]] = {}
+"""Methods that failed between two devices, so that they are not tried again."""
+
+
+@dataclass
+class CopyStats:
+    """Counts of files handled by :func:`copy_tree`."""
+
+    copied: int = 0
+    """Existing files overwritten because their content or mode differed."""
+
+    new: int = 0
+    """Files that did not exist in the destination."""
+
+    skipped: int = 0
+    """Files left untouched because the destination was already identical."""
+
+    bytes_written: int = 0
+    """Size of the content written to the destination, in bytes."""
+
+    bytes_shared: int = 0
+    """Size of the content reflinked or hard linked instead of written, in bytes."""
+
+    new_paths: List[str] = field(default_factory=list, repr=False)
+    """Relative paths (with ``/`` separators) of the new files written by :func:`copy_tree`."""
+
+    copied_paths: List[str] = field(default_factory=list, repr=False)
+    """Relative paths (with ``/`` separators) of the files overwritten by :func:`copy_tree`."""
+
+    @property
+    def written(self) -> int:
+        """Number of files written to the destination."""
+        return self.copied + self.new
+
+    def __str__(self) -> str:
+        """Summarize the counts."""
+        return f"{self.new} new, {self.copied} copied, {self.skipped} skipped (unchanged)"
+
+
+def files_are_identical(
+    source: str | Path,
+    destination: str | Path,
+    source_stat: os.stat_result | None = None,
+    destination_stat: os.stat_result | None = None,
+) -> bool:
+    """Compare the content of two files.
+
+    Sizes are compared first. Contents are then compared through memory maps
+    for large files, or chunk by chunk for small ones, so that the comparison
+    stops at the first difference.
+
+    Parameters
+    ----------
+    source : str | Path
+        Path to the first file.
+    destination : str | Path
+        Path to the second file.
+    source_stat : os.stat_result, optional
+        Result of ``os.stat`` on ``source``, if already known.
+    destination_stat : os.stat_result, optional
+        Result of ``os.stat`` on ``destination``, if already known.
+
+    Returns
+    -------
+    bool
+        Whether both files have the same content.
+
+    """
+    source, destination = Path(source), Path(destination)
+    source_stat = source_stat or source.stat()
+    destination_stat = destination_stat or destination.stat()
+    if source_stat.st_size != destination_stat.st_size:
+        return False
+    if source_stat.st_size == 0:
+        return True
+
+    with source.open("rb") as src, destination.open("rb") as dst:
+        if source_stat.st_size >= MMAP_THRESHOLD:
+            with (
+                mmap.mmap(src.fileno(), 0, access=mmap.ACCESS_READ) as src_map,
+                mmap.mmap(dst.fileno(), 0, access=mmap.ACCESS_READ) as dst_map,
+            ):
+                return memoryview(src_map) == memoryview(dst_map)
+
+        while True:
+            src_chunk = src.read(_CHUNK_SIZE)
+            if src_chunk != dst.read(_CHUNK_SIZE):
+                return False
+            if not src_chunk:
+                return True
+
+
+def _reflink(source: Path, destination: Path):
+    """Clone the content of ``source`` into ``destination``, and copy its metadata.
+
+    The clone is made in a temporary file next to ``destination``, then renamed
+    into place, so that ``destination`` is left untouched if the clone fails.
+    """
+    try:
+        import fcntl
+    except ImportError:
+        raise OSError(errno.ENOTSUP, "Reflinks are not supported on this platform.")
+
+    fd, temporary = tempfile.mkstemp(prefix=f".{destination.name}.", dir=destination.parent)
+    temporary = Path(temporary)
+    try:
+        with source.open("rb") as src, os.fdopen(fd, "wb") as dst:
+            fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+        shutil.copystat(source, temporary)
+        temporary.replace(destination)
+    except BaseException:
+        temporary.unlink()
+        raise
+
+
+def _hardlink(source: Path, destination: Path):
+    """Replace ``destination`` by a hard link to ``source``."""
+    destination.unlink(missing_ok=True)
+    os.link(source, destination)
+
+
+def _write(
+    source: Path, destination: Path, source_stat: os.stat_result, stats: CopyStats, strategy: str
+):
+    """Write the content of ``source`` to ``destination`` with the given strategy."""
+    methods = {"reflink": _reflink, "hardlink": _hardlink}
+    if strategy != "copy":
+        devices = (source_stat.st_dev, destination.parent.stat().st_dev)
+        unsupported = _unsupported.setdefault(devices, set())
+        for name in ("reflink", "hardlink") if strategy == "auto" else (strategy,):
+            if name in unsupported:
+                continue
+            try:
+                methods[name](source, destination)
+            except OSError as err:
+                if err.errno not in _UNSUPPORTED_ERRNOS:
+                    raise
+                # The file systems do not support this method: do not try it again
+                unsupported.add(name)
+            else:
+                stats.bytes_shared += source_stat.st_size
+                return
+
+    shutil.copy2(source, destination)
+    stats.bytes_written += source_stat.st_size
+
+
+def copy_file(
+    source: str | Path,
+    destination: str | Path,
+    stats: CopyStats,
+    source_stat: os.stat_result | None = None,
+    strategy: str = "copy",
+) -> bool:
+    """Copy a file unless the destination is already identical.
+
+    Parameters
+    ----------
+    source : str | Path
+        Path to the file to copy.
+    destination : str | Path
+        Path to the destination file. Parent directories are created if needed.
+    stats : CopyStats
+        Counts updated with the outcome of the copy.
+    source_stat : os.stat_result, optional
+        Result of ``os.stat`` on ``source``, if already known.
+    strategy : str, optional
+        One of :data:`COPY_STRATEGIES`, by default ``"copy"``.
+
+    Returns
+    -------
+    bool
+        Whether the destination was written.
+
+    """
+    source, destination = Path(source), Path(destination)
+    source_stat = source_stat or source.stat()
+    try:
+        destination_stat = destination.stat()
+    except FileNotFoundError:
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        _write(source, destination, source_stat, stats, strategy)
+        stats.new += 1
+        return True
+
+    if not files_are_identical(source, destination, source_stat, destination_stat):
+        _write(source, destination, source_stat, stats, strategy)
+        stats.copied += 1
+        return True
+
+    # Git only tracks the executable bit, align it without rewriting the content
+    if (source_stat.st_mode ^ destination_stat.st_mode) & stat.S_IXUSR:
+        shutil.copymode(source, destination)
+        stats.copied += 1
+        return True
+
+    stats.skipped += 1
+    return False
+
+
+def copy_tree(
+    source: str | Path,
+    destination: str | Path,
+    manifest: ManifestMatcher | None = None,
+    skip: Set[str] | None = None,
+    strategy: str = "copy",
+) -> CopyStats:
+    """Incrementally copy a directory tree.
+
+    Unlike ``shutil.copytree()``, files whose content is already identical in
+    the destination are left untouched, so that their metadata (and git's stat
+    cache) remain valid.
+
+    Parameters
+    ----------
+    source : str | Path
+        Directory to copy.
+    destination : str | Path
+        Directory receiving the files. It is created if needed.
+    manifest : ManifestMatcher, optional
+        Compiled manifest selecting the files to copy. By default, all files are copied.
+    skip : Set[str], optional
+        Relative paths (with ``/`` separators) of files and directories known to be
+        identical in the destination. They are neither walked nor compared.
+    strategy : str, optional
+        One of :data:`COPY_STRATEGIES`, by default ``"copy"``. Unless it is
+        ``"copy"``, the strategy falls back to copying the files that cannot be
+        reflinked or hard linked.
+
+    Returns
+    -------
+    CopyStats
+        Counts of new, copied and skipped files.
+
+    """
+    if strategy not in COPY_STRATEGIES:
+        raise ValueError(
+            f"Unknown copy strategy '{strategy}'. Available strategies: {COPY_STRATEGIES}."
+        )
+
+    stats = CopyStats()
+    destination = Path(destination)
+    destination.mkdir(parents=True, exist_ok=True)
+
+    for relative_path, entry in iter_source_files(source, manifest, skip):
+        new = stats.new
+        if copy_file(entry.path, destination / relative_path, stats, entry.stat(), strategy):
+            (stats.new_paths if stats.new > new else stats.copied_paths).append(relative_path)
+
+    return stats
@@ -0,0 +1,279 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Module containing the synchronization of a folder towards several repositories."""
+
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from dataclasses import dataclass, field
+from pathlib import Path
+import time
+import tomllib
+from typing import Dict, List
+
+from .client import create_client
+from .constants import DEFAULT_TARGET_WORKERS
+from .manifest import ManifestMatcher
+from .metrics import Metrics
+from .repo_sync import scan_source_tree, synchronize
+
+
+@dataclass
+class SyncTarget:
+    """Repository and folder receiving the synchronized files."""
+
+    owner: str
+    """Repository owner (user or organization)."""
+
+    repository: str
+    """Repository name."""
+
+    to_dir: str
+    """Directory to which files are synced (w.r.t. the root of the repository)."""
+
+    branch: str = "main"
+    """Branch to check out."""
+
+    include_manifest: Path | None = None
+    """Manifest of this target. By default, the manifest shared by all targets is used."""
+
+    remote_url: str | None = None
+    """URL of the git remote. By default, the HTTPS URL of the repository."""
+
+    @property
+    def name(self) -> str:
+        """Full name of the repository."""
+        return f"{self.owner}/{self.repository}"
+
+
+@dataclass
+class SyncResult:
+    """Outcome of the synchronization of a target."""
+
+    target: SyncTarget
+    """Synchronized target."""
+
+    pull_request_url: str | None = None
+    """URL of the pull request, if one was created or updated."""
+
+    error: str | None = None
+    """Description of the error that stopped the synchronization, if any."""
+
+    duration: float = 0.0
+    """Duration of the synchronization, in seconds."""
+
+    metrics: Metrics = field(default_factory=Metrics)
+    """Timing spans and counters of the synchronization."""
+
+    @property
+    def status(self) -> str:
+        """Short description of the outcome."""
+        if self.error is not None:
+            return "failed"
+        if self.pull_request_url is not None:
+            return "synchronized"
+        return "no changes"
+
+
+def load_targets(config_path: str | Path) -> List[SyncTarget]:
+    """Read the targets listed in a TOML configuration file.
+
+    Each target is a ``[[targets]]`` table with the ``owner``, ``repository``
+    and ``to_dir`` keys, and optionally ``branch``, ``manifest`` and ``remote_url``. Relative
+    manifest paths are resolved against the directory of the configuration file.
+
+    Parameters
+    ----------
+    config_path : str | Path
+        Path to the configuration file.
+
+    Returns
+    -------
+    List[SyncTarget]
+        Targets in the order of the configuration file.
+
+    """
+    config_path = Path(config_path)
+    with config_path.open("rb") as config_file:
+        config = tomllib.load(config_file)
+
+    targets = []
+    for index, entry in enumerate(config.get("targets", [])):
+        missing = [key for key in ("owner", "repository", "to_dir") if key not in entry]
+        if missing:
+            raise ValueError(
+                f"Target #{index + 1} of {config_path} is missing: {', '.join(missing)}."
+            )
+        manifest = entry.get("manifest")
+        targets.append(
+            SyncTarget(
+                owner=entry["owner"],
+                repository=entry["repository"],
+                to_dir=entry["to_dir"],
+                branch=entry.get("branch", "main"),
+                include_manifest=None if manifest is None else config_path.parent / manifest,
+                remote_url=entry.get("remote_url"),
+            )
+        )
+
+    if not targets:
+        raise ValueError(f"No targets found in {config_path}.")
+    return targets
+
+
+def fan_out(
+    targets: List[SyncTarget],
+    token: str,
+    from_dir: str | Path,
+    include_manifest: str | Path | None = None,
+    workers: int = DEFAULT_TARGET_WORKERS,
+    hash_cache: str | Path | None = None,
+    hash_workers: int | None = None,
+    api_cache: str | Path | None = None,
+    metrics: Metrics | None = None,
+    api_url: str | None = None,
+    **options,
+) -> List[SyncResult]:
+    """Synchronize a folder to several repositories concurrently.
+
+    The folder is hashed once for all targets, and the targets share a single
+    connection-pooled GitHub client. A failing target does not stop the others.
+
+    Parameters
+    ----------
+    targets : List[SyncTarget]
+        Repositories and folders receiving the files.
+    token : str
+        GitHub access token.
+    from_dir : str | Path
+        Directory from which files want to be synced.
+    include_manifest : str | Path, optional
+        Manifest of the targets that do not define their own.
+    workers : int, optional
+        Number of targets synchronized concurrently.
+    hash_cache : str | Path, optional
+        Path to a persistent cache of the git hashes of the files in ``from_dir``.
+    hash_workers : int, optional
+        Number of processes used to hash the files in ``from_dir``.
+    api_cache : str | Path, optional
+        Directory caching the GitHub API responses between runs.
+    metrics : Metrics, optional
+        Collector receiving the metrics of the stages shared by all targets, such as
+        the hashing of ``from_dir``. The metrics of each target are in its result.
+    api_url : str, optional
+        URL of the GitHub API, by default the one of github.com.
+    **options
+        Other options of :func:`ansys.tools.repo_sync.repo_sync.synchronize`,
+        applied to every target.
+
+    Returns
+    -------
+    List[SyncResult]
+        Outcome of each target, in the order of ``targets``.
+
+    """
+    manifest_paths = {}
+    for target in targets:
+        manifest_path = target.include_manifest or include_manifest
+        if manifest_path is None:
+            raise ValueError(f"No manifest defined for target '{target.name}'.")
+        manifest_paths[target.name, target.to_dir] = Path(manifest_path)
+
+    # Hash the files accepted by any manifest once, then select those of each manifest
+    manifests = {path: ManifestMatcher.from_file(path) for path in manifest_paths.values()}
+    union = ManifestMatcher([pattern for m in manifests.values() for pattern in m.patterns])
+    with nullcontext() if metrics is None else metrics.activate():
+        all_files = scan_source_tree(from_dir, union, hash_cache, hash_workers)
+    source_trees = {path: all_files.select(manifest) for path, manifest in manifests.items()}
+
+    client = create_client(token, api_cache, pool_size=workers, base_url=api_url)
+
+    def run(target: SyncTarget) -> SyncResult:
+        manifest_path = manifest_paths[target.name, target.to_dir]
+        target_metrics = Metrics()
+        start = time.perf_counter()
+        try:
+            url = synchronize(
+                owner=target.owner,
+                repository=target.repository,
+                token=token,
+                from_dir=from_dir,
+                to_dir=target.to_dir,
+                include_manifest=manifest_path,
+                branch_checked_out=target.branch,
+                client=client,
+                source_tree=source_trees[manifest_path],
+                metrics=target_metrics,
+                remote_url=target.remote_url,
+                **options,
+            )
+        except Exception as err:
+            print(f"Synchronization of '{target.name}' failed: {err} - process will continue.")
+            return SyncResult(
+                target,
+                error=str(err),
+                duration=time.perf_counter() - start,
+                metrics=target_metrics,
+            )
+        return SyncResult(
+            target,
+            pull_request_url=url,
+            duration=time.perf_counter() - start,
+            metrics=target_metrics,
+        )
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(run, targets))
+
+
+def format_results(results: List[SyncResult]) -> str:
+    """Format the outcome of the synchronizations as a table.
+
+    Parameters
+    ----------
+    results : List[SyncResult]
+        Outcome of each target.
+
+    Returns
+    -------
+    str
+        One line per target, with its status, duration and pull request URL or error.
+
+    """
+    rows = [("Repository", "Folder", "Status", "Time", "Details")]
+    rows.extend(
+        (
+            result.target.name,
+            result.target.to_dir,
+            result.status,
+            f"{result.duration:.1f}s",
+            result.error or result.pull_request_url or "",
+        )
+        for result in results
+    )
+    widths: Dict[int, int] = {
+        column: max(len(row[column]) for row in rows) for column in range(len(rows[0]) - 1)
+    }
+    return "\n".join(
+        "  ".join([*(row[column].ljust(widths[column]) for column in widths), row[-1]]).rstrip()
+        for row in rows
+    )
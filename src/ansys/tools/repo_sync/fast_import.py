@@ -0,0 +1,183 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Module containing the commit backend streaming the files into ``git fast-import``.
+
+The new commit is built directly in the object database of a bare clone, on
+top of the checked out branch: the files to sync are read once and never
+written to a working tree.
+"""
+
+import os
+from pathlib import Path
+import subprocess
+from typing import BinaryIO, Dict, List
+
+from git import Actor, Repo
+
+from .github_api import DirectoryChanges, TreeElement
+from .hashing import read_tree
+from .metrics import count
+
+_CHUNK_SIZE = 1024 * 1024
+
+_OBJECT_TYPES = {"040000": "tree", "160000": "commit"}
+"""Types of the git objects that are not blobs, by mode."""
+
+
+def list_tree(repo: Repo, treeish: str, path: str = "") -> Dict[str, TreeElement]:
+    """List all git objects below a directory of a commit.
+
+    Parameters
+    ----------
+    repo : Repo
+        Repository to read from.
+    treeish : str
+        Commit, branch or tree to read.
+    path : str, optional
+        Directory of interest (w.r.t. the root of the repository, with ``/``
+        separators), by default the root of the repository.
+
+    Returns
+    -------
+    Dict[str, TreeElement]
+        Git objects read by :func:`ansys.tools.repo_sync.hashing.read_tree`, in
+        the format of :func:`ansys.tools.repo_sync.github_api.list_remote_tree`.
+
+    """
+    return {
+        relative_path: TreeElement(mode, _OBJECT_TYPES.get(mode, "blob"), sha)
+        for relative_path, (mode, sha) in read_tree(repo, treeish, path).items()
+    }
+
+
+def _quote_path(path: str) -> bytes:
+    """Encode a path for the fast-import stream, quoting it if required."""
+    encoded = path.encode("utf-8", "surrogateescape")
+    if encoded.startswith(b'"') or b"\n" in encoded:
+        escaped = encoded.replace(b"\\", b"\\\\").replace(b'"', b'\\"').replace(b"\n", b"\\n")
+        return b'"' + escaped + b'"'
+    return encoded
+
+
+def _write_file(stream: BinaryIO, path: Path, mode: str, target_path: str) -> int:
+    """Write a file modification with its inline content and return its size."""
+    with path.open("rb") as file:
+        size = os.fstat(file.fileno()).st_size
+        stream.write(b"M %s inline %s\ndata %d\n" % (mode.encode(), _quote_path(target_path), size))
+        remaining = size
+        while remaining:
+            chunk = file.read(min(_CHUNK_SIZE, remaining))
+            if not chunk:
+                raise RuntimeError(f"'{path}' was truncated while being committed.")
+            stream.write(chunk)
+            remaining -= len(chunk)
+        stream.write(b"\n")
+    return size
+
+
+def commit_with_fast_import(
+    repo: Repo,
+    base: str,
+    branch: str,
+    directories: List[DirectoryChanges],
+    message: str,
+) -> str:
+    """Create a commit applying changes to directories, through ``git fast-import``.
+
+    Only the added and modified files are read, and they are streamed to git
+    without being written to a working tree.
+
+    Parameters
+    ----------
+    repo : Repo
+        Repository receiving the commit. It can be bare and blob-less.
+    base : str
+        Parent of the new commit.
+    branch : str
+        Branch pointing to the new commit. It is created, or reset if it exists.
+    directories : List[DirectoryChanges]
+        Changes to apply to each directory.
+    message : str
+        Commit message.
+
+    Returns
+    -------
+    str
+        SHA of the new commit.
+
+    """
+    config = repo.config_reader()
+    author, committer = Actor.author(config), Actor.committer(config)
+    base_sha = repo.git.rev_parse("--verify", f"{base}^{{commit}}")
+    encoded_message = message.encode()
+
+    process = repo.git.fast_import(
+        "--quiet",
+        "--force",
+        "--done",
+        "--date-format=now",
+        as_process=True,
+        istream=subprocess.PIPE,
+    )
+    stream = process.proc.stdin
+    try:
+        stream.write(b"commit refs/heads/%s\n" % branch.encode())
+        stream.write(b"author %s <%s> now\n" % (author.name.encode(), author.email.encode()))
+        stream.write(
+            b"committer %s <%s> now\n" % (committer.name.encode(), committer.email.encode())
+        )
+        stream.write(b"data %d\n%s\n" % (len(encoded_message), encoded_message))
+        stream.write(b"from %s\n" % base_sha.encode())
+
+        # Deletions come first, so that files can replace deleted folders
+        for directory in directories:
+            prefix = f"{directory.path}/" if directory.path else ""
+            for relative_path in directory.changes.deleted:
+                stream.write(b"D %s\n" % _quote_path(f"{prefix}{relative_path}"))
+                count("files_deleted")
+
+        for directory in directories:
+            prefix = f"{directory.path}/" if directory.path else ""
+            count("files_new", len(directory.changes.added))
+            count("files_copied", len(directory.changes.modified))
+            for relative_path in directory.changes.added + directory.changes.modified:
+                size = _write_file(
+                    stream,
+                    Path(directory.source_root) / relative_path,
+                    directory.source_tree.files[relative_path][0],
+                    f"{prefix}{relative_path}",
+                )
+                count("bytes_written", size)
+
+        stream.write(b"\ndone\n")
+    except BaseException:
+        # Abort the import, leaving the branch untouched
+        stream.close()
+        process.proc.kill()
+        process.proc.wait()
+        raise
+
+    stream.close()
+    process.wait()
+
+    return repo.git.rev_parse("--verify", f"refs/heads/{branch}")
@@ -0,0 +1,357 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Module containing helpers built on the GitHub REST API."""
+
+import base64
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Tuple
+
+from github import GithubException, InputGitTreeElement
+from github.GitCommit import GitCommit
+from github.GitTree import GitTree
+from github.Repository import Repository
+
+from .changes import ChangeSet
+from .constants import DEFAULT_API_WORKERS
+from .hashing import SourceTree
+from .manifest import ManifestMatcher
+from .metrics import count, submit
+
+
+class TreeElement(NamedTuple):
+    """Git object listed in a remote tree."""
+
+    mode: str
+    type: str
+    sha: str
+
+
+def _tree_elements(tree: GitTree, prefix: str = "") -> Dict[str, TreeElement] | None:
+    """Map the paths below ``prefix`` of a recursive tree to their mode, type and SHA.
+
+    Returns ``None`` if the tree listing was truncated by the API.
+    """
+    if tree.raw_data.get("truncated"):
+        return None
+
+    if not prefix:
+        elements = {"": TreeElement("040000", "tree", tree.sha)}
+        elements.update(
+            (element.path, TreeElement(element.mode, element.type, element.sha))
+            for element in tree.tree
+        )
+        return elements
+
+    elements = {}
+    for element in tree.tree:
+        if element.path == prefix and element.type == "tree":
+            elements[""] = TreeElement(element.mode, element.type, element.sha)
+        elif element.path.startswith(f"{prefix}/"):
+            elements[element.path[len(prefix) + 1 :]] = TreeElement(
+                element.mode, element.type, element.sha
+            )
+    return elements
+
+
+def list_remote_tree(
+    pygithub_repo: Repository, treeish: str, path: str = ""
+) -> Dict[str, TreeElement] | None:
+    """List all git objects below a directory of a remote branch or commit.
+
+    The whole tree is first requested at once. If the API truncates it (very
+    large repositories), the directory is reached one level at a time and
+    only its own tree is requested recursively.
+
+    Parameters
+    ----------
+    pygithub_repo : Repository
+        Remote repository.
+    treeish : str
+        Branch or commit to read.
+    path : str, optional
+        Directory of interest (w.r.t. the root of the repository, with ``/``
+        separators), by default the root of the repository.
+
+    Returns
+    -------
+    Dict[str, TreeElement] | None
+        Mapping of paths relative to ``path`` (the directory itself being the
+        empty path) to their git object. Empty if the directory does not
+        exist, and ``None`` if the tree is too large to be listed.
+
+    """
+    elements = _tree_elements(pygithub_repo.get_git_tree(treeish, recursive=True), path)
+    if elements is not None or not path:
+        return elements
+
+    # Walk down to the directory, one level at a time
+    tree_sha = treeish
+    for name in path.split("/"):
+        children = pygithub_repo.get_git_tree(tree_sha).tree
+        tree_sha = next(
+            (child.sha for child in children if child.path == name and child.type == "tree"),
+            None,
+        )
+        if tree_sha is None:
+            return {}
+
+    return _tree_elements(pygithub_repo.get_git_tree(tree_sha, recursive=True))
+
+
+def read_remote_tree(
+    pygithub_repo: Repository, treeish: str, path: str = ""
+) -> Dict[str, Tuple[str, str]] | None:
+    """Read the mode and SHA of all git objects below a directory of a remote branch or commit.
+
+    Parameters
+    ----------
+    pygithub_repo : Repository
+        Remote repository.
+    treeish : str
+        Branch or commit to read.
+    path : str, optional
+        Directory of interest (w.r.t. the root of the repository, with ``/``
+        separators), by default the root of the repository.
+
+    Returns
+    -------
+    Dict[str, Tuple[str, str]] | None
+        Mapping of paths relative to ``path`` (the directory itself being the
+        empty path) to the mode and SHA of their git object, in the same format as
+        :func:`ansys.tools.repo_sync.hashing.read_tree`. Empty if the directory
+        does not exist, and ``None`` if the tree is too large to be listed.
+
+    """
+    elements = list_remote_tree(pygithub_repo, treeish, path)
+    if elements is None:
+        return None
+    return {
+        relative_path: (element.mode, element.sha) for relative_path, element in elements.items()
+    }
+
+
+def remote_tree_is_up_to_date(
+    pygithub_repo: Repository,
+    branch: str,
+    path: str,
+    source_tree: SourceTree,
+    clean_to_dir: bool,
+) -> bool:
+    """Check through the API whether a remote directory already contains the source tree.
+
+    The modes listed by the API are compared along with the SHAs, so a file
+    whose executable bit changed is not considered up to date.
+
+    Parameters
+    ----------
+    pygithub_repo : Repository
+        Remote repository.
+    branch : str
+        Branch to compare with.
+    path : str
+        Directory to compare (w.r.t. the root of the repository, with ``/`` separators).
+    source_tree : SourceTree
+        Git objects of the files to sync.
+    clean_to_dir : bool
+        Whether the directory is cleaned before synchronizing.
+
+    Returns
+    -------
+    bool
+        Whether synchronizing would not change anything. ``False`` is also
+        returned when the comparison is not conclusive.
+
+    """
+    try:
+        target = read_remote_tree(pygithub_repo, branch, path)
+    except GithubException as err:
+        if err.status != 404:
+            print(f"Unable to read the remote tree: {err} - process will continue.")
+        return False
+
+    return target is not None and source_tree.is_up_to_date(target, clean_to_dir)
+
+
+def plan_tree_changes(
+    target: Dict[str, TreeElement],
+    source_tree: SourceTree,
+    manifest: ManifestMatcher,
+    clean_to_dir: bool,
+    clean_to_dir_based_on_manifest: bool,
+) -> ChangeSet:
+    """Compute the changes needed for a remote directory to contain the source tree.
+
+    Parameters
+    ----------
+    target : Dict[str, TreeElement]
+        Git objects of the remote directory, as returned by :func:`list_remote_tree`.
+    source_tree : SourceTree
+        Git objects of the files to sync.
+    manifest : ManifestMatcher
+        Compiled manifest, used for the manifest-based cleanup.
+    clean_to_dir : bool
+        Whether to delete the remote files that are not part of the source tree.
+    clean_to_dir_based_on_manifest : bool
+        Whether to restrict the cleanup to the files matching the manifest.
+
+    Returns
+    -------
+    ChangeSet
+        Files to add, modify and delete, relative to the remote directory.
+
+    """
+    changes = ChangeSet()
+    for path, (mode, sha) in source_tree.files.items():
+        element = target.get(path)
+        if element is None or element.type != "blob":
+            changes.added.append(path)
+        elif element.sha != sha or element.mode != mode:
+            changes.modified.append(path)
+
+    if clean_to_dir:
+        changes.deleted.extend(
+            path
+            for path, element in target.items()
+            if element.type == "blob"
+            and path not in source_tree.files
+            and (not clean_to_dir_based_on_manifest or manifest.match(path.rpartition("/")[2]))
+        )
+
+    return changes
+
+
+def _upload_blob(pygithub_repo: Repository, path: Path) -> str:
+    """Upload the content of a file as a blob and return its SHA."""
+    data = path.read_bytes()
+    sha = pygithub_repo.create_git_blob(base64.b64encode(data).decode("ascii"), "base64").sha
+    count("blobs_uploaded")
+    count("bytes_uploaded", len(data))
+    return sha
+
+
+class DirectoryChanges(NamedTuple):
+    """Changes to apply to a remote directory."""
+
+    path: str
+    """Directory receiving the files (w.r.t. the root of the repository, with ``/`` separators)."""
+
+    source_root: str | Path
+    """Directory containing the files to sync."""
+
+    source_tree: SourceTree
+    """Git objects of the files to sync."""
+
+    changes: ChangeSet
+    """Changes to apply, as returned by :func:`plan_tree_changes`."""
+
+    target: Dict[str, TreeElement]
+    """Git objects of the directory before the changes, as given to :func:`plan_tree_changes`."""
+
+
+def commit_tree_changes(
+    pygithub_repo: Repository,
+    base_commit: GitCommit,
+    directories: List[DirectoryChanges],
+    message: str,
+    workers: int = DEFAULT_API_WORKERS,
+) -> GitCommit:
+    """Create a commit applying changes to remote directories, through the Git Data API.
+
+    Only the blobs of added and modified files are uploaded, concurrently. The
+    new tree is then built on top of the tree of ``base_commit``.
+
+    Parameters
+    ----------
+    pygithub_repo : Repository
+        Remote repository.
+    base_commit : GitCommit
+        Parent of the new commit.
+    directories : List[DirectoryChanges]
+        Changes to apply to each directory.
+    message : str
+        Commit message.
+    workers : int, optional
+        Maximum number of concurrent blob uploads.
+
+    Returns
+    -------
+    GitCommit
+        The new commit. It is not referenced by any branch yet.
+
+    """
+    uploads = []
+    elements = []
+    for directory in directories:
+        prefix = f"{directory.path}/" if directory.path else ""
+        uploads.extend(
+            (
+                f"{prefix}{relative_path}",
+                Path(directory.source_root) / relative_path,
+                directory.source_tree.files[relative_path][0],
+            )
+            for relative_path in directory.changes.added + directory.changes.modified
+        )
+        # The API only deletes an entry whose mode matches the one of the tree
+        elements.extend(
+            InputGitTreeElement(
+                f"{prefix}{relative_path}", directory.target[relative_path].mode, "blob", sha=None
+            )
+            for relative_path in directory.changes.deleted
+        )
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            submit(executor, _upload_blob, pygithub_repo, local_path)
+            for _, local_path, _ in uploads
+        ]
+        elements.extend(
+            InputGitTreeElement(path, mode, "blob", sha=future.result())
+            for (path, _, mode), future in zip(uploads, futures)
+        )
+
+    tree = pygithub_repo.create_git_tree(elements, base_tree=base_commit.tree)
+    return pygithub_repo.create_git_commit(message, tree, [base_commit])
+
+
+def update_branch(pygithub_repo: Repository, branch: str, sha: str):
+    """Point a remote branch to a commit, creating the branch if needed.
+
+    The branch is force-updated, like ``git push --force`` would.
+
+    Parameters
+    ----------
+    pygithub_repo : Repository
+        Remote repository.
+    branch : str
+        Name of the branch.
+    sha : str
+        SHA of the commit.
+
+    """
+    try:
+        pygithub_repo.get_git_ref(f"heads/{branch}").edit(sha, force=True)
+    except GithubException as err:
+        if err.status not in (404, 422):
+            raise
+        pygithub_repo.create_git_ref(f"refs/heads/{branch}", sha)
@@ -0,0 +1,186 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Module containing the persistent cache of blob hashes of the source tree."""
+
+import os
+from pathlib import Path
+import sqlite3
+import time
+from typing import Dict, Iterable, Tuple
+
+from .manifest import ManifestMatcher
+
+RACY_WINDOW_NS = 2 * 10**9
+"""Files modified less than this many nanoseconds before a scan are not cached.
+
+Their content could still change without their size or modification time
+changing, the same way git handles "racily clean" index entries.
+"""
+
+LOCK_TIMEOUT = 30.0
+"""Number of seconds to wait for another process to release the database."""
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS blobs (
+    root TEXT NOT NULL,
+    path TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    inode INTEGER NOT NULL,
+    sha TEXT NOT NULL,
+    PRIMARY KEY (root, path)
+)
+"""
+
+
+def _stat_key(entry_stat: os.stat_result) -> Tuple[int, int, int]:
+    return entry_stat.st_size, entry_stat.st_mtime_ns, entry_stat.st_ino
+
+
+class BlobHashCache:
+    """SQLite cache mapping file paths and stat data to git blob SHAs.
+
+    A cached SHA is reused as long as the size, modification time (in
+    nanoseconds) and inode of the file are unchanged, so that only modified
+    files are read and hashed again. A single database can hold the entries
+    of several scanned trees.
+
+    Parameters
+    ----------
+    path : str | Path
+        Path to the SQLite database. It is created if it does not exist.
+    root : str | Path
+        Root of the scanned tree. File paths are relative to it.
+
+    """
+
+    def __init__(self, path: str | Path, root: str | Path):
+        """Open (or create) the cache database and load the entries of the tree."""
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.root = str(Path(root).resolve())
+        self._connection = sqlite3.connect(self.path, timeout=LOCK_TIMEOUT)
+        self._connection.execute(_SCHEMA)
+        self._entries = {
+            path: (size, mtime_ns, inode, sha)
+            for path, size, mtime_ns, inode, sha in self._connection.execute(
+                "SELECT path, size, mtime_ns, inode, sha FROM blobs WHERE root = ?", (self.root,)
+            )
+        }
+        self._updates: Dict[str, Tuple[int, int, int, str]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, relative_path: str, entry_stat: os.stat_result) -> str | None:
+        """Get the cached SHA of a file, if its stat data did not change.
+
+        Parameters
+        ----------
+        relative_path : str
+            Path of the file, relative to the root of the scanned tree.
+        entry_stat : os.stat_result
+            Current stat data of the file.
+
+        Returns
+        -------
+        str | None
+            The cached SHA, or ``None`` if the file must be hashed.
+
+        """
+        cached = self._entries.get(relative_path)
+        if cached is not None and cached[:3] == _stat_key(entry_stat):
+            self.hits += 1
+            return cached[3]
+
+        self.misses += 1
+        return None
+
+    def put(self, relative_path: str, entry_stat: os.stat_result, sha: str):
+        """Record the SHA of a file.
+
+        Parameters
+        ----------
+        relative_path : str
+            Path of the file, relative to the root of the scanned tree.
+        entry_stat : os.stat_result
+            Stat data of the file when it was hashed.
+        sha : str
+            Blob SHA of the file.
+
+        """
+        if time.time_ns() - entry_stat.st_mtime_ns < RACY_WINDOW_NS:
+            return
+        entry = (*_stat_key(entry_stat), sha)
+        self._entries[relative_path] = entry
+        self._updates[relative_path] = entry
+
+    def prune(self, relative_paths: Iterable[str], manifest: ManifestMatcher | None = None):
+        """Forget the files of the scanned selection that are not part of it anymore.
+
+        Only the files accepted by ``manifest`` are considered: the entries of
+        the files selected by other manifests sharing the same root are kept,
+        without checking them on disk.
+
+        Parameters
+        ----------
+        relative_paths : Iterable[str]
+            Paths of the files found by the current scan of the tree.
+        manifest : ManifestMatcher, optional
+            Compiled manifest of the scan. By default, all files were scanned.
+
+        """
+        stale = {
+            path
+            for path in set(self._entries).difference(relative_paths)
+            if manifest is None or manifest.match(path.rpartition("/")[2])
+        }
+        for relative_path in stale:
+            del self._entries[relative_path]
+            self._updates.pop(relative_path, None)
+        if stale:
+            self._connection.executemany(
+                "DELETE FROM blobs WHERE root = ? AND path = ?",
+                ((self.root, path) for path in stale),
+            )
+
+    def save(self):
+        """Write the pending updates to the database."""
+        self._connection.executemany(
+            "INSERT OR REPLACE INTO blobs VALUES (?, ?, ?, ?, ?, ?)",
+            ((self.root, path, *entry) for path, entry in self._updates.items()),
+        )
+        self._connection.commit()
+        self._updates.clear()
+
+    def close(self):
+        """Save the pending updates and close the database."""
+        self.save()
+        self._connection.close()
+
+    def __enter__(self) -> "BlobHashCache":
+        """Use the cache as a context manager."""
+        return self
+
+    def __exit__(self, *args):
+        """Close the cache."""
+        self.close()
@@ -0,0 +1,405 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Module containing the git-compatible hashing of the source tree."""
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+import hashlib
+import multiprocessing
+import os
+from pathlib import Path
+import stat
+from typing import Dict, List, Set, Tuple
+
+from git import GitCommandError, Repo
+
+from .hash_cache import BlobHashCache
+from .manifest import ManifestMatcher
+from .metrics import count
+from .walker import iter_source_files
+
+BLOB_MODE = "100644"
+"""Git mode of regular files."""
+
+EXECUTABLE_MODE = "100755"
+"""Git mode of executable files."""
+
+TREE_MODE = "40000"
+"""Git mode of trees (directories)."""
+
+_CHUNK_SIZE = 1024 * 1024
+
+
+def hash_blob(path: str | Path, size: int | None = None) -> str:
+    """Compute the git blob SHA of a file, as ``git hash-object`` would.
+
+    Parameters
+    ----------
+    path : str | Path
+        Path to the file.
+    size : int, optional
+        Size of the file in bytes, if already known.
+
+    Returns
+    -------
+    str
+        Hexadecimal SHA-1 of the blob.
+
+    """
+    path = Path(path)
+    size = path.stat().st_size if size is None else size
+    sha = hashlib.sha1(f"blob {size}\0".encode(), usedforsecurity=False)
+    with path.open("rb") as file:
+        while chunk := file.read(_CHUNK_SIZE):
+            sha.update(chunk)
+    return sha.hexdigest()
+
+
+def hash_blobs(files: List[Tuple[str, int]], workers: int | None = None) -> List[str]:
+    """Compute the git blob SHA of several files, optionally in a process pool.
+
+    Parameters
+    ----------
+    files : List[Tuple[str, int]]
+        Path and size of each file.
+    workers : int, optional
+        Number of worker processes. By default, or if it is ``1``, files are
+        hashed in the current process.
+
+    Returns
+    -------
+    List[str]
+        Blob SHAs, in the same order as ``files``.
+
+    Notes
+    -----
+    The source tree is scanned while other threads access the remote
+    repository, so the workers are never forked: forking a multi-threaded
+    process can deadlock on locks held by the other threads. They are started
+    by a fork server where available, and spawned otherwise.
+
+    """
+    if not workers or workers <= 1 or len(files) < 2:
+        return [hash_blob(path, size) for path, size in files]
+
+    paths, sizes = zip(*files)
+    start_method = (
+        "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    )
+    context = multiprocessing.get_context(start_method)
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+        return list(executor.map(hash_blob, paths, sizes, chunksize=64))
+
+
+def hash_tree(entries: Dict[str, tuple[str, str]]) -> str:
+    """Compute the git tree SHA of a directory from its entries.
+
+    Parameters
+    ----------
+    entries : Dict[str, tuple[str, str]]
+        Mapping of entry names to their git mode and hexadecimal SHA.
+
+    Returns
+    -------
+    str
+        Hexadecimal SHA-1 of the tree.
+
+    """
+
+    # Git sorts tree entries as if directory names had a trailing slash
+    def _sort_key(name: str) -> bytes:
+        return name.encode() + (b"/" if entries[name][0] == TREE_MODE else b"")
+
+    content = b"".join(
+        f"{entries[name][0]} {name}\0".encode() + bytes.fromhex(entries[name][1])
+        for name in sorted(entries, key=_sort_key)
+    )
+    return hashlib.sha1(
+        f"tree {len(content)}\0".encode() + content, usedforsecurity=False
+    ).hexdigest()
+
+
+def file_mode(st_mode: int) -> str:
+    """Git mode of a file given its ``st_mode``."""
+    if os.name != "nt" and st_mode & stat.S_IXUSR:
+        return EXECUTABLE_MODE
+    return BLOB_MODE
+
+
+@dataclass
+class SourceTree:
+    """Git objects of a manifest-filtered directory, computed as git would.
+
+    Directories without any accepted file are left out, since git does not
+    track empty directories.
+    """
+
+    files: Dict[str, tuple[str, str]] = field(default_factory=dict)
+    """Mapping of file paths (relative, with ``/`` separators) to their git mode and blob SHA."""
+
+    trees: Dict[str, str] = field(default_factory=dict)
+    """Mapping of directory paths (relative, with ``/`` separators) to their tree SHA.
+
+    The root directory is stored under the empty path.
+    """
+
+    @property
+    def sha(self) -> str:
+        """Tree SHA of the root directory."""
+        return self.trees[""]
+
+    @classmethod
+    def scan(
+        cls,
+        root: str | Path,
+        manifest: ManifestMatcher | None = None,
+        cache: BlobHashCache | None = None,
+        workers: int | None = None,
+    ) -> "SourceTree":
+        """Hash the files accepted by the manifest and build the tree objects.
+
+        Parameters
+        ----------
+        root : str | Path
+            Directory to hash.
+        manifest : ManifestMatcher, optional
+            Compiled manifest selecting the files. By default, all files are hashed.
+        cache : BlobHashCache, optional
+            Cache of blob SHAs. Only the files whose stat data changed since they
+            were cached are hashed. The cache is updated and saved.
+        workers : int, optional
+            Number of processes used to hash the files. By default, files are
+            hashed in the current process.
+
+        Returns
+        -------
+        SourceTree
+            Git objects of the directory.
+
+        """
+        files = {}
+        misses = []
+        for relative_path, entry in iter_source_files(root, manifest):
+            entry_stat = entry.stat()
+            sha = cache.get(relative_path, entry_stat) if cache is not None else None
+            if sha is None:
+                misses.append((relative_path, entry.path, entry_stat))
+            files[relative_path] = (file_mode(entry_stat.st_mode), sha)
+
+        shas = hash_blobs([(path, entry_stat.st_size) for _, path, entry_stat in misses], workers)
+        for (relative_path, _, entry_stat), sha in zip(misses, shas):
+            files[relative_path] = (files[relative_path][0], sha)
+            if cache is not None:
+                cache.put(relative_path, entry_stat, sha)
+
+        if cache is not None:
+            cache.prune(files, manifest)
+            cache.save()
+
+        count("files_scanned", len(files))
+        count("files_hashed", len(misses))
+        return cls.from_files(files)
+
+    @classmethod
+    def from_files(cls, files: Dict[str, tuple[str, str]]) -> "SourceTree":
+        """Build the tree objects from the mode and blob SHA of each file.
+
+        Parameters
+        ----------
+        files : Dict[str, tuple[str, str]]
+            Mapping of file paths (relative, with ``/`` separators) to their
+            git mode and blob SHA.
+
+        Returns
+        -------
+        SourceTree
+            Git objects of the directory.
+
+        """
+        # Entries of each directory, the root directory being the empty path
+        directories: Dict[str, Dict[str, tuple[str, str]]] = {"": {}}
+        for relative_path, mode_and_sha in files.items():
+            parent, _, name = relative_path.rpartition("/")
+            ancestor = parent
+            while ancestor not in directories:
+                directories[ancestor] = {}
+                ancestor = ancestor.rpartition("/")[0]
+            directories[parent][name] = mode_and_sha
+
+        # Hash the deepest directories first, then register them in their parent
+        trees = {}
+        for directory in sorted(directories, key=lambda path: path.count("/"), reverse=True):
+            if directory == "":
+                continue
+            trees[directory] = hash_tree(directories[directory])
+            parent, _, name = directory.rpartition("/")
+            directories[parent][name] = (TREE_MODE, trees[directory])
+        trees[""] = hash_tree(directories[""])
+
+        return cls(files=files, trees=trees)
+
+    def select(self, manifest: ManifestMatcher) -> "SourceTree":
+        """Build the tree of the files accepted by another manifest.
+
+        No file is hashed again, which allows scanning a directory once for
+        several manifests.
+
+        Parameters
+        ----------
+        manifest : ManifestMatcher
+            Compiled manifest selecting the files.
+
+        Returns
+        -------
+        SourceTree
+            Git objects of the selected files.
+
+        """
+        return self.from_files(
+            {
+                relative_path: mode_and_sha
+                for relative_path, mode_and_sha in self.files.items()
+                if manifest.match(relative_path.rpartition("/")[2])
+            }
+        )
+
+    def unchanged_paths(self, target: Dict[str, Tuple[str, str]]) -> Set[str]:
+        """Find the files and directories whose git object already exists in the target.
+
+        Parameters
+        ----------
+        target : Dict[str, Tuple[str, str]]
+            Mapping of paths to the mode and SHA of their git object in the target,
+            as returned by :func:`read_tree`.
+
+        Returns
+        -------
+        Set[str]
+            Paths of the files and directories (the root one being the empty
+            path) that are identical in the target. Files whose mode differs
+            (such as the executable bit) are not identical.
+
+        """
+        unchanged = {
+            path for path, mode_and_sha in self.files.items() if target.get(path) == mode_and_sha
+        }
+        unchanged.update(
+            path for path, sha in self.trees.items() if path in target and target[path][1] == sha
+        )
+        return unchanged
+
+    def stale_paths(
+        self, target: Dict[str, Tuple[str, str]], manifest: ManifestMatcher | None = None
+    ) -> List[str]:
+        """Find the files of the target that are not part of this tree.
+
+        Parameters
+        ----------
+        target : Dict[str, Tuple[str, str]]
+            Mapping of paths to the mode and SHA of their git object in the target,
+            as returned by :func:`read_tree`.
+        manifest : ManifestMatcher, optional
+            Compiled manifest restricting the stale files to those it matches.
+            By default, all the files missing from this tree are stale.
+
+        Returns
+        -------
+        List[str]
+            Sorted paths of the files of the target to delete.
+
+        """
+        # Directories are the parents of the other paths
+        directories = {path.rpartition("/")[0] for path in target}
+        return sorted(
+            path
+            for path in target
+            if path
+            and path not in directories
+            and path not in self.files
+            and (manifest is None or manifest.match(path.rpartition("/")[2]))
+        )
+
+    def is_up_to_date(self, target: Dict[str, Tuple[str, str]], clean_to_dir: bool) -> bool:
+        """Check whether synchronizing into the target would not change anything.
+
+        Both the content and the mode of the files are compared.
+
+        Parameters
+        ----------
+        target : Dict[str, Tuple[str, str]]
+            Mapping of paths to the mode and SHA of their git object in the target,
+            as returned by :func:`read_tree`.
+        clean_to_dir : bool
+            Whether the target directory is cleaned before synchronizing. When it
+            is not, extra files in the target do not matter.
+
+        Returns
+        -------
+        bool
+            Whether the target already contains the files of this tree.
+
+        """
+        if "" in target and target[""][1] == self.sha:
+            return True
+        if clean_to_dir:
+            return False
+        return all(target.get(path) == mode_and_sha for path, mode_and_sha in self.files.items())
+
+
+def read_tree(repo: Repo, treeish: str, path: str = "") -> Dict[str, Tuple[str, str]]:
+    """Read the mode and SHA of all git objects below a directory of a commit.
+
+    Only tree objects are read, so this works in blob-less partial clones.
+
+    Parameters
+    ----------
+    repo : Repo
+        Repository to read from.
+    treeish : str
+        Commit, branch or tree to read.
+    path : str, optional
+        Directory of interest (w.r.t. the root of the repository, with ``/``
+        separators), by default the root of the repository.
+
+    Returns
+    -------
+    Dict[str, Tuple[str, str]]
+        Mapping of paths relative to ``path`` (the directory itself being the
+        empty path) to the mode and SHA of their git object, with modes as
+        printed by ``git ls-tree`` (``040000`` for trees). Empty if the
+        directory does not exist.
+
+    """
+    spec = f"{treeish}:{path}"
+    try:
+        objects = {"": ("040000", repo.git.rev_parse("--verify", "--quiet", spec))}
+        output = repo.git.ls_tree("-r", "-t", "-z", spec)
+    except GitCommandError:
+        # The directory does not exist (or is not a directory)
+        return {}
+
+    for record in filter(None, output.split("\0")):
+        info, relative_path = record.split("\t", 1)
+        mode, _, sha = info.split()
+        objects[relative_path] = (mode, sha)
+    return objects
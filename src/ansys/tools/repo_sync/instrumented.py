@@ -0,0 +1,46 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Module containing the GitPython classes counting the git subprocesses they spawn.
+
+The subprocesses are counted by the collector activated for the current
+context, see :mod:`ansys.tools.repo_sync.metrics`.
+"""
+
+from git import Git, Repo
+
+from .metrics import count
+
+
+class CountingGit(Git):
+    """Git command wrapper counting the subprocesses it spawns."""
+
+    def execute(self, *args, **kwargs):
+        """Run a git command, counting it as a spawned subprocess."""
+        count("git_subprocesses")
+        return super().execute(*args, **kwargs)
+
+
+class InstrumentedRepo(Repo):
+    """Repository whose git commands are counted by the active collector."""
+
+    GitCommandWrapperType = CountingGit
@@ -0,0 +1,107 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Module containing the compiled form of the include manifest."""
+
+import fnmatch
+import os
+from pathlib import Path
+import re
+from typing import Iterable, List
+
+_GLOB_CHARACTERS = re.compile(r"[*?\[]")
+
+
+class ManifestMatcher:
+    """Include manifest compiled into a single matcher.
+
+    Each manifest line is a glob-style pattern (see :mod:`fnmatch`) matched
+    against file names. Plain extension rules such as ``*.py`` are looked up
+    in a suffix index, while all other rules are combined into one compiled
+    regular expression. Blank lines are ignored.
+
+    Parameters
+    ----------
+    patterns : Iterable[str]
+        Patterns of the manifest, one per line.
+
+    """
+
+    def __init__(self, patterns: Iterable[str]):
+        """Compile the manifest patterns."""
+        self.patterns: List[str] = [pattern.strip() for pattern in patterns if pattern.strip()]
+
+        self._extensions = set()
+        regexes = []
+        for pattern in self.patterns:
+            pattern = os.path.normcase(pattern)
+            if pattern.startswith("*.") and not _GLOB_CHARACTERS.search(pattern[1:]):
+                self._extensions.add(pattern[1:])
+            else:
+                regexes.append(fnmatch.translate(pattern))
+
+        self._regex = re.compile("|".join(regexes)) if regexes else None
+
+    @classmethod
+    def from_file(cls, path: str | Path) -> "ManifestMatcher":
+        """Read and compile a manifest file.
+
+        Parameters
+        ----------
+        path : str | Path
+            Path to the manifest file.
+
+        Returns
+        -------
+        ManifestMatcher
+            The compiled manifest.
+
+        """
+        return cls(Path(path).read_text().splitlines())
+
+    def match(self, name: str) -> bool:
+        """Check whether a file name is accepted by the manifest.
+
+        Parameters
+        ----------
+        name : str
+            Name of the file (without its parent directories).
+
+        Returns
+        -------
+        bool
+            Whether at least one manifest pattern matches the name.
+
+        """
+        name = os.path.normcase(name)
+        if self._extensions:
+            index = name.find(".")
+            while index != -1:
+                if name[index:] in self._extensions:
+                    return True
+                index = name.find(".", index + 1)
+
+        return self._regex is not None and self._regex.match(name) is not None
+
+    def __repr__(self) -> str:
+        """Represent the matcher with its patterns."""
+        return f"{type(self).__name__}({self.patterns!r})"
@@ -0,0 +1,134 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Module containing the mappings between local folders and folders of the repository."""
+
+from dataclasses import dataclass
+from itertools import combinations
+from pathlib import Path
+import tomllib
+from typing import List
+
+from .clone import normalize_repository_path
+
+
+@dataclass
+class SyncMapping:
+    """Local folder synchronized to a folder of the repository."""
+
+    from_dir: str | Path
+    """Directory from which files are synced."""
+
+    to_dir: str | Path
+    """Directory to which files are synced (w.r.t. the root of the repository)."""
+
+    include_manifest: str | Path
+    """Manifest selecting the files to sync."""
+
+    clean_to_dir: bool = False
+    """Whether to delete the files of ``to_dir`` that are not synced."""
+
+    clean_to_dir_based_on_manifest: bool = False
+    """Whether to restrict the cleanup to the files matching the manifest."""
+
+
+def check_mappings(mappings: List[SyncMapping]):
+    """Check that mappings can be applied together.
+
+    Several mappings may target the same folder, as long as none of them
+    cleans it, since the cleanup would remove the files of the other mappings.
+
+    Parameters
+    ----------
+    mappings : List[SyncMapping]
+        Mappings applied in a single commit.
+
+    Raises
+    ------
+    ValueError
+        If there are no mappings, or if the folder cleaned by a mapping
+        contains the folder of another mapping.
+
+    """
+    if not mappings:
+        raise ValueError("No folder to synchronize.")
+
+    for first, second in combinations(mappings, 2):
+        first_dir = normalize_repository_path(first.to_dir)
+        second_dir = normalize_repository_path(second.to_dir)
+        if (first.clean_to_dir and _contains(first_dir, second_dir)) or (
+            second.clean_to_dir and _contains(second_dir, first_dir)
+        ):
+            raise ValueError(
+                f"Folders '{first.to_dir}' and '{second.to_dir}' overlap and one of them is"
+                " cleaned: the cleanup would remove the files of the other mapping."
+            )
+
+
+def _contains(parent: str, path: str) -> bool:
+    """Whether a normalized repository path is inside another one."""
+    return not parent or path == parent or path.startswith(f"{parent}/")
+
+
+def load_mappings(config_path: str | Path) -> List[SyncMapping]:
+    """Read the mappings listed in a TOML configuration file.
+
+    Each mapping is a ``[[mappings]]`` table with the ``from_dir``, ``to_dir``
+    and ``manifest`` keys, and optionally the ``clean_to_dir`` and
+    ``clean_to_dir_based_on_manifest`` booleans. Relative ``from_dir`` and
+    ``manifest`` paths are resolved against the directory of the configuration
+    file.
+
+    Parameters
+    ----------
+    config_path : str | Path
+        Path to the configuration file.
+
+    Returns
+    -------
+    List[SyncMapping]
+        Mappings in the order of the configuration file.
+
+    """
+    config_path = Path(config_path)
+    with config_path.open("rb") as config_file:
+        config = tomllib.load(config_file)
+
+    mappings = []
+    for index, entry in enumerate(config.get("mappings", [])):
+        missing = [key for key in ("from_dir", "to_dir", "manifest") if key not in entry]
+        if missing:
+            raise ValueError(
+                f"Mapping #{index + 1} of {config_path} is missing: {', '.join(missing)}."
+            )
+        mappings.append(
+            SyncMapping(
+                from_dir=config_path.parent / entry["from_dir"],
+                to_dir=entry["to_dir"],
+                include_manifest=config_path.parent / entry["manifest"],
+                clean_to_dir=entry.get("clean_to_dir", False),
+                clean_to_dir_based_on_manifest=entry.get("clean_to_dir_based_on_manifest", False),
+            )
+        )
+
+    check_mappings(mappings)
+    return mappings
@@ -0,0 +1,339 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Module containing the instrumentation of the synchronizations.
+
+A :class:`Metrics` collector records timed spans for each phase, counters
+(files scanned, copied, deleted..., git subprocesses spawned, GitHub API
+calls) and the peak resident memory of the process.
+
+Instrumented code does not receive the collector: it calls :func:`span` and
+:func:`count`, which record into the collector activated for the current
+context, and do nothing otherwise.
+"""
+
+from concurrent.futures import Executor, Future
+from contextlib import contextmanager
+from contextvars import ContextVar, copy_context
+from dataclasses import dataclass
+import json
+from pathlib import Path
+import sys
+import threading
+import time
+from typing import Callable, Dict, Iterator, List, Tuple
+
+METRICS_FORMATS = ("json", "openmetrics")
+"""Available formats of the metrics files."""
+
+_active: ContextVar["Metrics | None"] = ContextVar("repo_sync_metrics", default=None)
+
+
+@dataclass
+class Span:
+    """Timed phase of a synchronization."""
+
+    name: str
+    """Name of the phase."""
+
+    start: float
+    """Start of the phase, in seconds since the collector was created."""
+
+    duration: float
+    """Duration of the phase, in seconds."""
+
+
+class Metrics:
+    """Collector of the spans and counters of a synchronization.
+
+    A collector is thread-safe, so that concurrent stages can record into it.
+    """
+
+    def __init__(self):
+        """Initialize an empty collector."""
+        self.spans: List[Span] = []
+        self.counters: Dict[str, int] = {}
+        self.peak_rss_bytes: int | None = None
+        self._origin = time.perf_counter()
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> dict:
+        """Drop the lock, so that collectors can be sent to other processes."""
+        return {name: value for name, value in self.__dict__.items() if name != "_lock"}
+
+    def __setstate__(self, state: dict):
+        """Restore a collector received from another process."""
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def span(self, name: str) -> Iterator[None]:
+        """Time a phase.
+
+        Parameters
+        ----------
+        name : str
+            Name of the phase.
+
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            with self._lock:
+                self.spans.append(Span(name, start - self._origin, end - start))
+
+    def count(self, name: str, value: int = 1):
+        """Increment a counter.
+
+        Parameters
+        ----------
+        name : str
+            Name of the counter.
+        value : int, optional
+            Increment, by default 1.
+
+        """
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    @contextmanager
+    def activate(self) -> Iterator["Metrics"]:
+        """Record the spans and counters of the current context into this collector.
+
+        The peak resident memory of the process is captured on exit.
+        """
+        token = _active.set(self)
+        try:
+            yield self
+        finally:
+            _active.reset(token)
+            self.peak_rss_bytes = peak_rss_bytes()
+
+    def durations(self) -> Dict[str, float]:
+        """Total duration of each phase, in seconds."""
+        totals: Dict[str, float] = {}
+        for recorded_span in self.spans:
+            totals[recorded_span.name] = (
+                totals.get(recorded_span.name, 0.0) + recorded_span.duration
+            )
+        return totals
+
+    def as_dict(self) -> dict:
+        """Return the collected data as JSON-serializable objects."""
+        return {
+            "spans": [
+                {"name": s.name, "start": round(s.start, 6), "duration": round(s.duration, 6)}
+                for s in sorted(self.spans, key=lambda s: s.start)
+            ],
+            "counters": dict(sorted(self.counters.items())),
+            "peak_rss_bytes": self.peak_rss_bytes,
+        }
+
+
+def peak_rss_bytes() -> int | None:
+    """Return the peak resident memory of the process, in bytes.
+
+    Returns
+    -------
+    int | None
+        Peak resident set size, or ``None`` on platforms without ``getrusage``.
+
+    """
+    # On Linux, ``ru_maxrss`` survives ``exec`` and may be the peak of the parent
+    # process: the high water mark of the current address space is used instead
+    status = Path("/proc/self/status")
+    if status.exists():
+        for line in status.read_text().splitlines():
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1]) * 1024
+
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Reported in bytes on macOS, in kilobytes elsewhere
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+@contextmanager
+def span(name: str) -> Iterator[None]:
+    """Time a phase in the active collector, if any.
+
+    Parameters
+    ----------
+    name : str
+        Name of the phase.
+
+    """
+    metrics = _active.get()
+    if metrics is None:
+        yield
+    else:
+        with metrics.span(name):
+            yield
+
+
+def count(name: str, value: int = 1):
+    """Increment a counter of the active collector, if any.
+
+    Parameters
+    ----------
+    name : str
+        Name of the counter.
+    value : int, optional
+        Increment, by default 1.
+
+    """
+    metrics = _active.get()
+    if metrics is not None:
+        metrics.count(name, value)
+
+
+def submit(executor: Executor, function: Callable, *args) -> Future:
+    """Submit a call to an executor, keeping the active collector in the worker thread.
+
+    Parameters
+    ----------
+    executor : Executor
+        Thread pool running the call.
+    function : Callable
+        Function to call.
+    *args
+        Arguments of the function.
+
+    Returns
+    -------
+    Future
+        Result of the call.
+
+    """
+    return executor.submit(copy_context().run, function, *args)
+
+
+def format_json(runs: List[Tuple[Dict[str, str], Metrics]]) -> str:
+    """Format the metrics of synchronizations as JSON.
+
+    Parameters
+    ----------
+    runs : List[Tuple[Dict[str, str], Metrics]]
+        Labels identifying each synchronization (such as the repository), and
+        its metrics.
+
+    Returns
+    -------
+    str
+        JSON document with one entry per synchronization.
+
+    """
+    return json.dumps(
+        {"runs": [{"labels": labels, **metrics.as_dict()} for labels, metrics in runs]},
+        indent=2,
+    )
+
+
+def _openmetrics_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    escaped = {
+        name: value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        for name, value in labels.items()
+    }
+    return "{" + ",".join(f'{name}="{value}"' for name, value in escaped.items()) + "}"
+
+
+def format_openmetrics(runs: List[Tuple[Dict[str, str], Metrics]]) -> str:
+    """Format the metrics of synchronizations in the OpenMetrics text format.
+
+    Phase durations are exposed as a gauge labelled by phase, counters as
+    ``repo_sync_<name>_total`` counters, and the peak memory as a gauge.
+
+    Parameters
+    ----------
+    runs : List[Tuple[Dict[str, str], Metrics]]
+        Labels identifying each synchronization (such as the repository), and
+        its metrics.
+
+    Returns
+    -------
+    str
+        OpenMetrics exposition, terminated by ``# EOF``.
+
+    """
+    lines = [
+        "# TYPE repo_sync_phase_duration_seconds gauge",
+        "# UNIT repo_sync_phase_duration_seconds seconds",
+        "# HELP repo_sync_phase_duration_seconds Time spent in each phase of the synchronization.",
+    ]
+    for labels, metrics in runs:
+        for phase, duration in metrics.durations().items():
+            phase_labels = _openmetrics_labels({**labels, "phase": phase})
+            lines.append(f"repo_sync_phase_duration_seconds{phase_labels} {duration:.6f}")
+
+    counter_names = sorted({name for _, metrics in runs for name in metrics.counters})
+    for name in counter_names:
+        lines.append(f"# TYPE repo_sync_{name} counter")
+        for labels, metrics in runs:
+            if name in metrics.counters:
+                value = metrics.counters[name]
+                lines.append(f"repo_sync_{name}_total{_openmetrics_labels(labels)} {value}")
+
+    lines.extend(
+        [
+            "# TYPE repo_sync_peak_rss_bytes gauge",
+            "# UNIT repo_sync_peak_rss_bytes bytes",
+        ]
+    )
+    for labels, metrics in runs:
+        if metrics.peak_rss_bytes is not None:
+            rss_labels = _openmetrics_labels(labels)
+            lines.append(f"repo_sync_peak_rss_bytes{rss_labels} {metrics.peak_rss_bytes}")
+
+    lines.append("# EOF")
+    return "\n".join(lines) + "\n"
+
+
+def write_metrics(
+    path: str | Path, runs: List[Tuple[Dict[str, str], Metrics]], metrics_format: str = "json"
+):
+    """Write the metrics of synchronizations to a file.
+
+    Parameters
+    ----------
+    path : str | Path
+        Path to the file.
+    runs : List[Tuple[Dict[str, str], Metrics]]
+        Labels identifying each synchronization (such as the repository), and
+        its metrics.
+    metrics_format : str, optional
+        One of :data:`METRICS_FORMATS`, by default ``"json"``.
+
+    """
+    if metrics_format not in METRICS_FORMATS:
+        raise ValueError(
+            f"Unknown metrics format '{metrics_format}'. Available formats: {METRICS_FORMATS}."
+        )
+    formatter = format_json if metrics_format == "json" else format_openmetrics
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    Path(path).write_text(formatter(runs))
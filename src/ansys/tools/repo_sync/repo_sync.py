@@ -22,17 +22,41 @@
 
 """Module containing the sync tool implementation."""
 
-from fnmatch import filter
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import ExitStack, nullcontext
+import os
 from pathlib import Path
-import re
 import shutil
 import tempfile
-from typing import List, Union
+from typing import Callable, Dict, Iterable, List, Tuple, Union
 
-from git import Repo
-from github import Auth, Github, GithubException
+from git import Commit, GitCommandError, Repo
+from github import Github, GithubException
+from github.PullRequest import PullRequest
+from github.Repository import Repository
 
-from .constants import DEFAULT_BRANCH_NAME, DEFAULT_PULL_REQUEST_TITLE
+from .cache import MirrorCache
+from .changes import ChangeReport, ChangeSet
+from .client import create_client
+from .clone import clone_repository, normalize_repository_path
+from .constants import DEFAULT_API_WORKERS, DEFAULT_BRANCH_NAME, DEFAULT_PULL_REQUEST_TITLE
+from .copier import copy_tree
+from .fast_import import commit_with_fast_import, list_tree
+from .github_api import (
+    DirectoryChanges,
+    TreeElement,
+    commit_tree_changes,
+    list_remote_tree,
+    plan_tree_changes,
+    remote_tree_is_up_to_date,
+    update_branch,
+)
+from .hash_cache import BlobHashCache
+from .hashing import SourceTree, read_tree
+from .instrumented import InstrumentedRepo
+from .manifest import ManifestMatcher
+from .mapping import SyncMapping, check_mappings
+from .metrics import Metrics, count, span, submit
 
 
 def include_patterns(*patterns):
@@ -47,12 +71,12 @@ def include_patterns(*patterns):
     in the file hierarchy rooted at the source directory when used with
     shutil.copytree().
     """
+    matcher = ManifestMatcher(patterns)
 
     def _ignore_patterns(path, names):
-        keep = set(name for pattern in patterns for name in filter(names, pattern))
-        # Ignore names that are not present in the "keep" set and are not directories
+        # Ignore names that are not matched by the manifest and are not directories
         ignore = set(
-            name for name in names if name not in keep and not (Path(path) / name).is_dir()
+            name for name in names if not matcher.match(name) and not (Path(path) / name).is_dir()
         )
         return ignore
 
@@ -62,6 +86,10 @@ def include_patterns(*patterns):
 def adapt_regex_from_manifest(accepted_extensions: List[str]) -> List[str]:
     """Adapt regex expressions from manifest read.
 
+    The synchronization now relies on :class:`ManifestMatcher`, which interprets
+    the manifest with the same glob semantics in the copy and clean phases. This
+    function is kept for backward compatibility.
+
     Parameters
     ----------
     accepted_extensions : List[str]
@@ -84,18 +112,23 @@ def adapt_regex_from_manifest(accepted_extensions: List[str]) -> List[str]:
 
 
 def delete_folder_contents(
-    folder_path: str | Path, accepted_extensions: List[str], clean_to_dir_based_on_manifest: bool
+    folder_path: str | Path,
+    accepted_extensions: List[str] | ManifestMatcher,
+    clean_to_dir_based_on_manifest: bool,
 ):
     """Delete the content inside a folder without deleting the folder itself.
 
+    Kept for backward compatibility: synchronizations only delete the files that
+    are not part of the source anymore, with :func:`delete_stale_files`.
+
     Parameters
     ----------
     folder_path : str | Path
         Path to the folder whose content is requested to be deleted.
-    accepted_extensions : List[str]
-        List of accepted extensions coming from manifest file.
+    accepted_extensions : List[str] | ManifestMatcher
+        List of accepted patterns coming from manifest file, or compiled manifest.
     clean_to_dir_based_on_manifest : bool
-        Whether to perform the cleanup of files that match the regex
+        Whether to perform the cleanup of files that match the patterns
         in the manifest.
 
     """
@@ -107,22 +140,25 @@ def delete_folder_contents(
         )
         return
 
+    matcher = (
+        accepted_extensions
+        if isinstance(accepted_extensions, ManifestMatcher)
+        else ManifestMatcher(accepted_extensions)
+    )
+
     try:
         # List all files and directories in the folder
         for item_path in folder.iterdir():
             if item_path.is_file():
-                if not clean_to_dir_based_on_manifest or any(
-                    re.match(entry, item_path.name) is not None for entry in accepted_extensions
-                ):
+                if not clean_to_dir_based_on_manifest or matcher.match(item_path.name):
                     # Clean all files if clean_to_dir_based_on_manifest is False,
-                    #  otherwise only the ones matching the manifest regex
+                    #  otherwise only the ones matching the manifest
                     item_path.unlink()
+                    count("files_deleted")
 
             elif item_path.is_dir():
                 # If it's a directory, use recursive call to delete its contents
-                delete_folder_contents(
-                    item_path, accepted_extensions, clean_to_dir_based_on_manifest
-                )
+                delete_folder_contents(item_path, matcher, clean_to_dir_based_on_manifest)
                 # After the contents are deleted, remove the directory if it is empty
                 # or if manifest-based filtering is off
                 if not clean_to_dir_based_on_manifest or not any(item_path.iterdir()):
@@ -132,13 +168,510 @@ def delete_folder_contents(
         print(f"An error occurred: {str(e)} - process will continue.")
 
 
+def delete_stale_files(folder_path: str | Path, stale_paths: Iterable[str]) -> int:
+    """Delete some files of a folder, and the directories they leave empty.
+
+    Unlike :func:`delete_folder_contents`, the other files are neither walked
+    nor deleted, so that the files still present in the source are left
+    untouched instead of being deleted and written again.
+
+    Parameters
+    ----------
+    folder_path : str | Path
+        Path to the folder containing the files.
+    stale_paths : Iterable[str]
+        Paths of the files to delete, relative to the folder (with ``/`` separators),
+        as returned by :meth:`ansys.tools.repo_sync.hashing.SourceTree.stale_paths`.
+
+    Returns
+    -------
+    int
+        Number of deleted files.
+
+    """
+    folder = Path(folder_path)
+    deleted = 0
+    parents = set()
+    for relative_path in stale_paths:
+        path = folder / relative_path
+        try:
+            if path.is_dir() and not path.is_symlink():
+                # Submodules are directories in the working tree
+                shutil.rmtree(path)
+            else:
+                path.unlink()
+        except FileNotFoundError:
+            continue
+        except OSError as e:  # pragma: no cover
+            print(f"An error occurred: {str(e)} - process will continue.")
+            continue
+        deleted += 1
+        count("files_deleted")
+        parents.update(path.relative_to(folder).parents)
+
+    # Remove the directories left empty, deepest first
+    for parent in sorted(parents, key=lambda parent: len(parent.parts), reverse=True):
+        if parent.parts:
+            try:
+                (folder / parent).rmdir()
+            except OSError:
+                # Not empty
+                pass
+
+    return deleted
+
+
+def stage_paths(repo: Repo, paths: Iterable[str]) -> int:
+    """Update the index of a repository for some paths only.
+
+    Unlike ``git add --all``, the rest of the working tree is neither walked nor
+    stat'ed, so that staging scales with the number of changes instead of the
+    size of the repository. Like ``git add``, files ignored by git are not added.
+
+    Parameters
+    ----------
+    repo : Repo
+        Repository whose index is updated.
+    paths : Iterable[str]
+        Paths relative to the root of the repository (with ``/`` separators) of the
+        files written or deleted in the working tree.
+
+    Returns
+    -------
+    int
+        Number of paths staged.
+
+    """
+    paths = sorted(set(paths))
+    if not paths:
+        return 0
+
+    with tempfile.TemporaryFile() as listing:
+        listing.write(b"".join(os.fsencode(path) + b"\0" for path in paths))
+
+        # Tracked files are never reported as ignored. The exit code is 1 if no
+        # path is ignored.
+        listing.seek(0)
+        ignored = set(
+            repo.git.check_ignore("-z", "--stdin", istream=listing, with_exceptions=False)
+            .rstrip("\0")
+            .split("\0")
+        )
+        if ignored - {""}:
+            paths = [path for path in paths if path not in ignored]
+            listing.seek(0)
+            listing.truncate()
+            listing.write(b"".join(os.fsencode(path) + b"\0" for path in paths))
+
+        # Deleted paths are removed from the index, and files replacing folders
+        # (or the reverse) replace the conflicting entries
+        listing.seek(0)
+        repo.git.update_index("--add", "--remove", "--replace", "-z", "--stdin", istream=listing)
+
+    return len(paths)
+
+
+def commit_index(repo: Repo, message: str) -> Commit:
+    """Commit the index of a repository on top of its current branch.
+
+    The tree is written by git from the cached trees of the index, instead of
+    being rebuilt from every index entry in Python by ``repo.index.commit()``.
+
+    Parameters
+    ----------
+    repo : Repo
+        Repository whose index is committed.
+    message : str
+        Commit message.
+
+    Returns
+    -------
+    Commit
+        New commit, the current branch points to.
+
+    """
+    tree = repo.tree(repo.git.write_tree())
+    return Commit.create_from_tree(
+        repo, tree, message, parent_commits=[repo.head.commit], head=True
+    )
+
+
+def scan_source_tree(
+    from_dir: str | Path,
+    manifest: ManifestMatcher,
+    hash_cache: str | Path | None = None,
+    hash_workers: int | None = None,
+) -> SourceTree:
+    """Hash the files to sync.
+
+    Parameters
+    ----------
+    from_dir : str | Path
+        Directory from which files want to be synced.
+    manifest : ManifestMatcher
+        Compiled manifest selecting the files.
+    hash_cache : str | Path, optional
+        Path to a persistent cache of the git hashes of the files in ``from_dir``.
+    hash_workers : int, optional
+        Number of processes used to hash the files in ``from_dir``.
+
+    Returns
+    -------
+    SourceTree
+        Git objects of the files to sync.
+
+    """
+    print(f">>> Hashing desired files from {from_dir} ...")
+    with span("hash"):
+        if hash_cache is None:
+            return SourceTree.scan(from_dir, manifest, workers=hash_workers)
+
+        with BlobHashCache(hash_cache, from_dir) as blob_cache:
+            source_tree = SourceTree.scan(from_dir, manifest, blob_cache, hash_workers)
+            print(f">>> Hashes reused from cache: {blob_cache.hits}/{len(source_tree.files)}.")
+        return source_tree
+
+
+def _prepare_sources(
+    mappings: List[SyncMapping],
+    first_tree: SourceTree | None = None,
+    hash_cache: str | Path | None = None,
+    hash_workers: int | None = None,
+) -> List[Tuple[SyncMapping, ManifestMatcher, SourceTree]]:
+    """Compile the manifest and hash the files of each mapping.
+
+    Parameters
+    ----------
+    mappings : List[SyncMapping]
+        Folders to synchronize.
+    first_tree : SourceTree, optional
+        Already computed tree of the first mapping.
+    hash_cache : str | Path, optional
+        Path to a persistent cache of the git hashes of the files.
+    hash_workers : int, optional
+        Number of processes used to hash the files.
+
+    Returns
+    -------
+    List[Tuple[SyncMapping, ManifestMatcher, SourceTree]]
+        Each mapping, with its compiled manifest and the git objects of its files.
+
+    """
+    sources = []
+    for index, mapping in enumerate(mappings):
+        # Compile accepted patterns from manifest
+        include_manifest_path = Path(mapping.include_manifest)
+        print(f">>> Considering manifest file at {include_manifest_path} ...")
+        manifest = ManifestMatcher.from_file(include_manifest_path)
+
+        # Compute the git objects of the files to sync, to compare them with the repository
+        if index == 0 and first_tree is not None:
+            mapping_tree = first_tree
+        else:
+            mapping_tree = scan_source_tree(mapping.from_dir, manifest, hash_cache, hash_workers)
+        sources.append((mapping, manifest, mapping_tree))
+    return sources
+
+
+def _remote_branch_tree(
+    pygithub_repo: Repository, branch: str, repo: Repo | None = None
+) -> str | None:
+    """Read the SHA of the tree of a remote branch.
+
+    With a local clone, the branch is resolved with ``git ls-remote``, and its
+    commit is read locally if it was already fetched, through the API otherwise.
+    ``None`` is returned if the branch does not exist or cannot be read.
+    """
+    try:
+        if repo is None:
+            return pygithub_repo.get_branch(branch).commit.commit.tree.sha
+
+        output = repo.git.ls_remote("origin", f"refs/heads/{branch}")
+        if not output:
+            return None
+        sha = output.split()[0]
+        try:
+            return repo.git.rev_parse("--verify", "--quiet", f"{sha}^{{tree}}")
+        except GitCommandError:
+            return pygithub_repo.get_git_commit(sha).tree.sha
+    except GithubException as err:
+        if err.status != 404:
+            print(f"Unable to read remote branch '{branch}': {err} - process will continue.")
+        return None
+    except GitCommandError as err:
+        print(f"Unable to read remote branch '{branch}': {err} - process will continue.")
+        return None
+
+
+def _upsert_pull_request(
+    pygithub_repo: Repository, title: str, base: str, head: str
+) -> PullRequest:
+    """Create a pull request, or update the one already opened from the same branch.
+
+    The open pull request is looked up with a server-side filter on its head
+    branch, which costs a single request whatever the number of open pull requests.
+    If another process opens it between the lookup and the creation, the one it
+    opened is updated instead.
+
+    Parameters
+    ----------
+    pygithub_repo : Repository
+        Remote repository.
+    title : str
+        Title of the pull request.
+    base : str
+        Branch the changes are merged into.
+    head : str
+        Branch containing the changes.
+
+    Returns
+    -------
+    PullRequest
+        The created or updated pull request.
+
+    """
+    head_filter = f"{pygithub_repo.owner.login}:{head}"
+    pull_request = next(iter(pygithub_repo.get_pulls(state="open", head=head_filter)), None)
+
+    if pull_request is None:
+        print(f">>> Creating pull request from '{head}'...")
+        try:
+            return pygithub_repo.create_pull(
+                title=title,
+                body="Please review and merge these changes.",
+                base=base,
+                head=head,
+            )
+        except GithubException as err:
+            if err.status != 422:
+                raise
+            # The pull request may have been opened concurrently since the lookup
+            pulls = pygithub_repo.get_pulls(state="open", head=head_filter)
+            pull_request = next(iter(pulls), None)
+            if pull_request is None:
+                raise
+
+    print(f">>> Pull request #{pull_request.number} already existed for '{head}'...")
+    if pull_request.title != title or pull_request.base.ref != base:
+        print(f">>> Updating pull request #{pull_request.number}...")
+        pull_request.edit(title=title, base=base)
+    return pull_request
+
+
+def _publish_branch(
+    pygithub_repo: Repository,
+    tree: str,
+    push: Callable[[], None],
+    branch_checked_out: str,
+    target_branch_name: str,
+    pull_request_title: str,
+    repo: Repo | None = None,
+) -> str:
+    """Push the synchronization branch, then create or update its pull request.
+
+    The push is skipped if the remote branch already has the same tree: it would
+    only rewrite the head of the pull request and trigger its checks again.
+
+    Parameters
+    ----------
+    pygithub_repo : Repository
+        Remote repository.
+    tree : str
+        SHA of the tree of the synchronization commit.
+    push : Callable[[], None]
+        Force-update the remote branch to the synchronization commit.
+    branch_checked_out : str
+        Branch the pull request is merged into.
+    target_branch_name : str
+        Branch containing the synchronization commit.
+    pull_request_title : str
+        Title of the pull request.
+    repo : Repo, optional
+        Local clone, used to read the remote branch without the API when possible.
+
+    Returns
+    -------
+    str
+        URL of the pull request.
+
+    """
+    with span("push"):
+        if _remote_branch_tree(pygithub_repo, target_branch_name, repo) == tree:
+            print(f">>> Branch '{target_branch_name}' is already up to date remotely...")
+            count("pushes_skipped")
+        else:
+            print(f">>> Force-pushing branch '{target_branch_name}' remotely...")
+            push()
+
+    with span("pull_request"):
+        pull_request = _upsert_pull_request(
+            pygithub_repo, pull_request_title, branch_checked_out, target_branch_name
+        )
+    print(f">>> Pull request created: {pull_request.html_url}")
+    return pull_request.html_url
+
+
+def _plan_directories(
+    sources: List[Tuple[SyncMapping, ManifestMatcher, SourceTree]],
+    targets: List[Dict[str, TreeElement] | None],
+    report: ChangeReport,
+) -> List[DirectoryChanges]:
+    """Compute and report the changes of each synchronized directory.
+
+    Parameters
+    ----------
+    sources : List[Tuple[SyncMapping, ManifestMatcher, SourceTree]]
+        Mappings, with their compiled manifest and the git objects of their files.
+    targets : List[Dict[str, TreeElement] | None]
+        Git objects of the target directory of each mapping, ``None`` if it was
+        too large to be listed.
+    report : ChangeReport
+        Report receiving the changes.
+
+    Returns
+    -------
+    List[DirectoryChanges]
+        Changes of the directories that are not up to date. Empty if there is
+        nothing to synchronize.
+
+    """
+    directories = []
+    for (mapping, manifest, source_tree), target in zip(sources, targets):
+        if target is None:
+            raise RuntimeError(
+                f"The tree of '{mapping.to_dir}' is too large to be listed through the GitHub"
+                " API. Use the 'clone' backend instead."
+            )
+
+        path = normalize_repository_path(mapping.to_dir)
+        changes = plan_tree_changes(
+            target,
+            source_tree,
+            manifest,
+            mapping.clean_to_dir,
+            mapping.clean_to_dir_based_on_manifest,
+        )
+        if changes:
+            directories.append(
+                DirectoryChanges(path, mapping.from_dir, source_tree, changes, target)
+            )
+
+    # If there are no changes, avoid creating PR
+    if not directories:
+        print(">>> No files to sync... Ignoring PR request.")
+        return directories
+
+    print(">>> Summary of modified files...")
+    for directory in directories:
+        report.add_changes(directory.changes, f"{directory.path}/" if directory.path else "")
+    print(report.summary())
+    return directories
+
+
+def _synchronize_through_api(
+    pygithub_repo: Repository,
+    mappings: List[SyncMapping],
+    sources: Future[List[Tuple[SyncMapping, ManifestMatcher, SourceTree]]],
+    branch_checked_out: str,
+    dry_run: bool,
+    commit_message: str,
+    target_branch_name: str,
+    pull_request_title: str,
+    api_workers: int,
+    report: ChangeReport,
+) -> Union[str, None]:
+    """Synchronize folders through the GitHub Git Data API, without cloning the repository.
+
+    The remote folders are listed while ``sources`` are still being computed.
+    See :func:`synchronize` for a description of the other parameters.
+    """
+    with span("list_remote_tree"):
+        base_commit = pygithub_repo.get_branch(branch_checked_out).commit.commit
+
+        targets = []
+        for mapping in mappings:
+            path = normalize_repository_path(mapping.to_dir)
+            print(f">>> Listing '{mapping.to_dir}' on remote branch '{branch_checked_out}'...")
+            targets.append(list_remote_tree(pygithub_repo, base_commit.sha, path))
+
+    directories = _plan_directories(sources.result(), targets, report)
+    if not directories:
+        return None
+
+    if dry_run:
+        print(">>> Dry run successful.")
+        return None
+
+    print(f">>> Committing changes to branch '{target_branch_name}'...")
+    with span("upload"):
+        commit = commit_tree_changes(
+            pygithub_repo, base_commit, directories, commit_message, workers=api_workers
+        )
+
+    return _publish_branch(
+        pygithub_repo,
+        commit.tree.sha,
+        lambda: update_branch(pygithub_repo, target_branch_name, commit.sha),
+        branch_checked_out,
+        target_branch_name,
+        pull_request_title,
+    )
+
+
+def _synchronize_through_fast_import(
+    repo: Repo,
+    pygithub_repo: Repository,
+    mappings: List[SyncMapping],
+    sources: Future[List[Tuple[SyncMapping, ManifestMatcher, SourceTree]]],
+    branch_checked_out: str,
+    dry_run: bool,
+    commit_message: str,
+    target_branch_name: str,
+    pull_request_title: str,
+    report: ChangeReport,
+) -> Union[str, None]:
+    """Synchronize folders by streaming them into ``git fast-import`` in a bare clone.
+
+    See :func:`synchronize` for a description of the other parameters.
+    """
+    with span("read_tree"):
+        targets = [
+            list_tree(repo, branch_checked_out, normalize_repository_path(mapping.to_dir))
+            for mapping in mappings
+        ]
+
+    directories = _plan_directories(sources.result(), targets, report)
+    if not directories:
+        return None
+
+    print(f">>> Committing changes to branch '{target_branch_name}'...")
+    with span("commit"):
+        sha = commit_with_fast_import(
+            repo, branch_checked_out, target_branch_name, directories, commit_message
+        )
+
+    if dry_run:
+        print(">>> Dry run successful.")
+        return None
+
+    return _publish_branch(
+        pygithub_repo,
+        repo.git.rev_parse(f"{sha}^{{tree}}"),
+        lambda: repo.git.push("--force", "origin", f"refs/heads/{target_branch_name}"),
+        branch_checked_out,
+        target_branch_name,
+        pull_request_title,
+        repo,
+    )
+
+
 def synchronize(
     owner: str,
     repository: str,
     token: str,
-    from_dir: str | Path,
-    to_dir: str | Path,
-    include_manifest: str | Path,
+    from_dir: str | Path | None = None,
+    to_dir: str | Path | None = None,
+    include_manifest: str | Path | None = None,
     branch_checked_out: str = "main",
     clean_to_dir: bool = False,
     clean_to_dir_based_on_manifest: bool = False,
@@ -147,8 +680,27 @@ def synchronize(
     random_branch_name: bool = False,
     target_branch_name: str = DEFAULT_BRANCH_NAME,
     pull_request_title: str = DEFAULT_PULL_REQUEST_TITLE,
+    cache_dir: str | Path | None = None,
+    cache_max_size: int | None = None,
+    clone_strategy: str = "full",
+    check_remote_tree: bool = False,
+    hash_cache: str | Path | None = None,
+    hash_workers: int | None = None,
+    backend: str = "clone",
+    api_workers: int = DEFAULT_API_WORKERS,
+    client: Github | None = None,
+    source_tree: SourceTree | None = None,
+    mappings: List[SyncMapping] | None = None,
+    api_cache: str | Path | None = None,
+    metrics: Metrics | None = None,
+    api_url: str | None = None,
+    remote_url: str | None = None,
+    copy_strategy: str = "copy",
+    report: ChangeReport | None = None,
 ) -> Union[str, None]:
-    """Synchronize a folder to a remote repository.
+    """Synchronize one or several folders to a remote repository.
+
+    All folders are synchronized in a single commit and pull request.
 
     Parameters
     ----------
@@ -158,17 +710,19 @@ def synchronize(
         Repository name.
     token : str
         GitHub access token.
-    from_dir : str | Path
-        Directory from which files want to be synced.
-    to_dir : str | Path
+    from_dir : str | Path, optional
+        Directory from which files want to be synced. Optional if ``mappings`` are given.
+    to_dir : str | Path, optional
         Directory to which files want to be synced (w.r.t. the root of the repository).
-    include_manifest : str | Path
-        Path to manifest which mentions accepted extension files.
+        Optional if ``mappings`` are given.
+    include_manifest : str | Path, optional
+        Path to manifest which mentions accepted extension files. Optional if ``mappings``
+        are given.
     branch_checked_out : str, optional
         Branch to check out, by default "main".
     clean_to_dir : bool, optional
         Delete the content inside the directory where the files will be synced, by default
-        ``False``.
+        ``False``. Only applies to ``to_dir``: each mapping has its own cleanup options.
     clean_to_dir_based_on_manifest : bool, optional
         In case ``clean_to_dir`` is requested, perform the cleanup of files that match the regex
         in the manifest. By default, ``False``. If ``clean_to_dir`` is ``False``, this option will
@@ -184,6 +738,68 @@ def synchronize(
     pull_request_title : str, optional
         Title of the pull request created after synchronization, by default it is
         'sync: file sync performed by ansys-tools-repo-sync'.
+    cache_dir : str | Path, optional
+        Directory holding a persistent bare mirror of the repository. When provided,
+        the mirror is incrementally fetched and used as the source of the clone
+        instead of downloading the whole history. By default, no cache is used.
+    cache_max_size : int, optional
+        Maximum size of the cache directory in megabytes. Least recently used mirrors
+        are evicted when it is exceeded. Only has an effect if ``cache_dir`` is provided.
+    clone_strategy : str, optional
+        Strategy used to clone the repository, by default ``"full"``. With ``"sparse"``,
+        only the tip of ``branch_checked_out`` is fetched, blobs are downloaded on demand
+        and only ``to_dir`` is checked out on disk.
+    check_remote_tree : bool, optional
+        Whether to compare the files to sync with ``to_dir`` on ``branch_checked_out``
+        through the GitHub API before cloning, by default ``False``. If they are already
+        identical, the synchronization stops without cloning the repository.
+    hash_cache : str | Path, optional
+        Path to a persistent cache of the git hashes of the files in ``from_dir``. Only the
+        files whose size, modification time or inode changed since the previous run are
+        hashed again. By default, no cache is used.
+    hash_workers : int, optional
+        Number of processes used to hash the files in ``from_dir``. By default, files are
+        hashed in the current process.
+    backend : str, optional
+        Backend used to commit the files, by default ``"clone"``. With ``"api"``, the
+        repository is not cloned: only the added and modified files are uploaded, and the
+        commit and branch are created through the GitHub Git Data API. With
+        ``"fast-import"``, the repository is cloned without any working tree and the
+        added and modified files are streamed into ``git fast-import``.
+    api_workers : int, optional
+        Number of files uploaded concurrently with the ``"api"`` backend.
+    client : Github, optional
+        Authenticated GitHub client, which can be shared by several synchronizations.
+        By default, a new client is created from ``token`` with
+        :func:`ansys.tools.repo_sync.client.create_client`.
+    source_tree : SourceTree, optional
+        Git objects of the files to sync from ``from_dir``, as returned by
+        :func:`scan_source_tree`. By default, the files in ``from_dir`` are hashed.
+    mappings : List[SyncMapping], optional
+        Additional folders to synchronize, each with its own manifest and cleanup
+        options. They are applied after the ``from_dir`` folder, if any.
+    api_cache : str | Path, optional
+        Directory caching the GitHub API responses between runs. Unchanged resources
+        are then revalidated with conditional requests, which do not count against the
+        rate limit. Only has an effect if ``client`` is not provided.
+    metrics : Metrics, optional
+        Collector receiving the duration of each phase and the counters of the
+        synchronization (files scanned, copied, deleted, git subprocesses, API calls...).
+    api_url : str, optional
+        URL of the GitHub API, by default the one of github.com. Only has an effect
+        if ``client`` is not provided.
+    remote_url : str, optional
+        URL of the git remote to clone from and push to, such as a ``file://`` URL.
+        By default, the HTTPS URL of the repository, authenticated with ``token``.
+    copy_strategy : str, optional
+        Strategy used to copy the files into the clone, one of
+        :data:`ansys.tools.repo_sync.copier.COPY_STRATEGIES`. By default, ``"copy"``.
+        Reflinks and hard links avoid writing the content of the files when the
+        clone is on the same file system. Only has an effect with the ``clone`` backend.
+    report : ChangeReport, optional
+        Report receiving the files added, modified and deleted by the synchronization,
+        as they are computed. It can write every change to a file, while only a
+        truncated summary is printed. It is not closed by the synchronization.
 
     Returns
     -------
@@ -197,12 +813,131 @@ def synchronize(
 
         target_branch_name = f"{target_branch_name}-{token_urlsafe(16)}"
 
+    # Gather the folders to synchronize
+    mappings = list(mappings or [])
+    if (from_dir, to_dir, include_manifest) != (None, None, None):
+        if None in (from_dir, to_dir, include_manifest):
+            raise ValueError("'from_dir', 'to_dir' and 'include_manifest' go together.")
+        mappings.insert(
+            0,
+            SyncMapping(
+                from_dir, to_dir, include_manifest, clean_to_dir, clean_to_dir_based_on_manifest
+            ),
+        )
+    check_mappings(mappings)
+
+    # The local stage (manifests and hashes of the files to sync) does not depend on the
+    # repository: it runs in the background while the network stages are in flight.
+    #
+    # Leaving the context manager waits for the local stage, even on errors.
+    with (
+        nullcontext() if metrics is None else metrics.activate(),
+        ThreadPoolExecutor(max_workers=1, thread_name_prefix="repo-sync-local") as executor,
+    ):
+        sources = submit(
+            executor,
+            _prepare_sources,
+            mappings,
+            source_tree if from_dir is not None else None,
+            hash_cache,
+            hash_workers,
+        )
+        return _synchronize_stages(
+            owner,
+            repository,
+            token,
+            mappings,
+            sources,
+            branch_checked_out,
+            dry_run,
+            skip_ci,
+            target_branch_name,
+            pull_request_title,
+            cache_dir,
+            cache_max_size,
+            clone_strategy,
+            check_remote_tree,
+            backend,
+            api_workers,
+            client,
+            api_cache,
+            api_url,
+            remote_url,
+            copy_strategy,
+            ChangeReport() if report is None else report,
+        )
+
+
+def _synchronize_stages(
+    owner: str,
+    repository: str,
+    token: str,
+    mappings: List[SyncMapping],
+    sources: Future[List[Tuple[SyncMapping, ManifestMatcher, SourceTree]]],
+    branch_checked_out: str,
+    dry_run: bool,
+    skip_ci: bool,
+    target_branch_name: str,
+    pull_request_title: str,
+    cache_dir: str | Path | None,
+    cache_max_size: int | None,
+    clone_strategy: str,
+    check_remote_tree: bool,
+    backend: str,
+    api_workers: int,
+    client: Github | None,
+    api_cache: str | Path | None,
+    api_url: str | None,
+    remote_url: str | None,
+    copy_strategy: str,
+    report: ChangeReport,
+) -> Union[str, None]:
+    """Run the network stages of a synchronization, waiting for ``sources`` when needed.
+
+    See :func:`synchronize` for a description of the parameters.
+    """
     # Authenticate with GitHub
-    g = Github(auth=Auth.Token(token))
+    g = create_client(token, api_cache, base_url=api_url) if client is None else client
 
     # Get the repository
     print(f">>> Accessing repository '{owner}/{repository}'...")
-    pygithub_repo = g.get_repo(f"{owner}/{repository}")
+    with span("access_repository"):
+        pygithub_repo = g.get_repo(f"{owner}/{repository}")
+
+    # If requested, compare with the remote repository before cloning it
+    if check_remote_tree:
+        print(f">>> Comparing with remote branch '{branch_checked_out}'...")
+        with span("check_remote_tree"):
+            up_to_date = all(
+                remote_tree_is_up_to_date(
+                    pygithub_repo,
+                    branch_checked_out,
+                    normalize_repository_path(mapping.to_dir),
+                    mapping_tree,
+                    mapping.clean_to_dir,
+                )
+                for mapping, _, mapping_tree in sources.result()
+            )
+        if up_to_date:
+            print(">>> No files to sync... Ignoring PR request.")
+            return None
+
+    commit_message = f"{'[skip ci] ' if skip_ci else ''}sync: add changes from local folder"
+
+    # If requested, commit through the GitHub API instead of cloning the repository
+    if backend == "api":
+        return _synchronize_through_api(
+            pygithub_repo,
+            mappings,
+            sources,
+            branch_checked_out,
+            dry_run,
+            commit_message,
+            target_branch_name,
+            pull_request_title,
+            api_workers,
+            report,
+        )
 
     # Create a temporary directory for the clone
     #
@@ -210,104 +945,169 @@ def synchronize(
     # of scope. No need to actively remove.
     temp_dir = tempfile.TemporaryDirectory(prefix="repo_clone_", ignore_cleanup_errors=True)
 
-    # Retrieve accepted extensions from manifest
-    accepted_extensions = []
-    include_manifest_path = Path(include_manifest)
-    print(f">>> Considering manifest file at {include_manifest_path} ...")
-    accepted_extensions = include_manifest_path.read_text().splitlines()
-
-    # Clone the repository
-    print(f">>> Cloning repository '{owner}/{repository}'...")
-    repo_path = Path(temp_dir.name) / repository
-    authenticated_url = f"https://{token}@{pygithub_repo.html_url.split('https://')[-1]}"
-    Repo.clone_from(authenticated_url, repo_path)
-
-    # Define the destination path for the files to be synced
-    destination_path = repo_path / to_dir
-    destination_path.mkdir(parents=True, exist_ok=True)
-
-    # If requested, clean the destination path
-    if clean_to_dir:
-        print(f">>> Cleaning content inside '{to_dir}'...")
-        acc_regex = adapt_regex_from_manifest(accepted_extensions)
-        delete_folder_contents(destination_path, acc_regex, clean_to_dir_based_on_manifest)
-
-    # Copy local folder contents to the cloned repository
-    print(f">>> Moving desired files from {from_dir} to {destination_path} ...")
-    shutil.copytree(
-        from_dir,
-        destination_path,
-        ignore=include_patterns(*accepted_extensions),
-        dirs_exist_ok=True,
-    )
+    # Resources (such as the lock on the mirror cache) released once the sync is over
+    resources = ExitStack()
 
-    print(f">>> Checking out new branch '{target_branch_name}' from '{branch_checked_out}'...")
-    repo = Repo(repo_path)
+    repo = None
     try:
-        # Commit changes to a new branch
-        repo.git.checkout(branch_checked_out)
-        repo.git.checkout("-b", target_branch_name)
-        print(f">>> Committing changes to branch '{target_branch_name}'...")
-        repo.git.add("--all")
-        repo.index.commit(f"{'[skip ci] ' if skip_ci else ''}sync: add changes from local folder")
-
-        # Get a list of the files modified
-        output = repo.git.diff(
-            "--compact-summary", f"{branch_checked_out}", f"{target_branch_name}"
+        # Clone the repository
+        repo_path = Path(temp_dir.name) / repository
+        authenticated_url = (
+            f"https://{token}@{pygithub_repo.html_url.split('https://')[-1]}"
+            if remote_url is None
+            else remote_url
         )
+        clone_url = authenticated_url
+        if cache_dir is not None:
+            cache = MirrorCache(
+                cache_dir, max_size=None if cache_max_size is None else cache_max_size * 1024**2
+            )
+            with span("update_cache"):
+                clone_url = resources.enter_context(
+                    cache.mirror(owner, repository, authenticated_url)
+                )
 
-        # If output is empty, avoid creating PR
-        if not output:
+        print(
+            f">>> Cloning branch '{branch_checked_out}' of repository '{owner}/{repository}'"
+            f" ({clone_strategy} clone{' from cache' if cache_dir is not None else ''})..."
+        )
+        with span("clone"):
+            cloned_repo = clone_repository(
+                clone_url,
+                repo_path,
+                branch_checked_out,
+                [mapping.to_dir for mapping in mappings],
+                strategy=clone_strategy,
+                shared=cache_dir is not None,
+                bare=backend == "fast-import",
+            )
+        if cache_dir is not None:
+            # Push directly to the remote repository, not to the mirror
+            cloned_repo.remote("origin").set_url(authenticated_url)
+
+        if backend == "fast-import":
+            repo = cloned_repo
+            return _synchronize_through_fast_import(
+                repo,
+                pygithub_repo,
+                mappings,
+                sources,
+                branch_checked_out,
+                dry_run,
+                commit_message,
+                target_branch_name,
+                pull_request_title,
+                report,
+            )
+
+        with cloned_repo:
+            # Files and folders already identical in the repository are neither
+            # cleaned nor copied
+            with span("read_tree"):
+                target_trees = [
+                    read_tree(
+                        cloned_repo, branch_checked_out, normalize_repository_path(mapping.to_dir)
+                    )
+                    for mapping in mappings
+                ]
+
+        # Stop early if the repository already contains the desired files
+        if all(
+            mapping_tree.is_up_to_date(target_tree, mapping.clean_to_dir)
+            for (mapping, _, mapping_tree), target_tree in zip(sources.result(), target_trees)
+        ):
             print(">>> No files to sync... Ignoring PR request.")
             return None
-        else:
-            print(">>> Summary of modified files...")
-            print(output)
 
-        pull_request = None
-        if not dry_run:
-            # Push changes to remote repositories
-            print(f">>> Force-pushing branch '{target_branch_name}' remotely...")
-            repo.git.push("--force", "origin", target_branch_name)
+        # Files written or deleted in the working tree, for each folder
+        directories = []
+        for (mapping, manifest, mapping_tree), target_tree in zip(sources.result(), target_trees):
+            unchanged = mapping_tree.unchanged_paths(target_tree)
+            changes = ChangeSet()
 
-            # Create a pull request
-            try:
-                print(f">>> Creating pull request from '{target_branch_name}'...")
-                pull_request = pygithub_repo.create_pull(
-                    title=pull_request_title,
-                    body="Please review and merge these changes.",
-                    base=branch_checked_out,
-                    head=target_branch_name,
+            # Define the destination path for the files to be synced
+            destination_path = repo_path / mapping.to_dir
+            destination_path.mkdir(parents=True, exist_ok=True)
+
+            # If requested, delete the files that are not part of the source anymore.
+            # The other ones are left in place: identical files are skipped by the
+            # copy, and modified files are overwritten.
+            if mapping.clean_to_dir:
+                stale_paths = mapping_tree.stale_paths(
+                    target_tree, manifest if mapping.clean_to_dir_based_on_manifest else None
                 )
-            except GithubException as err:
-                if err.args[0] == 422 or err.data["message"] == "Validation Failed":
-                    print(">>> Branch and pull request already existed, searching for it...")
-
-                    # Pull request already exists
-                    prs = pygithub_repo.get_pulls()
-
-                    # Find the associated PR (must be opened...)
-                    associated_pull_request = None
-                    for pr in prs:
-                        if pr.head.ref == target_branch_name:
-                            associated_pull_request = pr
-                            break
-
-                    # Return the associated PR
-                    if associated_pull_request:
-                        pull_request = associated_pull_request
-                    else:
-                        # Don't know what could have happened...
-                        raise err
-                else:
-                    # Unidentified error.. raise it.
-                    raise err
-
-            print(f">>> Pull request created: {pull_request.html_url}")
-            return pull_request.html_url
+                print(
+                    f">>> Cleaning content inside '{mapping.to_dir}'"
+                    f" ({len(stale_paths)} stale files)..."
+                )
+                with span("clean"):
+                    delete_stale_files(destination_path, stale_paths)
+                changes.deleted = stale_paths
+
+            # Copy local folder contents to the cloned repository
+            print(f">>> Moving desired files from {mapping.from_dir} to {destination_path} ...")
+            with span("copy"):
+                copy_stats = copy_tree(
+                    mapping.from_dir,
+                    destination_path,
+                    manifest,
+                    skip=unchanged,
+                    strategy=copy_strategy,
+                )
+            print(f">>> Files synchronized: {copy_stats}.")
+            changes.added, changes.modified = copy_stats.new_paths, copy_stats.copied_paths
+            count("files_new", copy_stats.new)
+            count("files_copied", copy_stats.copied)
+            count("files_skipped", copy_stats.skipped + len(unchanged))
+            count("bytes_written", copy_stats.bytes_written)
+            count("bytes_shared", copy_stats.bytes_shared)
+            directories.append((normalize_repository_path(mapping.to_dir), changes))
+
+        print(f">>> Checking out new branch '{target_branch_name}' from '{branch_checked_out}'...")
+        repo = InstrumentedRepo(repo_path)
+
+        # Commit changes to a new branch
+        with span("commit"):
+            repo.git.checkout("-b", target_branch_name)
+            print(f">>> Committing changes to branch '{target_branch_name}'...")
+            stage_paths(
+                repo,
+                (
+                    f"{path}/{changed_path}" if path else changed_path
+                    for path, changes in directories
+                    for changed_path in changes.added + changes.modified + changes.deleted
+                ),
+            )
+            commit = commit_index(repo, commit_message)
+
+        # If the tree did not change (only ignored files were written), avoid creating PR
+        with span("diff"):
+            unchanged_tree = commit.tree == commit.parents[0].tree
+        if unchanged_tree:
+            print(">>> No files to sync... Ignoring PR request.")
+            return None
+
+        print(">>> Summary of modified files...")
+        for path, changes in directories:
+            report.add_changes(changes, f"{path}/" if path else "")
+        print(report.summary())
+
+        if not dry_run:
+            # Push changes to remote repositories and create a pull request
+            return _publish_branch(
+                pygithub_repo,
+                commit.tree.hexsha,
+                lambda: repo.git.push("--force", "origin", target_branch_name),
+                branch_checked_out,
+                target_branch_name,
+                pull_request_title,
+                repo,
+            )
         else:
             print(">>> Dry run successful.")
             return None
     finally:
         # Close local repo for proper file deletion
-        repo.close()
+        if repo is not None:
+            repo.close()
+        resources.close()
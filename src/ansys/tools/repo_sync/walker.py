@@ -0,0 +1,72 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Module containing the walker of the source tree."""
+
+import os
+from pathlib import Path
+from typing import Iterator, Set, Tuple
+
+from .manifest import ManifestMatcher
+
+
+def iter_source_files(
+    root: str | Path,
+    manifest: ManifestMatcher | None = None,
+    skip: Set[str] | None = None,
+) -> Iterator[Tuple[str, os.DirEntry]]:
+    """Walk a directory tree and yield the files accepted by the manifest.
+
+    The tree is walked with ``os.scandir()`` and the file type information
+    returned by the directory listing is reused, so no extra ``stat`` call is
+    made per file. Symbolic links are followed, like ``shutil.copytree()``
+    does by default.
+
+    Parameters
+    ----------
+    root : str | Path
+        Directory to walk.
+    manifest : ManifestMatcher, optional
+        Compiled manifest selecting the files. By default, all files are yielded.
+    skip : Set[str], optional
+        Relative paths (with ``/`` separators) of files and directories to leave
+        out. Skipped directories are not walked.
+
+    Yields
+    ------
+    Tuple[str, os.DirEntry]
+        Path of the file relative to ``root`` (with ``/`` separators) and its
+        directory entry.
+
+    """
+    pending = [("", os.fspath(root))]
+    while pending:
+        relative_dir, directory = pending.pop()
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                relative_path = f"{relative_dir}{entry.name}"
+                if skip and relative_path in skip:
+                    continue
+                if entry.is_dir():
+                    pending.append((f"{relative_path}/", entry.path))
+                elif entry.is_file() and (manifest is None or manifest.match(entry.name)):
+                    yield relative_path, entry
@@ -0,0 +1,362 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Module containing the watch mode, synchronizing folders whenever they change.
+
+Changes are detected with inotify on Linux, and by polling the folders
+otherwise. Bursts of changes are debounced into a single synchronization.
+"""
+
+import ctypes
+import ctypes.util
+import errno
+import os
+from pathlib import Path
+import select
+import struct
+import sys
+import time
+from typing import Callable, Dict, List, Sequence, Tuple
+
+from .constants import DEFAULT_POLL_INTERVAL, DEFAULT_WATCH_DEBOUNCE
+from .walker import iter_source_files
+
+WATCH_METHODS = ("auto", "inotify", "poll")
+"""Available methods to detect the changes in the watched folders.
+
+- ``auto``: use inotify when available, and poll the folders otherwise.
+- ``inotify``: be notified of the changes by the Linux kernel.
+- ``poll``: scan the folders periodically, comparing the size, modification time
+  and inode of their files.
+"""
+
+# Flags of inotify(7)
+_IN_MODIFY = 0x00000002
+_IN_ATTRIB = 0x00000004
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_DELETE_SELF = 0x00000400
+_IN_MOVE_SELF = 0x00000800
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ISDIR = 0x40000000
+
+_WATCH_MASK = (
+    _IN_MODIFY
+    | _IN_ATTRIB
+    | _IN_MOVED_FROM
+    | _IN_MOVED_TO
+    | _IN_CREATE
+    | _IN_DELETE
+    | _IN_DELETE_SELF
+    | _IN_MOVE_SELF
+)
+
+_EVENT_HEADER = struct.Struct("iIII")
+"""Header of an inotify event: watch descriptor, mask, cookie and length of the name."""
+
+
+class InotifyMonitor:
+    """Monitor of folder trees, notified of their changes by the Linux kernel.
+
+    Parameters
+    ----------
+    folders : Sequence[str | Path]
+        Folders to watch, with all their subfolders.
+
+    Raises
+    ------
+    OSError
+        If inotify is not available, or if the limit of watches is reached.
+
+    """
+
+    def __init__(self, folders: Sequence[str | Path]):
+        """Watch the folders and all their subfolders."""
+        if not sys.platform.startswith("linux"):
+            raise OSError(errno.ENOSYS, "inotify is only available on Linux.")
+
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self._fd = self._libc.inotify_init1(os.O_CLOEXEC | os.O_NONBLOCK)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "Unable to initialize inotify.")
+
+        self._folders = [os.fspath(folder) for folder in folders]
+        self._directories: Dict[int, str] = {}
+        try:
+            for folder in self._folders:
+                self._watch_tree(folder)
+        except BaseException:
+            self.close()
+            raise
+
+    def _watch_tree(self, root: str):
+        """Watch a folder and its subfolders."""
+        for directory, _, _ in os.walk(root, followlinks=True):
+            watch = self._libc.inotify_add_watch(self._fd, os.fsencode(directory), _WATCH_MASK)
+            if watch < 0:
+                error = ctypes.get_errno()
+                if error == errno.ENOENT:
+                    # Deleted in the meantime
+                    continue
+                raise OSError(error, f"Unable to watch '{directory}': {os.strerror(error)}.")
+            self._directories[watch] = directory
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Wait for changes in the watched folders.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            Maximum number of seconds to wait. By default, wait until a change happens.
+
+        Returns
+        -------
+        bool
+            Whether a change happened.
+
+        """
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+        if not readable:
+            return False
+
+        changed = False
+        while True:
+            try:
+                data = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                break
+
+            offset = 0
+            while offset < len(data):
+                watch, mask, _, length = _EVENT_HEADER.unpack_from(data, offset)
+                name = data[offset + _EVENT_HEADER.size : offset + _EVENT_HEADER.size + length]
+                offset += _EVENT_HEADER.size + length
+
+                if mask & _IN_IGNORED:
+                    # The folder was deleted or moved away
+                    self._directories.pop(watch, None)
+                    continue
+
+                changed = True
+                if mask & _IN_Q_OVERFLOW:
+                    # Events were lost: watch again the folders that may have been missed
+                    for folder in self._folders:
+                        self._watch_tree(folder)
+                elif mask & _IN_ISDIR and mask & (_IN_CREATE | _IN_MOVED_TO):
+                    # Files may have been created before the new folder is watched
+                    parent = self._directories.get(watch)
+                    if parent is not None:
+                        self._watch_tree(os.fspath(Path(parent) / os.fsdecode(name.rstrip(b"\0"))))
+
+        return changed
+
+    def close(self):
+        """Stop watching the folders."""
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+    def __enter__(self):
+        """Return the monitor itself."""
+        return self
+
+    def __exit__(self, *exc_info):
+        """Stop watching the folders."""
+        self.close()
+
+
+class PollingMonitor:
+    """Monitor of folder trees, scanning them periodically.
+
+    Parameters
+    ----------
+    folders : Sequence[str | Path]
+        Folders to watch, with all their subfolders.
+    interval : float, optional
+        Number of seconds between two scans of the folders.
+
+    """
+
+    def __init__(self, folders: Sequence[str | Path], interval: float = DEFAULT_POLL_INTERVAL):
+        """Take a first snapshot of the folders."""
+        self._folders = [os.fspath(folder) for folder in folders]
+        self._interval = interval
+        self._snapshot = self._scan()
+
+    def _scan(self) -> Dict[Tuple[int, str], Tuple[int, int, int, int]]:
+        """Map the files of the folders to their size, modification time, inode and mode."""
+        snapshot = {}
+        for index, folder in enumerate(self._folders):
+            try:
+                for relative_path, entry in iter_source_files(folder):
+                    try:
+                        stat = entry.stat()
+                    except FileNotFoundError:
+                        continue
+                    snapshot[index, relative_path] = (
+                        stat.st_size,
+                        stat.st_mtime_ns,
+                        stat.st_ino,
+                        stat.st_mode,
+                    )
+            except FileNotFoundError:
+                # A folder was deleted while being scanned: the snapshot differs anyway
+                continue
+        return snapshot
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Wait for changes in the watched folders.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            Maximum number of seconds to wait. By default, wait until a change happens.
+
+        Returns
+        -------
+        bool
+            Whether a change happened.
+
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            delay = self._interval
+            if deadline is not None:
+                delay = min(delay, deadline - time.monotonic())
+            if delay > 0:
+                time.sleep(delay)
+
+            snapshot = self._scan()
+            if snapshot != self._snapshot:
+                self._snapshot = snapshot
+                return True
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+
+    def close(self):
+        """Stop watching the folders."""
+
+    def __enter__(self):
+        """Return the monitor itself."""
+        return self
+
+    def __exit__(self, *exc_info):
+        """Stop watching the folders."""
+        self.close()
+
+
+def open_monitor(
+    folders: Sequence[str | Path],
+    method: str = "auto",
+    poll_interval: float = DEFAULT_POLL_INTERVAL,
+) -> InotifyMonitor | PollingMonitor:
+    """Start watching folder trees.
+
+    Parameters
+    ----------
+    folders : Sequence[str | Path]
+        Folders to watch, with all their subfolders.
+    method : str, optional
+        One of :data:`WATCH_METHODS`, by default ``"auto"``.
+    poll_interval : float, optional
+        Number of seconds between two scans of the folders, when they are polled.
+
+    Returns
+    -------
+    InotifyMonitor | PollingMonitor
+        Monitor of the folders.
+
+    """
+    if method not in WATCH_METHODS:
+        raise ValueError(f"Unknown watch method '{method}'. Available methods: {WATCH_METHODS}.")
+
+    if method != "poll":
+        try:
+            return InotifyMonitor(folders)
+        except OSError as err:
+            if method == "inotify":
+                raise
+            print(f"Unable to use inotify: {err} - process will continue by polling the folders.")
+
+    return PollingMonitor(folders, poll_interval)
+
+
+def watch_folders(
+    folders: Sequence[str | Path],
+    sync: Callable[[], object],
+    debounce: float = DEFAULT_WATCH_DEBOUNCE,
+    method: str = "auto",
+    poll_interval: float = DEFAULT_POLL_INTERVAL,
+    max_syncs: int | None = None,
+) -> int:
+    """Synchronize folders now, and then whenever they change.
+
+    A synchronization starts once no change happened for ``debounce`` seconds,
+    so that a burst of changes triggers a single synchronization. Errors raised
+    by a synchronization are reported, and the folders are still watched.
+
+    Parameters
+    ----------
+    folders : Sequence[str | Path]
+        Folders to watch, with all their subfolders.
+    sync : Callable[[], object]
+        Function synchronizing the folders.
+    debounce : float, optional
+        Number of seconds without any change before synchronizing.
+    method : str, optional
+        One of :data:`WATCH_METHODS`, by default ``"auto"``.
+    poll_interval : float, optional
+        Number of seconds between two scans of the folders, when they are polled.
+    max_syncs : int, optional
+        Number of synchronizations after which watching stops. By default, the folders
+        are watched until the process is interrupted.
+
+    Returns
+    -------
+    int
+        Number of synchronizations performed.
+
+    """
+    names: List[str] = [os.fspath(folder) for folder in folders]
+    syncs = 0
+    with open_monitor(folders, method, poll_interval) as monitor:
+        while True:
+            try:
+                sync()
+            except Exception as err:
+                print(f"An error occurred: {str(err)} - process will continue.")
+
+            syncs += 1
+            if max_syncs is not None and syncs >= max_syncs:
+                return syncs
+
+            print(f">>> Watching {', '.join(names)} for changes...")
+            while not monitor.wait():
+                pass
+
+            # Wait for the end of the burst of changes
+            while monitor.wait(debounce):
+                pass
+            print(">>> Changes detected, synchronizing...")
@@ -22,11 +22,16 @@
 
 """Pytest helpers and fixtures for repo sync tests."""
 
+import base64
 from dataclasses import dataclass
 import os
 from pathlib import Path
+import tempfile
+from types import SimpleNamespace
 
-from github import Auth, Github
+from git import Actor, GitCommandError, Repo
+from github import Auth, Github, GithubException
+import pytest
 
 TEST_PATH = Path(__file__).resolve().parent
 ROOT_PATH = TEST_PATH.parent
@@ -55,6 +60,175 @@ DEFAULT_SYNC_CONFIG = SyncTestConfig(
 )
 
 
+def commit_files(repo_path, files, message="test commit"):
+    """Auxiliary function to write files in a working copy and commit them."""
+    repo = Repo(repo_path)
+    for relative_path, content in files.items():
+        file_path = Path(repo_path) / relative_path
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_text(content)
+    repo.git.add("--all")
+    author = Actor("repo-sync", "repo-sync@example.com")
+    commit = repo.index.commit(message, author=author, committer=author)
+    repo.close()
+    return commit.hexsha
+
+
+@pytest.fixture
+def local_remote(tmp_path):
+    """Bare repository acting as remote, with an initial commit on ``main``.
+
+    Returns the path of the bare repository and the path of a working copy
+    that can be used to push new commits to it.
+    """
+    remote_path = tmp_path / "remote.git"
+    Repo.init(remote_path, bare=True, initial_branch="main").close()
+
+    work_path = tmp_path / "work"
+    Repo.clone_from(remote_path, work_path).close()
+    commit_files(work_path, {"README.md": "Hello world", "src/ansys/keep.txt": "keep"})
+    with Repo(work_path) as repo:
+        repo.git.push("origin", "HEAD:main")
+
+    return remote_path, work_path
+
+
+class LocalTreesRepository:
+    """Stand-in for the Git Trees API of a repository, backed by a local repository."""
+
+    def __init__(self, path, max_entries=None):
+        self.repo = Repo(path)
+        self.max_entries = max_entries
+        self.calls = []
+
+    def get_git_tree(self, sha, recursive=False):
+        """List a tree like ``GET /repos/{owner}/{repo}/git/trees/{tree_sha}``."""
+        self.calls.append((sha, recursive))
+        try:
+            tree_sha = self.repo.git.rev_parse(f"{sha}^{{tree}}")
+        except GitCommandError:
+            raise GithubException(404, {"message": "Not Found"}, None)
+
+        args = ["-r", "-t"] if recursive else []
+        elements = []
+        for line in self.repo.git.ls_tree(*args, tree_sha).splitlines():
+            info, path = line.split("\t", 1)
+            mode, kind, object_sha = info.split()
+            elements.append(SimpleNamespace(path=path, mode=mode, type=kind, sha=object_sha))
+
+        truncated = self.max_entries is not None and len(elements) > self.max_entries
+        return SimpleNamespace(sha=tree_sha, tree=elements, raw_data={"truncated": truncated})
+
+
+class LocalGitDataRepository(LocalTreesRepository):
+    """Stand-in for the Git Data API of a repository, backed by a local repository."""
+
+    html_url = "https://github.com/owner/repository"
+    owner = SimpleNamespace(login="owner")
+
+    def __init__(self, path, max_entries=None):
+        super().__init__(path, max_entries)
+        self.uploaded = []
+        self.pulls = []
+
+    def get_branch(self, branch):
+        """Get a branch like ``GET /repos/{owner}/{repo}/branches/{branch}``."""
+        try:
+            sha = self.repo.git.rev_parse("--verify", f"refs/heads/{branch}")
+        except GitCommandError:
+            raise GithubException(404, {"message": "Branch not found"}, None)
+        tree = SimpleNamespace(sha=self.repo.git.rev_parse(f"{sha}^{{tree}}"))
+        return SimpleNamespace(commit=SimpleNamespace(commit=SimpleNamespace(sha=sha, tree=tree)))
+
+    def create_git_blob(self, content, encoding):
+        """Create a blob like ``POST /repos/{owner}/{repo}/git/blobs``."""
+        assert encoding == "base64"
+        data = base64.b64decode(content)
+        self.uploaded.append(data)
+        # Blobs are uploaded concurrently: each one goes through its own file
+        with tempfile.NamedTemporaryFile(dir=self.repo.git_dir) as blob_file:
+            blob_file.write(data)
+            blob_file.flush()
+            return SimpleNamespace(sha=self.repo.git.hash_object("-w", blob_file.name))
+
+    def create_git_tree(self, tree, base_tree):
+        """Create a tree like ``POST /repos/{owner}/{repo}/git/trees``."""
+        env = {"GIT_INDEX_FILE": str(Path(self.repo.git_dir) / "api_index")}
+        self.repo.git.read_tree(base_tree.sha, env=env)
+        with tempfile.TemporaryFile() as index_info:
+            for element in tree:
+                identity = element._identity
+                if not identity["sha"]:
+                    # Like GitHub, only delete entries whose mode matches
+                    entry = self.repo.git.ls_tree(base_tree.sha, "--", identity["path"])
+                    if entry and entry.split()[0] != identity["mode"]:
+                        raise GithubException(422, {"message": "GitRPC::BadObjectState"}, None)
+                # A null mode removes the entry from the index
+                mode, sha = (
+                    (identity["mode"], identity["sha"]) if identity["sha"] else ("0", "0" * 40)
+                )
+                index_info.write(f"{mode} {sha}\t{identity['path']}\n".encode())
+            index_info.seek(0)
+            self.repo.git.update_index("--index-info", istream=index_info, env=env)
+        return SimpleNamespace(sha=self.repo.git.write_tree(env=env))
+
+    def create_git_commit(self, message, tree, parents):
+        """Create a commit like ``POST /repos/{owner}/{repo}/git/commits``."""
+        args = [tree.sha, "-m", message]
+        for parent in parents:
+            args.extend(["-p", parent.sha])
+        env = {
+            "GIT_AUTHOR_NAME": "repo-sync",
+            "GIT_AUTHOR_EMAIL": "repo-sync@example.com",
+            "GIT_COMMITTER_NAME": "repo-sync",
+            "GIT_COMMITTER_EMAIL": "repo-sync@example.com",
+        }
+        return SimpleNamespace(sha=self.repo.git.commit_tree(*args, env=env), tree=tree)
+
+    def get_git_ref(self, ref):
+        """Get a lazy reference, updated like ``PATCH /repos/{owner}/{repo}/git/refs/{ref}``."""
+
+        def edit(sha, force=False):
+            try:
+                self.repo.git.rev_parse("--verify", f"refs/{ref}")
+            except GitCommandError:
+                raise GithubException(422, {"message": "Reference does not exist"}, None)
+            self.repo.git.update_ref(f"refs/{ref}", sha)
+
+        return SimpleNamespace(edit=edit)
+
+    def create_git_ref(self, ref, sha):
+        """Create a reference like ``POST /repos/{owner}/{repo}/git/refs``."""
+        self.repo.git.update_ref(ref, sha)
+
+    def create_pull(self, title, body, base, head):
+        """Create a pull request like ``POST /repos/{owner}/{repo}/pulls``."""
+        if any(pull.head.ref == head for pull in self.pulls):
+            raise GithubException(422, {"message": "Validation Failed"}, None)
+        number = len(self.pulls) + 1
+        pull = SimpleNamespace(
+            number=number,
+            title=title,
+            html_url=f"{self.html_url}/pull/{number}",
+            head=SimpleNamespace(ref=head),
+            base=SimpleNamespace(ref=base),
+        )
+        pull.edit = lambda title, base: pull.__dict__.update(
+            title=title, base=SimpleNamespace(ref=base)
+        )
+        self.pulls.append(pull)
+        return pull
+
+    def get_pulls(self, state="open", head=None):
+        """List the pull requests like ``GET /repos/{owner}/{repo}/pulls``."""
+        self.calls.append(("pulls", head))
+        return [
+            pull
+            for pull in self.pulls
+            if head is None or head == f"{self.owner.login}:{pull.head.ref}"
+        ]
+
+
 def cleanup_remote_repo(owner, repository, pull_request_url):
     """Auxiliary function to clean-up remote repository after tests execution."""
     # Authenticate with GitHub
@@ -0,0 +1,374 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Local HTTP server standing in for the GitHub REST API."""
+
+import base64
+from collections import defaultdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import os
+from pathlib import Path
+import re
+import subprocess
+import threading
+from urllib.parse import parse_qs, urlsplit
+
+NULL_SHA = "0" * 40
+
+
+class FakeGitHub:
+    """Serve scripted JSON responses, honoring conditional requests.
+
+    Responses are registered per method and path. When several responses are
+    registered for the same route, they are served in order and the last one
+    is repeated. Responses carrying an ``ETag`` header are answered with
+    ``304 Not Modified`` when the request has a matching ``If-None-Match``.
+    """
+
+    def __init__(self):
+        self.routes = defaultdict(list)
+        self.requests = []
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def _respond(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(length) if length else b""
+                fake.requests.append((self.command, self.path, dict(self.headers), body))
+                status, headers, payload = fake._handle(self.command, self.path, body)
+
+                etag = headers.get("ETag")
+                if status == 200 and etag is not None and self.headers.get("If-None-Match") == etag:
+                    status, payload = 304, None
+
+                content = b"" if payload is None else json.dumps(payload).encode()
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Type", "application/json; charset=utf-8")
+                self.send_header("Content-Length", str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+            do_GET = do_POST = do_PATCH = do_PUT = do_DELETE = _respond  # noqa: N815
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._thread = threading.Thread(
+            target=self.server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+        )
+
+    @property
+    def url(self):
+        """Base URL of the server."""
+        host, port = self.server.server_address
+        return f"http://{host}:{port}"
+
+    def add(self, method, path, payload=None, status=200, headers=None):
+        """Register a response for a route."""
+        self.routes[method, path].append((status, headers or {}, payload))
+
+    def _handle(self, method, path, body):
+        return self._next_response(method, path)
+
+    def _next_response(self, method, path):
+        responses = self.routes.get((method, path.split("?")[0]))
+        if not responses:
+            return 404, {}, {"message": "Not Found"}
+        return responses.pop(0) if len(responses) > 1 else responses[0]
+
+    def paths(self, method="GET"):
+        """Paths of the received requests with the given method."""
+        return [path for verb, path, _, _ in self.requests if verb == method]
+
+    def __enter__(self):
+        """Start serving requests in a background thread."""
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        """Stop the server."""
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class LocalGitHub(FakeGitHub):
+    """Serve the GitHub REST endpoints used by the synchronization, backed by a bare repository.
+
+    The repository, branches, Git Data (blobs, trees, commits and references)
+    and pull requests endpoints read and write the objects of a local bare
+    repository, which can also be cloned from and pushed to with a ``file://``
+    URL. Pull requests are kept in memory.
+    """
+
+    def __init__(self, path, owner="owner", repository="repository"):
+        super().__init__()
+        self.path = Path(path)
+        self.owner = owner
+        self.repository = repository
+        self.pulls = []
+        self._lock = threading.Lock()
+        self._env = {
+            **os.environ,
+            "GIT_AUTHOR_NAME": "repo-sync",
+            "GIT_AUTHOR_EMAIL": "repo-sync@example.com",
+            "GIT_COMMITTER_NAME": "repo-sync",
+            "GIT_COMMITTER_EMAIL": "repo-sync@example.com",
+        }
+        prefix = f"/repos/{owner}/{repository}"
+        self._routes = [
+            ("GET", rf"{prefix}", self._get_repository),
+            ("GET", rf"{prefix}/branches/(?P<branch>.+)", self._get_branch),
+            ("GET", rf"{prefix}/git/trees/(?P<treeish>.+)", self._get_tree),
+            ("POST", rf"{prefix}/git/blobs", self._create_blob),
+            ("POST", rf"{prefix}/git/trees", self._create_tree),
+            ("GET", rf"{prefix}/git/commits/(?P<sha>[0-9a-f]+)", self._get_commit),
+            ("POST", rf"{prefix}/git/commits", self._create_commit),
+            ("GET", rf"{prefix}/git/refs?/(?P<ref>.+)", self._get_ref),
+            ("PATCH", rf"{prefix}/git/refs/(?P<ref>.+)", self._update_ref),
+            ("POST", rf"{prefix}/git/refs", self._create_ref),
+            ("GET", rf"{prefix}/pulls", self._get_pulls),
+            ("POST", rf"{prefix}/pulls", self._create_pull),
+            ("PATCH", rf"{prefix}/pulls/(?P<number>\d+)", self._edit_pull),
+        ]
+
+    @property
+    def remote_url(self):
+        """URL to clone from and push to the repository."""
+        return self.path.resolve().as_uri()
+
+    @property
+    def api_url(self):
+        """URL of the API."""
+        return self.url
+
+    def _git(self, *args, input=None, env=None):
+        return subprocess.run(
+            ["git", "-C", str(self.path), *args],
+            input=input,
+            env={**self._env, **(env or {})},
+            capture_output=True,
+            check=True,
+        ).stdout
+
+    def _rev_parse(self, revision):
+        try:
+            return self._git("rev-parse", "--verify", "--quiet", revision).decode().strip()
+        except subprocess.CalledProcessError:
+            return None
+
+    def _handle(self, method, path, body):
+        split = urlsplit(path)
+        query = {name: values[0] for name, values in parse_qs(split.query).items()}
+        payload = json.loads(body) if body else {}
+        for route_method, pattern, handler in self._routes:
+            match = re.fullmatch(pattern, split.path)
+            if route_method == method and match:
+                return handler(payload=payload, query=query, **match.groupdict())
+        return 404, {}, {"message": "Not Found"}
+
+    def _url(self, path=""):
+        return f"{self.url}/repos/{self.owner}/{self.repository}{path}"
+
+    def _commit_payload(self, sha):
+        tree, *parents = self._git("log", "-1", "--format=%T %P", sha).decode().split()
+        return {
+            "sha": sha,
+            "url": self._url(f"/git/commits/{sha}"),
+            "tree": {"sha": tree, "url": self._url(f"/git/trees/{tree}")},
+            "parents": [
+                {"sha": parent, "url": self._url(f"/git/commits/{parent}")} for parent in parents
+            ],
+            "message": self._git("log", "-1", "--format=%B", sha).decode().strip(),
+        }
+
+    def _ref_payload(self, ref, sha):
+        return {
+            "ref": ref,
+            "url": self._url(f"/git/{ref}"),
+            "object": {"sha": sha, "type": "commit", "url": self._url(f"/git/commits/{sha}")},
+        }
+
+    def _get_repository(self, payload, query):
+        return (
+            200,
+            {},
+            {
+                "id": 1,
+                "name": self.repository,
+                "full_name": f"{self.owner}/{self.repository}",
+                "owner": {"login": self.owner, "type": "Organization"},
+                "html_url": f"https://github.com/{self.owner}/{self.repository}",
+                "url": self._url(),
+                "default_branch": "main",
+            },
+        )
+
+    def _get_branch(self, payload, query, branch):
+        sha = self._rev_parse(f"refs/heads/{branch}")
+        if sha is None:
+            return 404, {}, {"message": "Branch not found"}
+        return (
+            200,
+            {},
+            {
+                "name": branch,
+                "commit": {
+                    "sha": sha,
+                    "url": self._url(f"/commits/{sha}"),
+                    "commit": self._commit_payload(sha),
+                },
+            },
+        )
+
+    def _get_tree(self, payload, query, treeish):
+        sha = self._rev_parse(f"{treeish}^{{tree}}")
+        if sha is None:
+            return 404, {}, {"message": "Not Found"}
+        recursive = ["-r", "-t"] if query.get("recursive") else []
+        elements = []
+        for line in self._git("ls-tree", "-z", *recursive, sha).decode().split("\0"):
+            if line:
+                info, path = line.split("\t", 1)
+                mode, object_type, object_sha = info.split()
+                elements.append(
+                    {"path": path, "mode": mode, "type": object_type, "sha": object_sha}
+                )
+        return (
+            200,
+            {},
+            {
+                "sha": sha,
+                "url": self._url(f"/git/trees/{sha}"),
+                "tree": elements,
+                "truncated": False,
+            },
+        )
+
+    def _create_blob(self, payload, query):
+        content = payload["content"]
+        data = (
+            base64.b64decode(content) if payload.get("encoding") == "base64" else content.encode()
+        )
+        sha = self._git("hash-object", "-w", "--stdin", input=data).decode().strip()
+        return 201, {}, {"sha": sha, "url": self._url(f"/git/blobs/{sha}")}
+
+    def _create_tree(self, payload, query):
+        index = self.path / f"index-{threading.get_ident()}"
+        env = {"GIT_INDEX_FILE": str(index)}
+        try:
+            if payload.get("base_tree"):
+                self._git("read-tree", payload["base_tree"], env=env)
+            else:
+                self._git("read-tree", "--empty", env=env)
+            entries = "".join(
+                f"{element['mode']} {element['sha']}\t{element['path']}\n"
+                if element["sha"]
+                else f"0 {NULL_SHA}\t{element['path']}\n"
+                for element in payload["tree"]
+            )
+            self._git("update-index", "--index-info", input=entries.encode(), env=env)
+            sha = self._git("write-tree", env=env).decode().strip()
+        finally:
+            index.unlink(missing_ok=True)
+        status, headers, tree = self._get_tree({}, {}, sha)
+        return 201, headers, tree
+
+    def _get_commit(self, payload, query, sha):
+        if self._rev_parse(f"{sha}^{{commit}}") is None:
+            return 404, {}, {"message": "Not Found"}
+        return 200, {}, self._commit_payload(sha)
+
+    def _create_commit(self, payload, query):
+        parents = [argument for parent in payload.get("parents", []) for argument in ("-p", parent)]
+        sha = (
+            self._git("commit-tree", payload["tree"], *parents, "-m", payload["message"])
+            .decode()
+            .strip()
+        )
+        return 201, {}, self._commit_payload(sha)
+
+    def _get_ref(self, payload, query, ref):
+        sha = self._rev_parse(f"refs/{ref}")
+        if sha is None:
+            return 404, {}, {"message": "Not Found"}
+        return 200, {}, self._ref_payload(f"refs/{ref}", sha)
+
+    def _update_ref(self, payload, query, ref):
+        with self._lock:
+            if self._rev_parse(f"refs/{ref}") is None:
+                return 422, {}, {"message": "Reference does not exist"}
+            self._git("update-ref", f"refs/{ref}", payload["sha"])
+        return 200, {}, self._ref_payload(f"refs/{ref}", payload["sha"])
+
+    def _create_ref(self, payload, query):
+        with self._lock:
+            if self._rev_parse(payload["ref"]) is not None:
+                return 422, {}, {"message": "Reference already exists"}
+            self._git("update-ref", payload["ref"], payload["sha"])
+        return 201, {}, self._ref_payload(payload["ref"], payload["sha"])
+
+    def _pull_payload(self, pull):
+        return {
+            "number": pull["number"],
+            "title": pull["title"],
+            "state": "open",
+            "url": self._url(f"/pulls/{pull['number']}"),
+            "html_url": f"https://github.com/{self.owner}/{self.repository}/pull/{pull['number']}",
+            "head": {"ref": pull["head"], "label": f"{self.owner}:{pull['head']}"},
+            "base": {"ref": pull["base"], "label": f"{self.owner}:{pull['base']}"},
+        }
+
+    def _get_pulls(self, payload, query):
+        head = query.get("head")
+        return (
+            200,
+            {},
+            [
+                self._pull_payload(pull)
+                for pull in self.pulls
+                if head is None or f"{self.owner}:{pull['head']}" == head
+            ],
+        )
+
+    def _create_pull(self, payload, query):
+        with self._lock:
+            if any(pull["head"] == payload["head"] for pull in self.pulls):
+                return 422, {}, {"message": "A pull request already exists"}
+            if self._rev_parse(f"refs/heads/{payload['head']}") is None:
+                return 422, {}, {"message": "Head does not exist"}
+            pull = {
+                "number": len(self.pulls) + 1,
+                "title": payload["title"],
+                "head": payload["head"],
+                "base": payload["base"],
+            }
+            self.pulls.append(pull)
+        return 201, {}, self._pull_payload(pull)
+
+    def _edit_pull(self, payload, query, number):
+        pull = self.pulls[int(number) - 1]
+        pull.update({key: payload[key] for key in ("title", "base") if key in payload})
+        return 200, {}, self._pull_payload(pull)
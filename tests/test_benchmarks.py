@@ -0,0 +1,38 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Tests for the benchmark cases."""
+
+from benchmarks.cases import bench_delete_folder_contents
+from benchmarks.trees import TreeSpec, generate_manifest, generate_tree
+
+
+def test_delete_folder_contents_case(tmp_path):
+    """Test that the deletion case reports the number of files it deleted."""
+    tree = generate_tree(TreeSpec(files=50), tmp_path / "trees")
+
+    items, size, seconds = bench_delete_folder_contents(tree, generate_manifest(4), tmp_path)
+
+    # ``*.py`` matches a tenth of the files, the other patterns match none of them
+    assert items == 5
+    assert size == 5 * 64
+    assert seconds > 0
@@ -0,0 +1,112 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Tests for the persistent mirror cache."""
+
+import os
+
+from git import Repo
+
+from ansys.tools.repo_sync.cache import FileLock, MirrorCache
+
+from .conftest import commit_files
+
+
+def test_mirror_is_created_and_fetched_incrementally(tmp_path, local_remote):
+    """Test that the mirror is created once and then updated with new commits."""
+    remote_path, work_path = local_remote
+    cache = MirrorCache(tmp_path / "cache")
+
+    with cache.mirror("ansys", "remote", str(remote_path)) as mirror_path:
+        assert mirror_path == tmp_path / "cache" / "ansys" / "remote.git"
+        with Repo(mirror_path) as mirror:
+            assert mirror.bare
+            first_sha = mirror.git.rev_parse("refs/heads/main")
+            assert mirror.git.symbolic_ref("HEAD") == "refs/heads/main"
+
+    # Push a new commit to the remote and update the mirror
+    new_sha = commit_files(work_path, {"src/ansys/new.txt": "new"})
+    with Repo(work_path) as repo:
+        repo.git.push("origin", "HEAD:main")
+
+    with cache.mirror("ansys", "remote", str(remote_path)) as mirror_path:
+        with Repo(mirror_path) as mirror:
+            assert mirror.git.rev_parse("refs/heads/main") == new_sha != first_sha
+            # The URL used for fetching is never persisted in the mirror
+            assert not mirror.remotes
+
+
+def test_shared_clone_from_mirror(tmp_path, local_remote):
+    """Test that a working copy can be cloned from the mirror."""
+    remote_path, _ = local_remote
+    cache = MirrorCache(tmp_path / "cache")
+
+    with cache.mirror("ansys", "remote", str(remote_path)) as mirror_path:
+        with Repo.clone_from(mirror_path, tmp_path / "clone", shared=True) as clone:
+            assert (tmp_path / "clone" / "src" / "ansys" / "keep.txt").read_text() == "keep"
+            assert (tmp_path / "clone" / ".git" / "objects" / "info" / "alternates").exists()
+            assert clone.active_branch.name == "main"
+
+
+def test_lock_is_shared_while_mirror_is_in_use(tmp_path, local_remote):
+    """Test that readers can share the mirror while writers are blocked."""
+    remote_path, _ = local_remote
+    cache = MirrorCache(tmp_path / "cache")
+
+    with cache.mirror("ansys", "remote", str(remote_path)) as mirror_path:
+        lock_path = mirror_path.with_name("remote.git.lock")
+
+        reader = FileLock(lock_path)
+        assert reader.acquire(shared=True, blocking=False)
+        reader.release()
+
+        writer = FileLock(lock_path)
+        assert not writer.acquire(blocking=False)
+        assert not writer.locked
+
+    writer = FileLock(lock_path)
+    assert writer.acquire(blocking=False)
+    writer.release()
+
+
+def test_least_recently_used_mirrors_are_evicted(tmp_path, local_remote):
+    """Test the size-based LRU eviction of the cache."""
+    remote_path, _ = local_remote
+    cache = MirrorCache(tmp_path / "cache")
+
+    for repository in ["first", "second", "third"]:
+        with cache.mirror("ansys", repository, str(remote_path)):
+            pass
+
+    # Make "second" the least recently used mirror
+    lock_paths = {
+        name: tmp_path / "cache" / "ansys" / f"{name}.git.lock"
+        for name in ["first", "second", "third"]
+    }
+    for age, name in enumerate(["third", "first", "second"]):
+        os.utime(lock_paths[name], (1000 - age * 100, 1000 - age * 100))
+
+    cache.max_size = 1
+    evicted = cache.evict(keep=[cache.mirror_path("ansys", "third")])
+
+    assert evicted == [cache.mirror_path("ansys", "second"), cache.mirror_path("ansys", "first")]
+    assert cache.mirror_path("ansys", "third").exists()
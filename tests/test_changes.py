@@ -0,0 +1,74 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Tests for the report of the changes of a synchronization."""
+
+import json
+
+from ansys.tools.repo_sync.changes import ChangeReport, ChangeSet
+
+
+def test_change_report(tmp_path):
+    """Test the totals, the rollups per directory and the truncated summary."""
+    path = tmp_path / "report.ndjson"
+    changes = ChangeSet(
+        added=[f"pkg/module_{index}.py" for index in range(5)],
+        modified=["README.md"],
+        deleted=["pkg/sub/old.py"],
+    )
+    with ChangeReport(path, max_files=2) as report:
+        report.add_changes(changes, "src/")
+
+    assert len(report) == 7
+    assert report.totals == {"added": 5, "modified": 1, "deleted": 1}
+    assert report.directories["src/pkg"] == {"added": 5, "modified": 0, "deleted": 0}
+    assert report.summary().splitlines() == [
+        " src/pkg/module_0.py (new)",
+        " src/pkg/module_1.py (new)",
+        " ... and 5 more files",
+        " Changes per directory:",
+        "  src/pkg: 5 added, 0 modified, 0 deleted",
+        "  src: 0 added, 1 modified, 0 deleted",
+        "  ... and 1 more directories",
+        " 7 files changed: 5 added, 1 modified, 1 deleted",
+    ]
+
+    records = [json.loads(line) for line in path.read_text().splitlines()]
+    assert len(records) == 7 + 3 + 1
+    assert records[0] == {"type": "file", "status": "added", "path": "src/pkg/module_0.py"}
+    assert records[-2] == {
+        "type": "directory",
+        "path": "src/pkg/sub",
+        "added": 0,
+        "modified": 0,
+        "deleted": 1,
+    }
+    assert records[-1] == {"type": "totals", "added": 5, "modified": 1, "deleted": 1}
+
+
+def test_change_report_without_file():
+    """Test that the summary of a single directory has no rollup."""
+    report = ChangeReport()
+    report.add("modified", "file.py")
+    report.close()
+
+    assert report.summary() == " file.py\n 1 files changed: 0 added, 1 modified, 0 deleted"
@@ -0,0 +1,222 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Tests for the HTTP layer used to talk to the GitHub API."""
+
+import email.utils
+import time
+from types import SimpleNamespace
+
+from github import Github
+import pytest
+import requests
+
+from ansys.tools.repo_sync import client
+from ansys.tools.repo_sync.client import GitHubAdapter, RateLimitPacer, create_client
+
+from .fake_github import FakeGitHub
+
+REPOSITORY = {"full_name": "owner/repository", "name": "repository", "url": "", "id": 1}
+
+
+@pytest.fixture
+def fake_github():
+    """Start a local stand-in for the GitHub API."""
+    with FakeGitHub() as server:
+        yield server
+
+
+def session_with(adapter):
+    """Create a session sending its requests through an adapter."""
+    session = requests.Session()
+    session.mount("http://", adapter)
+    return session
+
+
+def test_conditional_requests(fake_github, tmp_path):
+    """Test that unchanged responses are revalidated and served from the cache."""
+    fake_github.add("GET", "/repos/owner/repository", REPOSITORY, headers={"ETag": '"v1"'})
+    adapter = GitHubAdapter(tmp_path / "cache")
+    session = session_with(adapter)
+
+    assert session.get(f"{fake_github.url}/repos/owner/repository").json() == REPOSITORY
+    response = session.get(f"{fake_github.url}/repos/owner/repository")
+
+    assert response.status_code == 200
+    assert response.json() == REPOSITORY
+    assert adapter.cache_hits == 1
+    assert fake_github.requests[1][2]["If-None-Match"] == '"v1"'
+
+    # The cache persists between runs
+    adapter = GitHubAdapter(tmp_path / "cache")
+    assert session_with(adapter).get(f"{fake_github.url}/repos/owner/repository").ok
+    assert adapter.cache_hits == 1
+
+
+def test_cache_is_per_token(fake_github, tmp_path):
+    """Test that responses cached for a token are not served to another one."""
+    fake_github.add("GET", "/user", {"login": "a"}, headers={"ETag": '"a"'})
+    session = session_with(GitHubAdapter(tmp_path / "cache"))
+
+    session.get(f"{fake_github.url}/user", headers={"Authorization": "token a"})
+    session.get(f"{fake_github.url}/user", headers={"Authorization": "token b"})
+
+    assert "If-None-Match" not in fake_github.requests[1][2]
+
+
+@pytest.mark.parametrize(
+    "status, headers, payload",
+    [
+        (502, {}, {"message": "Bad Gateway"}),
+        (403, {"Retry-After": "0"}, {"message": "You have exceeded a secondary rate limit."}),
+        (429, {}, {"message": "You have exceeded a secondary rate limit."}),
+    ],
+)
+def test_retries(fake_github, status, headers, payload):
+    """Test that transient and rate-limit errors are retried."""
+    fake_github.add("GET", "/rate", payload, status=status, headers=headers)
+    fake_github.add("GET", "/rate", {"ok": True})
+    adapter = GitHubAdapter(backoff_factor=0.001)
+
+    response = session_with(adapter).get(f"{fake_github.url}/rate")
+
+    assert response.json() == {"ok": True}
+    assert len(fake_github.requests) == 2
+
+
+def test_non_idempotent_retries(fake_github):
+    """Test that server errors are final for non-idempotent requests, unlike rate limits."""
+    fake_github.add("POST", "/commits", {"message": "Bad Gateway"}, status=502)
+    fake_github.add("POST", "/commits", {"message": "Secondary rate limit"}, status=429)
+    fake_github.add("POST", "/commits", {"sha": "abc"}, status=201)
+    session = session_with(GitHubAdapter(backoff_factor=0.001))
+
+    assert session.post(f"{fake_github.url}/commits").status_code == 502
+    assert session.post(f"{fake_github.url}/commits").json() == {"sha": "abc"}
+    assert fake_github.paths("POST") == ["/commits"] * 3
+
+
+def test_retry_after_formats(fake_github):
+    """Test that Retry-After is honored as an HTTP date, and ignored if invalid."""
+    date = email.utils.formatdate(time.time() - 10, usegmt=True)
+    fake_github.add(
+        "GET", "/rate", {"message": "limited"}, status=429, headers={"Retry-After": date}
+    )
+    fake_github.add(
+        "GET", "/rate", {"message": "limited"}, status=403, headers={"Retry-After": "?"}
+    )
+    fake_github.add("GET", "/rate", {"ok": True})
+    adapter = GitHubAdapter(backoff_factor=0.001)
+
+    assert session_with(adapter).get(f"{fake_github.url}/rate").json() == {"ok": True}
+    assert len(fake_github.requests) == 3
+
+    assert client._parse_retry_after("2") == 2.0
+    assert client._parse_retry_after("later") is None
+    future = email.utils.formatdate(time.time() + 30, usegmt=True)
+    assert client._parse_retry_after(future) == pytest.approx(30, abs=2)
+
+
+def test_final_errors(fake_github):
+    """Test that permission errors are not retried, and that retries are bounded."""
+    fake_github.add("GET", "/forbidden", {"message": "Resource not accessible"}, status=403)
+    fake_github.add("GET", "/down", {"message": "Service Unavailable"}, status=503)
+    session = session_with(GitHubAdapter(max_retries=2, backoff_factor=0.001))
+
+    assert session.get(f"{fake_github.url}/forbidden").status_code == 403
+    assert session.get(f"{fake_github.url}/down").status_code == 503
+    assert fake_github.paths() == ["/forbidden"] + ["/down"] * 3
+
+
+def test_rate_limit_pacing(monkeypatch):
+    """Test that requests are spread once the remaining budget is low."""
+    delays = []
+    monkeypatch.setattr(client.time, "sleep", delays.append)
+    pacer = RateLimitPacer(reserve=100)
+
+    response = requests.Response()
+    response.headers.update({"X-RateLimit-Remaining": "1000", "X-RateLimit-Reset": "0"})
+    pacer.update(response)
+    pacer.wait()
+    assert delays == []
+
+    reset = time.time() + 10
+    response.headers.update({"X-RateLimit-Remaining": "10", "X-RateLimit-Reset": str(reset)})
+    pacer.update(response)
+    for _ in range(3):
+        pacer.wait()
+    assert delays[0] == pytest.approx(0, abs=0.1)
+    assert delays[1] == pytest.approx(1, abs=0.1)
+    assert delays[2] == pytest.approx(1 + 10 / 9, abs=0.1)
+
+    response.headers.update({"X-RateLimit-Remaining": "0"})
+    pacer.update(response)
+    pacer.wait()
+    assert delays[3] == pytest.approx(10, abs=0.1)
+
+
+def test_create_client(fake_github, tmp_path):
+    """Test that PyGithub requests go through the adapter."""
+    fake_github.add("GET", "/repos/owner/repository", REPOSITORY, headers={"ETag": '"v1"'})
+    github = create_client("token", tmp_path / "cache", base_url=fake_github.url)
+    assert github.get_repo("owner/repository").full_name == "owner/repository"
+    assert github.get_repo("owner/repository").full_name == "owner/repository"
+
+    assert fake_github.paths() == ["/repos/owner/repository"] * 2
+    assert fake_github.requests[0][2]["Authorization"] == "token token"
+    assert fake_github.requests[1][2]["If-None-Match"] == '"v1"'
+
+
+def test_clients_are_isolated(fake_github, tmp_path):
+    """Test that each client keeps its own adapter, without affecting other clients."""
+    fake_github.add("GET", "/repos/owner/repository", REPOSITORY, headers={"ETag": '"v1"'})
+    cached = create_client("token", tmp_path / "cache", base_url=fake_github.url)
+    uncached = create_client("token", base_url=fake_github.url)
+    plain = Github(base_url=fake_github.url, retry=0)
+
+    for github in (cached, cached, uncached, plain):
+        assert github.get_repo("owner/repository").full_name == "owner/repository"
+
+    # Only the second request of the cached client was conditional
+    assert ["If-None-Match" in headers for _, _, headers, _ in fake_github.requests] == [
+        False,
+        True,
+        False,
+        False,
+    ]
+
+
+def test_derived_requesters_use_the_adapter(fake_github, tmp_path):
+    """Test that requesters derived by PyGithub keep sending requests through the adapter."""
+    fake_github.add("GET", "/repos/owner/repository", REPOSITORY, headers={"ETag": '"v1"'})
+    github = create_client("token", tmp_path / "cache", base_url=fake_github.url)
+
+    for lazy in (True, False):
+        github.requester.withLazy(lazy).requestJsonAndCheck("GET", "/repos/owner/repository")
+
+    assert fake_github.requests[1][2]["If-None-Match"] == '"v1"'
+
+
+def test_unsupported_requester():
+    """Test that a requester without the expected attributes is rejected."""
+    with pytest.raises(RuntimeError, match="Unsupported PyGithub version"):
+        client._use_session(SimpleNamespace(scheme="https"), requests.Session())
@@ -0,0 +1,92 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Tests for the clone strategies."""
+
+from git import Repo
+import pytest
+
+from ansys.tools.repo_sync.clone import clone_repository
+
+from .conftest import commit_files
+
+
+@pytest.fixture
+def remote_with_history(local_remote):
+    """Remote with several commits, branches and folders outside of the target directory."""
+    remote_path, work_path = local_remote
+    with Repo(remote_path) as remote:
+        # Allow partial clones over the file:// protocol
+        remote.git.config("uploadpack.allowFilter", "true")
+
+    commit_files(work_path, {"doc/index.rst": "Documentation", "src/ansys/new.txt": "new"})
+    with Repo(work_path) as repo:
+        repo.git.push("origin", "HEAD:main")
+        repo.git.push("origin", "HEAD:other")
+
+    return remote_path
+
+
+def test_full_clone_checks_out_requested_branch(tmp_path, remote_with_history):
+    """Test that the full strategy clones the whole history on the requested branch."""
+    with clone_repository(
+        remote_with_history, tmp_path / "clone", "other", "src/ansys", strategy="full"
+    ) as repo:
+        assert repo.active_branch.name == "other"
+        assert len(list(repo.iter_commits())) == 2
+        assert (tmp_path / "clone" / "doc" / "index.rst").exists()
+
+
+def test_sparse_clone_only_materializes_target_directory(tmp_path, remote_with_history):
+    """Test that the sparse strategy is shallow, single-branch and scoped to the target."""
+    url = remote_with_history.as_uri()
+    with clone_repository(url, tmp_path / "clone", "main", "src/ansys", strategy="sparse") as repo:
+        assert repo.active_branch.name == "main"
+        assert repo.git.rev_parse("--is-shallow-repository") == "true"
+        assert repo.git.config("remote.origin.promisor") == "true"
+        assert (
+            repo.git.for_each_ref(
+                "--format=%(refname)", "refs/remotes/origin/main", "refs/remotes/origin/other"
+            )
+            == "refs/remotes/origin/main"
+        )
+
+        clone_path = tmp_path / "clone"
+        assert (clone_path / "src" / "ansys" / "keep.txt").read_text() == "keep"
+        assert (clone_path / "src" / "ansys" / "new.txt").read_text() == "new"
+        assert not (clone_path / "doc").exists()
+
+
+def test_sparse_clone_from_local_mirror(tmp_path, remote_with_history):
+    """Test the sparse strategy when objects are shared with a local repository."""
+    with clone_repository(
+        remote_with_history, tmp_path / "clone", "main", "src", strategy="sparse", shared=True
+    ) as repo:
+        assert repo.active_branch.name == "main"
+        assert (tmp_path / "clone" / "src" / "ansys" / "keep.txt").exists()
+        assert not (tmp_path / "clone" / "doc").exists()
+
+
+def test_unknown_clone_strategy(tmp_path, remote_with_history):
+    """Test that an unknown strategy is rejected."""
+    with pytest.raises(ValueError, match="Unknown clone strategy"):
+        clone_repository(remote_with_history, tmp_path / "clone", "main", "src", strategy="other")
@@ -0,0 +1,185 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Tests for the incremental copy engine."""
+
+import errno
+import os
+import stat
+import sys
+
+import pytest
+
+from ansys.tools.repo_sync import copier
+from ansys.tools.repo_sync.copier import copy_tree, files_are_identical
+from ansys.tools.repo_sync.manifest import ManifestMatcher
+
+
+def _write(path, content):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(content)
+    return path
+
+
+@pytest.fixture
+def trees(tmp_path):
+    """Source and destination trees sharing part of their content."""
+    source = tmp_path / "source"
+    destination = tmp_path / "destination"
+    _write(source / "same.py", b"unchanged")
+    _write(source / "pkg" / "changed.py", b"new content")
+    _write(source / "pkg" / "added.proto", b"message Foo {}")
+    _write(source / "pkg" / "ignored.txt", b"not in manifest")
+    _write(source / "only_txt" / "ignored.txt", b"not in manifest")
+    _write(destination / "same.py", b"unchanged")
+    _write(destination / "pkg" / "changed.py", b"old content")
+    return source, destination
+
+
+def test_copy_tree_only_writes_differing_files(trees):
+    """Test that identical files are skipped and others are copied."""
+    source, destination = trees
+    old_time = 1_000_000_000
+    os.utime(destination / "same.py", (old_time, old_time))
+
+    stats = copy_tree(source, destination, ManifestMatcher(["*.py", "*.proto"]))
+
+    assert (stats.new, stats.copied, stats.skipped) == (1, 1, 1)
+    assert stats.written == 2
+    assert (destination / "pkg" / "changed.py").read_bytes() == b"new content"
+    assert (destination / "pkg" / "added.proto").read_bytes() == b"message Foo {}"
+    assert not (destination / "pkg" / "ignored.txt").exists()
+    assert not (destination / "only_txt").exists()
+    # Identical files are not rewritten
+    assert (destination / "same.py").stat().st_mtime == old_time
+
+    # A second copy is a no-op
+    stats = copy_tree(source, destination, ManifestMatcher(["*.py", "*.proto"]))
+    assert (stats.new, stats.copied, stats.skipped) == (0, 0, 3)
+
+
+@pytest.mark.parametrize("threshold", [copier.MMAP_THRESHOLD, 1])
+def test_files_are_identical(tmp_path, monkeypatch, threshold):
+    """Test the content comparison, both chunked and through memory maps."""
+    monkeypatch.setattr(copier, "MMAP_THRESHOLD", threshold)
+    content = os.urandom(200_000)
+    first = _write(tmp_path / "first", content)
+    second = _write(tmp_path / "second", content)
+    third = _write(tmp_path / "third", content[:-1] + bytes([content[-1] ^ 1]))
+    empty = _write(tmp_path / "empty", b"")
+
+    assert files_are_identical(first, second)
+    assert not files_are_identical(first, third)
+    assert not files_are_identical(first, empty)
+    assert files_are_identical(empty, _write(tmp_path / "other_empty", b""))
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Executable bit is not tracked on Windows")
+def test_copy_tree_updates_executable_bit(trees):
+    """Test that a mode change is propagated without rewriting the content."""
+    source, destination = trees
+    script = source / "same.py"
+    script.chmod(script.stat().st_mode | stat.S_IXUSR)
+
+    stats = copy_tree(source, destination, ManifestMatcher(["same.py"]))
+
+    assert (stats.new, stats.copied, stats.skipped) == (0, 1, 0)
+    assert (destination / "same.py").stat().st_mode & stat.S_IXUSR
+
+
+@pytest.fixture
+def no_probe_cache(monkeypatch):
+    """Forget which copy methods failed in other tests."""
+    monkeypatch.setattr(copier, "_unsupported", {})
+
+
+def test_copy_tree_hardlink(trees, no_probe_cache):
+    """Test that files written with the hardlink strategy share the source content."""
+    source, destination = trees
+    stats = copy_tree(
+        source, destination, ManifestMatcher(["*.py", "*.proto"]), strategy="hardlink"
+    )
+
+    assert (stats.new, stats.copied, stats.skipped) == (1, 1, 1)
+    assert (stats.bytes_written, stats.bytes_shared) == (
+        0,
+        len(b"new content") + len(b"message Foo {}"),
+    )
+    for name in ("changed.py", "added.proto"):
+        assert (destination / "pkg" / name).samefile(source / "pkg" / name)
+    # Identical files are not replaced by links
+    assert not (destination / "same.py").samefile(source / "same.py")
+
+
+def test_copy_tree_falls_back_to_copy(trees, no_probe_cache, monkeypatch):
+    """Test that unsupported methods are tried once, then the files are copied."""
+    source, destination = trees
+    attempts = []
+
+    def unsupported(source, destination):
+        attempts.append(source.name)
+        raise OSError(errno.EOPNOTSUPP, "Operation not supported")
+
+    monkeypatch.setattr(copier, "_reflink", unsupported)
+    monkeypatch.setattr(copier, "_hardlink", unsupported)
+    stats = copy_tree(source, destination, ManifestMatcher(["*.py", "*.proto"]), strategy="auto")
+
+    assert len(attempts) == 2
+    assert (stats.new, stats.copied) == (1, 1)
+    assert (stats.bytes_written, stats.bytes_shared) == (
+        len(b"new content") + len(b"message Foo {}"),
+        0,
+    )
+    assert (destination / "pkg" / "changed.py").read_bytes() == b"new content"
+    assert not (destination / "pkg" / "changed.py").samefile(source / "pkg" / "changed.py")
+
+
+def test_copy_tree_reflink(trees, no_probe_cache):
+    """Test the reflink strategy, whether the file system supports it or not."""
+    source, destination = trees
+    stats = copy_tree(source, destination, ManifestMatcher(["*.py", "*.proto"]), strategy="reflink")
+
+    assert stats.bytes_written + stats.bytes_shared == len(b"new content") + len(b"message Foo {}")
+    assert (destination / "pkg" / "added.proto").read_bytes() == b"message Foo {}"
+    assert not (destination / "pkg" / "added.proto").samefile(source / "pkg" / "added.proto")
+
+    with pytest.raises(ValueError, match="Unknown copy strategy"):
+        copy_tree(source, destination, strategy="symlink")
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Reflinks rely on fcntl")
+def test_reflink_failure_keeps_destination(tmp_path, monkeypatch):
+    """Test that a failed clone leaves the destination and its folder untouched."""
+    import fcntl
+
+    source = _write(tmp_path / "source" / "file.py", b"new content")
+    destination = _write(tmp_path / "destination" / "file.py", b"old content")
+
+    def unsupported(fd, request, arg):
+        raise OSError(errno.EOPNOTSUPP, "Operation not supported")
+
+    monkeypatch.setattr(fcntl, "ioctl", unsupported)
+    with pytest.raises(OSError):
+        copier._reflink(source, destination)
+
+    assert destination.read_bytes() == b"old content"
+    assert [path.name for path in destination.parent.iterdir()] == ["file.py"]
@@ -0,0 +1,178 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""End-to-end tests of the synchronization against a local remote and a local GitHub API."""
+
+from git import Repo
+import pytest
+
+from ansys.tools.repo_sync.changes import ChangeReport
+from ansys.tools.repo_sync.client import create_client
+from ansys.tools.repo_sync.hashing import SourceTree, read_tree
+from ansys.tools.repo_sync.metrics import Metrics
+from ansys.tools.repo_sync.repo_sync import commit_index, stage_paths, synchronize
+
+from .conftest import commit_files
+from .fake_github import LocalGitHub
+
+
+@pytest.fixture
+def local_github(local_remote):
+    """Local GitHub API serving the bare repository of ``local_remote``."""
+    remote_path, _ = local_remote
+    with LocalGitHub(remote_path) as github:
+        yield github
+
+
+@pytest.fixture
+def source_dir(tmp_path):
+    """Folder of a hundred files to synchronize."""
+    source = tmp_path / "source"
+    for index in range(100):
+        path = source / f"package_{index % 5}" / f"module_{index}.py"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(f"value = {index}\n")
+    return source
+
+
+def merge(github):
+    """Merge the synchronization branch into ``main``, as a reviewer would."""
+    with Repo(github.path) as repo:
+        repo.git.update_ref("refs/heads/main", "refs/heads/sync/file-sync")
+
+
+@pytest.mark.parametrize(
+    "backend, copy_strategy",
+    [("clone", "copy"), ("clone", "hardlink"), ("api", "copy"), ("fast-import", "copy")],
+)
+def test_scenarios(local_github, source_dir, tmp_path, backend, copy_strategy):
+    """Test a first synchronization, a no-op one, a small change and a cleanup."""
+    manifest = tmp_path / "manifest.txt"
+    manifest.write_text("*.py\n")
+    kwargs = dict(
+        owner="owner",
+        repository="repository",
+        token="token",
+        from_dir=source_dir,
+        to_dir="src/ansys/package",
+        include_manifest=manifest,
+        backend=backend,
+        copy_strategy=copy_strategy,
+        client=create_client("token", base_url=local_github.api_url, throttle=False),
+        remote_url=local_github.remote_url,
+    )
+
+    # First synchronization
+    url = synchronize(**kwargs)
+    assert url == "https://github.com/owner/repository/pull/1"
+    with Repo(local_github.path) as repo:
+        objects = read_tree(repo, "sync/file-sync", "src/ansys/package")
+        assert repo.git.show("sync/file-sync:README.md") == "Hello world"
+    assert SourceTree.scan(source_dir).is_up_to_date(objects, True)
+
+    # The pull request branch is not pushed again while it has the same tree
+    with Repo(local_github.path) as repo:
+        head = repo.commit("sync/file-sync").hexsha
+    metrics = Metrics()
+    assert synchronize(metrics=metrics, **kwargs) == url
+    assert metrics.counters["pushes_skipped"] == 1
+    with Repo(local_github.path) as repo:
+        assert repo.commit("sync/file-sync").hexsha == head
+
+    # Nothing to do once merged
+    merge(local_github)
+    assert synchronize(**kwargs) is None
+
+    # A small change updates the existing pull request
+    (source_dir / "package_0" / "module_0.py").write_text("value = -1\n")
+    report = ChangeReport()
+    assert synchronize(report=report, **kwargs) == url
+    assert report.files == [("modified", "src/ansys/package/package_0/module_0.py")]
+    assert len(local_github.pulls) == 1
+    with Repo(local_github.path) as repo:
+        changed = repo.git.diff("--name-only", "main", "sync/file-sync").splitlines()
+    assert changed == ["src/ansys/package/package_0/module_0.py"]
+    merge(local_github)
+
+    # Files removed from the source are only removed when cleaning
+    work_path = tmp_path / "work"
+    with Repo(work_path) as repo:
+        repo.git.pull("origin", "main")
+    commit_files(work_path, {"src/ansys/package/stale.py": "stale"})
+    with Repo(work_path) as repo:
+        repo.git.push("origin", "HEAD:main")
+    assert synchronize(**kwargs) is None
+    assert synchronize(clean_to_dir=True, **kwargs) == url
+    with Repo(local_github.path) as repo:
+        changed = repo.git.diff("--name-status", "main", "sync/file-sync").splitlines()
+    assert changed == ["D\tsrc/ansys/package/stale.py"]
+
+
+def test_api_url(local_github, source_dir, tmp_path):
+    """Test that the client created by the synchronization targets the given API."""
+    manifest = tmp_path / "manifest.txt"
+    manifest.write_text("*.py\n")
+    assert (
+        synchronize(
+            owner="owner",
+            repository="repository",
+            token="token",
+            from_dir=source_dir,
+            to_dir="src",
+            include_manifest=manifest,
+            dry_run=True,
+            api_url=local_github.api_url,
+            remote_url=local_github.remote_url,
+        )
+        is None
+    )
+    assert local_github.paths() == ["/repos/owner/repository"]
+    with Repo(local_github.path) as repo:
+        assert repo.git.branch("--list", "sync/file-sync") == ""
+
+
+def test_stage_paths(tmp_path):
+    """Test that only the given paths are staged, as ``git add`` would."""
+    Repo.init(tmp_path).close()
+    commit_files(tmp_path, {"tracked.log": "0", "a/b.py": "0", "c/d.py": "0", "e.py": "0"})
+    commit_files(tmp_path, {".gitignore": "*.log\n"})
+    (tmp_path / "tracked.log").write_text("1")
+    (tmp_path / "new.log").write_text("1")
+    (tmp_path / "a" / "b.py").unlink()
+    (tmp_path / "a").rmdir()
+    (tmp_path / "a").write_text("1")
+    (tmp_path / "c" / "d.py").write_text("1")
+    (tmp_path / "e.py").write_text("1")  # Not listed, so left unstaged
+
+    with Repo(tmp_path) as repo:
+        staged = stage_paths(repo, ["tracked.log", "new.log", "a", "a/b.py", "c/d.py"])
+        commit = commit_index(repo, "staged")
+
+        assert staged == 4
+        assert repo.head.commit == commit
+        assert sorted(repo.git.diff("--name-status", "HEAD~1", "HEAD").splitlines()) == [
+            "A\ta",
+            "D\ta/b.py",
+            "M\tc/d.py",
+            "M\ttracked.log",
+        ]
+        assert repo.git.diff("--name-only") == "e.py"
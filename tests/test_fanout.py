@@ -0,0 +1,153 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Tests for the synchronization of a folder towards several repositories."""
+
+from types import SimpleNamespace
+
+from git import Repo
+from github import GithubException
+import pytest
+
+from ansys.tools.repo_sync import fanout
+from ansys.tools.repo_sync.fanout import (
+    SyncResult,
+    SyncTarget,
+    fan_out,
+    format_results,
+    load_targets,
+)
+from ansys.tools.repo_sync.hashing import SourceTree, read_tree
+from ansys.tools.repo_sync.manifest import ManifestMatcher
+
+from .conftest import LocalGitDataRepository, commit_files
+
+
+@pytest.fixture
+def remote_repos(tmp_path):
+    """Two local repositories standing in for the targets."""
+    paths = {}
+    for name in ("first", "second"):
+        paths[name] = tmp_path / name
+        Repo.init(paths[name], initial_branch="main").close()
+        commit_files(paths[name], {"README.md": name})
+    return paths
+
+
+@pytest.fixture
+def source_dir(tmp_path):
+    """Files to sync, accepted by different manifests."""
+    source = tmp_path / "source"
+    (source / "api").mkdir(parents=True)
+    (source / "api" / "a.proto").write_text("a")
+    (source / "api" / "a_pb2.py").write_text("generated")
+    (source / "notes.txt").write_text("ignored")
+    return source
+
+
+def test_load_targets(tmp_path):
+    """Test reading a targets configuration file."""
+    config = tmp_path / "targets.toml"
+    config.write_text(
+        "[[targets]]\n"
+        'owner = "ansys"\n'
+        'repository = "first"\n'
+        'to_dir = "protos"\n'
+        "\n"
+        "[[targets]]\n"
+        'owner = "ansys"\n'
+        'repository = "second"\n'
+        'to_dir = "src"\n'
+        'branch = "develop"\n'
+        'manifest = "python.txt"\n'
+        'remote_url = "file:///srv/second.git"\n'
+    )
+
+    assert load_targets(config) == [
+        SyncTarget("ansys", "first", "protos"),
+        SyncTarget(
+            "ansys", "second", "src", "develop", tmp_path / "python.txt", "file:///srv/second.git"
+        ),
+    ]
+
+    config.write_text('[[targets]]\nowner = "ansys"\n')
+    with pytest.raises(ValueError, match="missing: repository, to_dir"):
+        load_targets(config)
+
+
+def test_fan_out(remote_repos, source_dir, tmp_path, monkeypatch):
+    """Test synchronizing several repositories at once, one of them failing."""
+    stubs = {f"ansys/{name}": LocalGitDataRepository(path) for name, path in remote_repos.items()}
+
+    def get_repo(name):
+        if name not in stubs:
+            raise GithubException(404, {"message": "Not Found"}, None)
+        return stubs[name]
+
+    clients = []
+
+    def create_client(token, cache_dir, pool_size, base_url):
+        clients.append(pool_size)
+        return SimpleNamespace(get_repo=get_repo)
+
+    monkeypatch.setattr(fanout, "create_client", create_client)
+    proto_manifest = tmp_path / "proto.txt"
+    proto_manifest.write_text("*.proto\n")
+    python_manifest = tmp_path / "python.txt"
+    python_manifest.write_text("*.py\n*.proto\n")
+    targets = [
+        SyncTarget("ansys", "first", "protos"),
+        SyncTarget("ansys", "second", "src", include_manifest=python_manifest),
+        SyncTarget("ansys", "missing", "src"),
+    ]
+
+    results = fan_out(targets, "token", source_dir, proto_manifest, workers=2, backend="api")
+
+    assert clients == [2]
+    assert [result.target for result in results] == targets
+    assert [result.status for result in results] == ["synchronized", "synchronized", "failed"]
+    assert all(result.pull_request_url.endswith("/pull/1") for result in results[:2])
+    with Repo(remote_repos["first"]) as repo:
+        assert set(read_tree(repo, "sync/file-sync", "protos")) == {"", "api", "api/a.proto"}
+    with Repo(remote_repos["second"]) as repo:
+        objects = read_tree(repo, "sync/file-sync", "src")
+    assert set(objects) == {"", "api", "api/a.proto", "api/a_pb2.py"}
+    assert objects[""][1] == SourceTree.scan(source_dir, ManifestMatcher(["*.py", "*.proto"])).sha
+
+    table = format_results(results).splitlines()
+    assert table[0].split() == ["Repository", "Folder", "Status", "Time", "Details"]
+    assert table[3].startswith("ansys/missing")
+    assert "Not Found" in table[3]
+
+
+def test_format_results():
+    """Test the alignment of the results table."""
+    results = [
+        SyncResult(SyncTarget("ansys", "a", "src"), "https://github.com/ansys/a/pull/1"),
+        SyncResult(SyncTarget("ansys", "longer-name", "src"), duration=12.34),
+    ]
+
+    assert format_results(results).splitlines() == [
+        "Repository         Folder  Status        Time   Details",
+        "ansys/a            src     synchronized  0.0s   https://github.com/ansys/a/pull/1",
+        "ansys/longer-name  src     no changes    12.3s",
+    ]
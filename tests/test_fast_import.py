@@ -0,0 +1,93 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Tests for the ``git fast-import`` commit backend."""
+
+from git import Repo
+import pytest
+
+from ansys.tools.repo_sync.clone import clone_repository
+from ansys.tools.repo_sync.fast_import import commit_with_fast_import, list_tree
+from ansys.tools.repo_sync.github_api import DirectoryChanges, plan_tree_changes
+from ansys.tools.repo_sync.hashing import SourceTree, read_tree
+from ansys.tools.repo_sync.manifest import ManifestMatcher
+
+from .conftest import commit_files
+
+
+@pytest.fixture
+def bare_clone(tmp_path, local_remote):
+    """Blob-less bare clone of a remote whose ``src/ansys`` folder has nested files."""
+    remote_path, work_path = local_remote
+    with Repo(remote_path) as remote:
+        # Allow partial clones over the file:// protocol
+        remote.git.config("uploadpack.allowFilter", "true")
+
+    commit_files(work_path, {"src/ansys/old/x.txt": "x", "src/ansys/dir": "file"})
+    with Repo(work_path) as repo:
+        repo.git.push("origin", "HEAD:main")
+
+    with clone_repository(
+        remote_path.as_uri(), tmp_path / "clone", "main", "src/ansys", "sparse", bare=True
+    ) as repo:
+        yield repo
+
+
+def test_list_tree(bare_clone):
+    """Test listing the modes, types and SHAs of a folder without its blobs."""
+    elements = list_tree(bare_clone, "main", "src/ansys")
+
+    assert sorted(elements) == ["", "dir", "keep.txt", "old", "old/x.txt"]
+    assert elements["old"].type == "tree"
+    assert elements["dir"][:2] == ("100644", "blob")
+    assert elements[""].sha == bare_clone.git.rev_parse("main:src/ansys")
+    assert list_tree(bare_clone, "main", "missing") == {}
+
+
+def test_commit_with_fast_import(tmp_path, bare_clone):
+    """Test streaming additions, modifications and deletions on top of a branch."""
+    source = tmp_path / "source"
+    (source / "dir").mkdir(parents=True)
+    (source / "dir" / "inner.txt").write_text("replaces a file")
+    (source / "old").write_text("replaces a folder")
+    (source / "keep.txt").write_text("modified")
+    (source / '"quoted"\nname.txt').write_text("quoted")
+    (source / "run.sh").write_text("#!/bin/sh\n")
+    (source / "run.sh").chmod(0o755)
+
+    source_tree = SourceTree.scan(source)
+    target = list_tree(bare_clone, "main", "src/ansys")
+    changes = plan_tree_changes(target, source_tree, ManifestMatcher(["*"]), True, False)
+    sha = commit_with_fast_import(
+        bare_clone,
+        "main",
+        "sync/file-sync",
+        [DirectoryChanges("src/ansys", source, source_tree, changes, target)],
+        "sync: add changes",
+    )
+
+    commit = bare_clone.commit("sync/file-sync")
+    assert commit.hexsha == sha
+    assert commit.message == "sync: add changes"
+    assert commit.parents == (bare_clone.commit("main"),)
+    assert source_tree.is_up_to_date(read_tree(bare_clone, sha, "src/ansys"), True)
+    assert bare_clone.git.ls_tree("--name-only", sha) == "README.md\nsrc"
@@ -0,0 +1,311 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Tests for the helpers built on the GitHub REST API."""
+
+import sys
+import threading
+from types import SimpleNamespace
+
+from git import Repo
+from github import GithubException
+import pytest
+
+from ansys.tools.repo_sync import repo_sync
+from ansys.tools.repo_sync.github_api import (
+    DirectoryChanges,
+    commit_tree_changes,
+    list_remote_tree,
+    plan_tree_changes,
+    read_remote_tree,
+    remote_tree_is_up_to_date,
+    update_branch,
+)
+from ansys.tools.repo_sync.hashing import SourceTree, read_tree
+from ansys.tools.repo_sync.manifest import ManifestMatcher
+
+from .conftest import LocalGitDataRepository, LocalTreesRepository, commit_files
+
+
+@pytest.fixture
+def remote_repo(tmp_path):
+    """Local repository with a few nested folders."""
+    Repo.init(tmp_path / "repo").close()
+    commit_files(
+        tmp_path / "repo",
+        {
+            "README.md": "Hello",
+            "src/ansys/api/a.proto": "a",
+            "src/ansys/api/b/c.proto": "c",
+            "src/other/d.py": "d",
+        },
+    )
+    return tmp_path / "repo"
+
+
+@pytest.mark.parametrize("max_entries", [None, 4])
+@pytest.mark.parametrize("path", ["", "src/ansys", "src/ansys/api/b"])
+def test_read_remote_tree_matches_local_tree(remote_repo, max_entries, path):
+    """Test that the API listing matches the local one, even when truncated."""
+    pygithub_repo = LocalTreesRepository(remote_repo, max_entries=max_entries)
+
+    objects = read_remote_tree(pygithub_repo, "HEAD", path)
+
+    if max_entries and not path:
+        assert objects is None
+    else:
+        with Repo(remote_repo) as repo:
+            assert objects == read_tree(repo, "HEAD", path)
+    if max_entries is None:
+        assert len(pygithub_repo.calls) == 1
+
+
+def test_read_missing_remote_tree(remote_repo):
+    """Test reading a directory that does not exist."""
+    assert read_remote_tree(LocalTreesRepository(remote_repo), "HEAD", "src/missing") == {}
+    assert read_remote_tree(LocalTreesRepository(remote_repo, 1), "HEAD", "src/missing") == {}
+
+
+def test_remote_tree_is_up_to_date(remote_repo, tmp_path):
+    """Test the pre-clone detection of synchronizations without changes."""
+    pygithub_repo = LocalTreesRepository(remote_repo)
+    source = tmp_path / "source"
+    (source / "b").mkdir(parents=True)
+    (source / "b" / "c.proto").write_text("c")
+
+    # Only a subset of the remote files: up to date, unless the folder is cleaned
+    source_tree = SourceTree.scan(source)
+    assert remote_tree_is_up_to_date(pygithub_repo, "HEAD", "src/ansys/api", source_tree, False)
+    assert not remote_tree_is_up_to_date(pygithub_repo, "HEAD", "src/ansys/api", source_tree, True)
+
+    # Exactly the remote files
+    (source / "a.proto").write_text("a")
+    source_tree = SourceTree.scan(source)
+    assert remote_tree_is_up_to_date(pygithub_repo, "HEAD", "src/ansys/api", source_tree, True)
+
+    # A modified file
+    (source / "a.proto").write_text("modified")
+    source_tree = SourceTree.scan(source)
+    assert not remote_tree_is_up_to_date(pygithub_repo, "HEAD", "src/ansys/api", source_tree, False)
+
+    # A missing branch
+    assert not remote_tree_is_up_to_date(pygithub_repo, "missing", "src", source_tree, False)
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Executable bit is not tracked on Windows")
+def test_remote_tree_mode_change(remote_repo, tmp_path):
+    """Test that a change of the executable bit alone is not considered up to date."""
+    pygithub_repo = LocalTreesRepository(remote_repo)
+    source = tmp_path / "source"
+    (source / "b").mkdir(parents=True)
+    (source / "b" / "c.proto").write_text("c")
+    (source / "a.proto").write_text("a")
+    (source / "a.proto").chmod(0o755)
+
+    source_tree = SourceTree.scan(source)
+    assert read_remote_tree(pygithub_repo, "HEAD", "src/ansys/api")["a.proto"] == (
+        "100644",
+        source_tree.files["a.proto"][1],
+    )
+    assert not remote_tree_is_up_to_date(pygithub_repo, "HEAD", "src/ansys/api", source_tree, False)
+    assert not remote_tree_is_up_to_date(pygithub_repo, "HEAD", "src/ansys/api", source_tree, True)
+
+
+@pytest.fixture
+def source_dir(tmp_path):
+    """Files to sync towards ``src/ansys/api``."""
+    source = tmp_path / "source"
+    (source / "b").mkdir(parents=True)
+    (source / "a.proto").write_text("a")
+    (source / "b" / "c.proto").write_text("modified")
+    (source / "new.proto").write_text("new")
+    (source / "tool.sh").write_text("#!/bin/sh")
+    (source / "tool.sh").chmod(0o755)
+    return source
+
+
+def test_plan_tree_changes(remote_repo, source_dir):
+    """Test the computation of the files to add, modify and delete."""
+    commit_files(remote_repo, {"src/ansys/api/old.proto": "old", "src/ansys/api/old.txt": "old"})
+    target = list_remote_tree(LocalTreesRepository(remote_repo), "HEAD", "src/ansys/api")
+    source_tree = SourceTree.scan(source_dir)
+    manifest = ManifestMatcher(["*.proto", "*.sh"])
+
+    changes = plan_tree_changes(target, source_tree, manifest, False, False)
+    assert sorted(changes.added) == ["new.proto", "tool.sh"]
+    assert changes.modified == ["b/c.proto"]
+    assert changes.deleted == []
+
+    changes = plan_tree_changes(target, source_tree, manifest, True, False)
+    assert sorted(changes.deleted) == ["old.proto", "old.txt"]
+
+    changes = plan_tree_changes(target, source_tree, manifest, True, True)
+    assert changes.deleted == ["old.proto"]
+
+    # Nothing to do for files already in the directory
+    (source_dir / "b" / "c.proto").write_text("c")
+    target = list_remote_tree(LocalTreesRepository(remote_repo), "HEAD", "src/ansys/api/b")
+    assert not plan_tree_changes(target, SourceTree.scan(source_dir / "b"), manifest, True, False)
+    assert len(changes) == 4
+
+
+@pytest.mark.parametrize("clean_to_dir", [False, True])
+def test_commit_tree_changes(remote_repo, source_dir, clean_to_dir):
+    """Test that the commit created through the API matches a local synchronization."""
+    # An executable file, deleted when the directory is cleaned
+    old_script = remote_repo / "src" / "ansys" / "api" / "old.sh"
+    old_script.write_text("#!/bin/sh")
+    old_script.chmod(0o755)
+    commit_files(remote_repo, {})
+    pygithub_repo = LocalGitDataRepository(remote_repo)
+    with Repo(remote_repo) as repo:
+        branch = repo.active_branch.name
+    base_commit = pygithub_repo.get_branch(branch).commit.commit
+    target = list_remote_tree(pygithub_repo, base_commit.sha, "src/ansys/api")
+    source_tree = SourceTree.scan(source_dir)
+    changes = plan_tree_changes(target, source_tree, ManifestMatcher(["*"]), clean_to_dir, False)
+
+    directory = DirectoryChanges("src/ansys/api", source_dir, source_tree, changes, target)
+    commit = commit_tree_changes(pygithub_repo, base_commit, [directory], "sync")
+    update_branch(pygithub_repo, "sync/file-sync", commit.sha)
+
+    # Only added and modified files are uploaded
+    assert sorted(pygithub_repo.uploaded) == [b"#!/bin/sh", b"modified", b"new"]
+    with Repo(remote_repo) as repo:
+        assert repo.git.rev_parse("sync/file-sync^") == base_commit.sha
+        objects = read_tree(repo, "sync/file-sync", "src/ansys/api")
+        assert source_tree.is_up_to_date(objects, clean_to_dir)
+        assert repo.git.ls_tree("sync/file-sync", "src/ansys/api/tool.sh").startswith("100755")
+        assert read_tree(repo, "sync/file-sync", "src/other") == read_tree(
+            repo, branch, "src/other"
+        )
+
+    # The branch is force-updated on the next synchronization
+    update_branch(pygithub_repo, "sync/file-sync", base_commit.sha)
+    with Repo(remote_repo) as repo:
+        assert repo.git.rev_parse("sync/file-sync") == base_commit.sha
+
+
+def test_synchronize_through_api(remote_repo, source_dir, tmp_path, monkeypatch):
+    """Test a synchronization with the API backend, without any clone."""
+    pygithub_repo = LocalGitDataRepository(remote_repo)
+    monkeypatch.setattr(
+        repo_sync,
+        "create_client",
+        lambda token, cache_dir, base_url: SimpleNamespace(get_repo=lambda name: pygithub_repo),
+    )
+    monkeypatch.setattr(repo_sync, "clone_repository", None)
+    manifest = tmp_path / "manifest.txt"
+    manifest.write_text("*.proto\n*.sh\n")
+    with Repo(remote_repo) as repo:
+        branch = repo.active_branch.name
+    kwargs = dict(
+        owner="owner",
+        repository="repository",
+        token="token",
+        from_dir=source_dir,
+        to_dir="src/ansys/api",
+        include_manifest=manifest,
+        branch_checked_out=branch,
+        backend="api",
+    )
+
+    assert repo_sync.synchronize(dry_run=True, **kwargs) is None
+    assert pygithub_repo.uploaded == []
+
+    url = repo_sync.synchronize(**kwargs)
+    assert url == "https://github.com/owner/repository/pull/1"
+    with Repo(remote_repo) as repo:
+        objects = read_tree(repo, "sync/file-sync", "src/ansys/api")
+    assert SourceTree.scan(source_dir).is_up_to_date(objects, False)
+
+    # The existing pull request is looked up by its branch and updated
+    (source_dir / "new.proto").write_text("updated")
+    pygithub_repo.calls.clear()
+    assert repo_sync.synchronize(pull_request_title="sync: update", **kwargs) == url
+    assert ("pulls", "owner:sync/file-sync") in pygithub_repo.calls
+    assert [pull.title for pull in pygithub_repo.pulls] == ["sync: update"]
+
+
+def test_pull_request_opened_concurrently(remote_repo):
+    """Test that a pull request opened between the lookup and the creation is updated."""
+    pygithub_repo = LocalGitDataRepository(remote_repo)
+    get_pulls = pygithub_repo.get_pulls
+
+    def get_pulls_then_open(**kwargs):
+        # Another synchronization opens the pull request right after the lookup
+        pulls = get_pulls(**kwargs)
+        if not pulls:
+            pygithub_repo.create_pull("sync: other", "", "main", "sync/file-sync")
+        return pulls
+
+    pygithub_repo.get_pulls = get_pulls_then_open
+    pull_request = repo_sync._upsert_pull_request(
+        pygithub_repo, "sync: update", "main", "sync/file-sync"
+    )
+
+    assert [pull.number for pull in pygithub_repo.pulls] == [pull_request.number]
+    assert pull_request.title == "sync: update"
+
+    # Other validation errors are not hidden
+    pygithub_repo.get_pulls = lambda **kwargs: []
+    with pytest.raises(GithubException) as err:
+        repo_sync._upsert_pull_request(pygithub_repo, "sync: update", "main", "sync/file-sync")
+    assert err.value.status == 422
+
+
+def test_local_stage_overlaps_network_stages(remote_repo, source_dir, tmp_path, monkeypatch):
+    """Test that the files are hashed while the repository is being accessed."""
+    pygithub_repo = LocalGitDataRepository(remote_repo)
+    repository_accessed = threading.Event()
+
+    def get_repo(name):
+        repository_accessed.set()
+        return pygithub_repo
+
+    def scan_source_tree(*args):
+        # Only returns if the network stage started without waiting for the hashes
+        assert repository_accessed.wait(timeout=10)
+        return SourceTree.scan(source_dir)
+
+    monkeypatch.setattr(
+        repo_sync,
+        "create_client",
+        lambda token, cache_dir, base_url: SimpleNamespace(get_repo=get_repo),
+    )
+    monkeypatch.setattr(repo_sync, "scan_source_tree", scan_source_tree)
+    manifest = tmp_path / "manifest.txt"
+    manifest.write_text("*\n")
+    with Repo(remote_repo) as repo:
+        branch = repo.active_branch.name
+
+    repo_sync.synchronize(
+        owner="owner",
+        repository="repository",
+        token="token",
+        from_dir=source_dir,
+        to_dir="src/ansys/api",
+        include_manifest=manifest,
+        branch_checked_out=branch,
+        backend="api",
+        dry_run=True,
+    )
@@ -0,0 +1,133 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Tests for the persistent cache of blob hashes."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from ansys.tools.repo_sync import hashing
+from ansys.tools.repo_sync.hash_cache import BlobHashCache
+from ansys.tools.repo_sync.hashing import SourceTree
+from ansys.tools.repo_sync.manifest import ManifestMatcher
+
+OLD_TIME_NS = 1_000_000_000 * 10**9
+
+
+@pytest.fixture
+def source(tmp_path):
+    """Source tree whose files are old enough to be cached."""
+    root = tmp_path / "source"
+    for index in range(5):
+        path = root / f"dir_{index % 2}" / f"file_{index}.py"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(f"content {index}")
+        os.utime(path, ns=(OLD_TIME_NS, OLD_TIME_NS))
+    return root
+
+
+@pytest.fixture
+def hashed_files(monkeypatch):
+    """Record the files actually hashed."""
+    hashed = []
+    hash_blob = hashing.hash_blob
+
+    def recording_hash_blob(path, size=None):
+        hashed.append(Path(path).name)
+        return hash_blob(path, size)
+
+    monkeypatch.setattr(hashing, "hash_blob", recording_hash_blob)
+    return hashed
+
+
+def test_only_modified_files_are_hashed_again(tmp_path, source, hashed_files):
+    """Test that cached hashes are reused until the stat data of a file changes."""
+    database = tmp_path / "cache.sqlite"
+    with BlobHashCache(database, source) as cache:
+        first = SourceTree.scan(source, cache=cache)
+    assert len(hashed_files) == 5
+
+    # Modify one file and remove another one
+    modified = source / "dir_0" / "file_2.py"
+    modified.write_text("modified")
+    os.utime(modified, ns=(OLD_TIME_NS + 1, OLD_TIME_NS + 1))
+    (source / "dir_1" / "file_1.py").unlink()
+
+    hashed_files.clear()
+    with BlobHashCache(database, source) as cache:
+        second = SourceTree.scan(source, cache=cache)
+        assert (cache.hits, cache.misses) == (3, 1)
+    assert hashed_files == ["file_2.py"]
+
+    assert second.sha == SourceTree.scan(source).sha != first.sha
+    with BlobHashCache(database, source) as cache:
+        assert "dir_1/file_1.py" not in cache._entries
+
+
+def test_recently_modified_files_are_not_cached(tmp_path, source, hashed_files):
+    """Test that files modified within the racy window are always hashed again."""
+    os.utime(source / "dir_0" / "file_0.py")
+    for _ in range(2):
+        with BlobHashCache(tmp_path / "cache.sqlite", source) as cache:
+            SourceTree.scan(source, cache=cache)
+
+    assert hashed_files.count("file_0.py") == 2
+    assert hashed_files.count("file_4.py") == 1
+
+
+def test_cache_is_scoped_by_root(tmp_path, source):
+    """Test that several trees can share the same database."""
+    other = tmp_path / "other"
+    other.mkdir()
+    database = tmp_path / "cache.sqlite"
+    with BlobHashCache(database, source) as cache:
+        SourceTree.scan(source, cache=cache)
+    with BlobHashCache(database, other) as cache:
+        SourceTree.scan(other, cache=cache)
+    with BlobHashCache(database, source) as cache:
+        SourceTree.scan(source, cache=cache)
+        assert cache.hits == 5
+
+
+def test_manifests_sharing_a_root(tmp_path, source, hashed_files):
+    """Test that scans of the same root with different manifests keep each other's entries."""
+    database = tmp_path / "cache.sqlite"
+    for _ in range(2):
+        for pattern in ("file_1.py", "file_2.py"):
+            with BlobHashCache(database, source) as cache:
+                SourceTree.scan(source, ManifestMatcher([pattern]), cache=cache)
+
+    assert sorted(hashed_files) == ["file_1.py", "file_2.py"]
+
+    # Deleted files are still forgotten by the scans whose manifest selects them
+    (source / "dir_0" / "file_2.py").unlink()
+    with BlobHashCache(database, source) as cache:
+        SourceTree.scan(source, ManifestMatcher(["file_2.py"]), cache=cache)
+    with BlobHashCache(database, source) as cache:
+        assert set(cache._entries) == {"dir_1/file_1.py"}
+
+
+def test_parallel_hashing(source):
+    """Test that hashing in a process pool gives the same result."""
+    assert SourceTree.scan(source, workers=2).files == SourceTree.scan(source).files
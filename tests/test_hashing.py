@@ -0,0 +1,154 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Tests for the git-compatible hashing of the source tree."""
+
+from concurrent.futures import ThreadPoolExecutor
+import sys
+
+from git import Repo
+import pytest
+
+from ansys.tools.repo_sync import hashing
+from ansys.tools.repo_sync.hashing import SourceTree, hash_blob, hash_blobs, read_tree
+from ansys.tools.repo_sync.manifest import ManifestMatcher
+
+from .conftest import commit_files
+
+FILES = {
+    "README.md": "Hello world",
+    "b.py": "b",
+    "b/c.py": "c",
+    "b-c/d.py": "d",
+    "deep/er/than/this.py": "deep",
+    "deep/er/ignored.txt": "ignored",
+    "ünicode.py": "unicode",
+}
+
+
+@pytest.fixture
+def committed_tree(tmp_path):
+    """Source tree committed into a git repository."""
+    Repo.init(tmp_path).close()
+    commit_files(tmp_path, {f"src/{path}": content for path, content in FILES.items()})
+    return tmp_path
+
+
+def test_hashes_match_git(committed_tree):
+    """Test that blob and tree hashes are computed exactly as git does."""
+    source = SourceTree.scan(committed_tree / "src")
+    with Repo(committed_tree) as repo:
+        target = read_tree(repo, "HEAD", "src")
+
+    assert target[""] == ("040000", source.sha)
+    assert source.files == {path: target[path] for path in source.files}
+    assert source.trees == {
+        path: sha for path, (mode, sha) in target.items() if path not in source.files
+    }
+    assert all(mode == "040000" for path, (mode, _) in target.items() if path in source.trees)
+    assert hash_blob(committed_tree / "src" / "b.py") == target["b.py"][1]
+
+
+def test_unchanged_paths(committed_tree):
+    """Test the detection of unchanged subtrees with a manifest and local changes."""
+    (committed_tree / "src" / "b" / "c.py").write_text("changed")
+    source = SourceTree.scan(committed_tree / "src", ManifestMatcher(["*.py"]))
+    with Repo(committed_tree) as repo:
+        target = read_tree(repo, "HEAD", "src")
+
+    unchanged = source.unchanged_paths(target)
+
+    # The root tree differs (README.md and ignored.txt are not in the source anymore)
+    assert "" not in unchanged
+    assert "deep/er/than" in unchanged
+    assert "deep/er" not in unchanged
+    assert "b-c" in unchanged
+    assert "b" not in unchanged
+    assert "b.py" in unchanged
+    assert "b/c.py" not in unchanged
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Executable bit is not tracked on Windows")
+def test_executable_mode(committed_tree):
+    """Test that the executable bit is hashed as git does."""
+    script = committed_tree / "src" / "b.py"
+    script.chmod(0o755)
+    commit_files(committed_tree, {})
+    with Repo(committed_tree) as repo:
+        target = read_tree(repo, "HEAD", "src")
+
+    assert target["b.py"][0] == "100755"
+    assert SourceTree.scan(committed_tree / "src").sha == target[""][1]
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Executable bit is not tracked on Windows")
+def test_mode_only_change(committed_tree):
+    """Test that a file whose executable bit changed is neither unchanged nor up to date."""
+    with Repo(committed_tree) as repo:
+        target = read_tree(repo, "HEAD", "src")
+    (committed_tree / "src" / "b.py").chmod(0o755)
+    source = SourceTree.scan(committed_tree / "src")
+
+    assert source.files["b.py"][1] == target["b.py"][1]
+    unchanged = source.unchanged_paths(target)
+    assert "b.py" not in unchanged
+    assert "" not in unchanged
+    assert "b/c.py" in unchanged
+    assert not source.is_up_to_date(target, clean_to_dir=False)
+    assert not source.is_up_to_date(target, clean_to_dir=True)
+
+
+def test_parallel_hashing_from_thread(committed_tree, monkeypatch):
+    """Test that the hashing workers are not forked from a multi-threaded process."""
+    start_methods = []
+    executor_class = hashing.ProcessPoolExecutor
+
+    def process_pool(*args, mp_context=None, **kwargs):
+        start_methods.append(mp_context.get_start_method() if mp_context else None)
+        return executor_class(*args, mp_context=mp_context, **kwargs)
+
+    monkeypatch.setattr(hashing, "ProcessPoolExecutor", process_pool)
+    files = [(str(path), path.stat().st_size) for path in (committed_tree / "src").rglob("*.py")]
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        shas = executor.submit(hash_blobs, files, 2).result(timeout=60)
+
+    assert shas == [hash_blob(path, size) for path, size in files]
+    assert start_methods in (["forkserver"], ["spawn"])
+
+
+def test_read_missing_tree(committed_tree):
+    """Test reading a directory that does not exist."""
+    with Repo(committed_tree) as repo:
+        assert read_tree(repo, "HEAD", "missing") == {}
+
+
+def test_stale_paths(committed_tree):
+    """Test the detection of the files of the target missing from the source."""
+    (committed_tree / "src" / "b" / "c.py").unlink()
+    source = SourceTree.scan(committed_tree / "src", ManifestMatcher(["*.py"]))
+    with Repo(committed_tree) as repo:
+        target = read_tree(repo, "HEAD", "src")
+
+    assert source.stale_paths(target) == ["README.md", "b/c.py", "deep/er/ignored.txt"]
+    assert source.stale_paths(target, ManifestMatcher(["*.py"])) == ["b/c.py"]
+    assert SourceTree.scan(committed_tree / "src").stale_paths(target) == ["b/c.py"]
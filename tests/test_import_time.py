@@ -0,0 +1,102 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Tests for the lazy imports and the import time of the command line entry point."""
+
+import subprocess
+import sys
+
+import pytest
+
+HEAVY_MODULES = ("git", "github", "requests")
+"""Dependencies only needed once a synchronization starts."""
+
+_IMPORT_PACKAGE = "import ansys.tools.repo_sync"
+
+_IMPORT_TIME_RUNS = 5
+"""Number of interpreters started for each measurement, of which the fastest is kept."""
+
+_SHOW_HELP = """
+from ansys.tools.repo_sync.__main__ import main
+
+try:
+    main(["--help"])
+except SystemExit:
+    pass
+"""
+
+
+def imported_heavy_modules(code):
+    """Run some code in a new interpreter, and return the heavy modules it imported."""
+    script = f"{code}\nimport sys\nprint(' '.join(sorted(sys.modules)))"
+    output = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, check=True, text=True
+    ).stdout
+    modules = output.splitlines()[-1].split()
+    return [name for name in HEAVY_MODULES if name in modules]
+
+
+@pytest.mark.parametrize("code", [_IMPORT_PACKAGE, _SHOW_HELP], ids=["import", "help"])
+def test_heavy_dependencies_are_not_imported(code):
+    """Test that GitPython, PyGithub and requests are not imported until a sync starts."""
+    assert imported_heavy_modules(code) == []
+
+
+def import_time(module):
+    """Return the time taken to import a module in a new interpreter, in microseconds.
+
+    The time is read from the output of ``python -X importtime``. Click is
+    imported beforehand, so that only the modules imported on top of the command
+    line framework are counted. The fastest of several runs is kept, to reduce
+    the noise of the machine.
+    """
+    code = (
+        f"import sys, click; sys.stderr.write('-- start\\n'); sys.stderr.flush(); import {module}"
+    )
+    times = []
+    for _ in range(_IMPORT_TIME_RUNS):
+        stderr = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", code],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stderr
+        lines = stderr.split("-- start\n", 1)[1].splitlines()
+        total = 0
+        for line in lines:
+            if not line.startswith("import time:"):
+                continue
+            _, cumulative, name = line.split("|")
+            # Top level imports include the time of the modules they import
+            if cumulative.strip().isdigit() and not name.startswith("  ", 1):
+                total += int(cumulative)
+        times.append(total)
+    return min(times)
+
+
+def test_entry_point_imports_faster_than_git():
+    """Test that the entry point costs less to import than GitPython alone.
+
+    Comparing both imports on the same machine keeps the test independent of
+    its speed.
+    """
+    assert import_time("ansys.tools.repo_sync.__main__") < import_time("git")
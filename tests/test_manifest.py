@@ -0,0 +1,106 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Tests for the compiled manifest matcher."""
+
+import fnmatch
+
+import pytest
+
+from ansys.tools.repo_sync.manifest import ManifestMatcher
+from ansys.tools.repo_sync.repo_sync import (
+    delete_folder_contents,
+    delete_stale_files,
+    include_patterns,
+)
+
+from .conftest import ASSETS_DIRECTORY
+
+PATTERNS = ["*.py", "*.tar.gz", "__init__.py", "test_*.proto", "data?.[ch]sv", "*."]
+NAMES = [
+    "module.py",
+    "module.pyc",
+    "module.py.bak",
+    ".py",
+    "archive.tar.gz",
+    "archive.gz",
+    "__init__.py",
+    "__init__.pyi",
+    "test_hello.proto",
+    "hello.proto",
+    "data1.csv",
+    "data1.hsv",
+    "data12.csv",
+    "trailing.",
+    "README",
+]
+
+
+@pytest.mark.parametrize("name", NAMES)
+def test_matcher_has_fnmatch_semantics(name):
+    """Test that the compiled matcher agrees with ``fnmatch`` for every name."""
+    matcher = ManifestMatcher(PATTERNS)
+    expected = any(fnmatch.fnmatch(name, pattern) for pattern in PATTERNS)
+    assert matcher.match(name) is expected
+
+
+def test_matcher_from_file():
+    """Test compiling a manifest file, ignoring blank lines."""
+    matcher = ManifestMatcher.from_file(ASSETS_DIRECTORY / "manifest_proto_and_init.txt")
+    assert matcher.patterns == ["__init__.py", "*.proto"]
+    assert matcher.match("__init__.py")
+    assert matcher.match("test.proto")
+    assert not matcher.match("hello_world.py")
+
+    assert not ManifestMatcher(["", "  "]).match("anything.py")
+
+
+def test_copy_and_clean_phases_share_semantics(tmp_path):
+    """Test that the copy filter and the manifest-based cleanup select the same files."""
+    for name in NAMES:
+        (tmp_path / name).write_text(name)
+
+    ignored = include_patterns(*PATTERNS)(tmp_path, NAMES)
+    delete_folder_contents(tmp_path, PATTERNS, clean_to_dir_based_on_manifest=True)
+
+    remaining = {path.name for path in tmp_path.iterdir()}
+    assert remaining == ignored
+
+
+def test_delete_stale_files(tmp_path):
+    """Test that only the stale files are deleted, along with the folders they leave empty."""
+    (tmp_path / "keep" / "sub").mkdir(parents=True)
+    (tmp_path / "gone" / "deeper").mkdir(parents=True)
+    kept = tmp_path / "keep" / "a.py"
+    kept.write_text("a")
+    (tmp_path / "keep" / "sub" / "b.py").write_text("b")
+    (tmp_path / "gone" / "deeper" / "c.py").write_text("c")
+    mtime = kept.stat().st_mtime_ns
+
+    deleted = delete_stale_files(tmp_path, ["keep/sub/b.py", "gone/deeper/c.py", "missing.py"])
+
+    assert deleted == 2
+    assert sorted(path.relative_to(tmp_path).as_posix() for path in tmp_path.rglob("*")) == [
+        "keep",
+        "keep/a.py",
+    ]
+    assert kept.stat().st_mtime_ns == mtime
@@ -0,0 +1,125 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Tests for the synchronization of several folders in a single pull request."""
+
+from types import SimpleNamespace
+
+from git import Repo
+import pytest
+
+from ansys.tools.repo_sync import repo_sync
+from ansys.tools.repo_sync.clone import clone_repository
+from ansys.tools.repo_sync.hashing import SourceTree, read_tree
+from ansys.tools.repo_sync.manifest import ManifestMatcher
+from ansys.tools.repo_sync.mapping import SyncMapping, check_mappings, load_mappings
+
+from .conftest import LocalGitDataRepository
+
+
+def test_load_mappings(tmp_path):
+    """Test reading a mappings configuration file."""
+    config = tmp_path / "mappings.toml"
+    config.write_text(
+        "[[mappings]]\n"
+        'from_dir = "protos"\n'
+        'to_dir = "protos"\n'
+        'manifest = "proto.txt"\n'
+        "\n"
+        "[[mappings]]\n"
+        'from_dir = "build/python"\n'
+        'to_dir = "src/ansys/api"\n'
+        'manifest = "python.txt"\n'
+        "clean_to_dir = true\n"
+    )
+
+    assert load_mappings(config) == [
+        SyncMapping(tmp_path / "protos", "protos", tmp_path / "proto.txt"),
+        SyncMapping(tmp_path / "build/python", "src/ansys/api", tmp_path / "python.txt", True),
+    ]
+
+    config.write_text('[[mappings]]\nfrom_dir = "protos"\n')
+    with pytest.raises(ValueError, match="missing: to_dir, manifest"):
+        load_mappings(config)
+
+
+def test_check_mappings():
+    """Test the detection of mappings that cannot be applied together."""
+    check_mappings([SyncMapping("a", "src", "m"), SyncMapping("b", "src", "m")])
+    check_mappings([SyncMapping("a", "src/a", "m", True), SyncMapping("b", "src/ab", "m", True)])
+
+    with pytest.raises(ValueError, match="No folder"):
+        check_mappings([])
+    with pytest.raises(ValueError, match="overlap"):
+        check_mappings([SyncMapping("a", "src", "m", True), SyncMapping("b", "src/a", "m")])
+    with pytest.raises(ValueError, match="overlap"):
+        check_mappings([SyncMapping("a", "src/a", "m"), SyncMapping("b", ".", "m", True)])
+
+
+@pytest.mark.parametrize("backend", ["clone", "api"])
+def test_synchronize_mappings(local_remote, tmp_path, monkeypatch, backend):
+    """Test that several folders are synchronized in a single commit and pull request."""
+    remote_path, _ = local_remote
+    pygithub_repo = LocalGitDataRepository(remote_path)
+    monkeypatch.setattr(
+        repo_sync,
+        "create_client",
+        lambda token, cache_dir, base_url: SimpleNamespace(get_repo=lambda name: pygithub_repo),
+    )
+    monkeypatch.setattr(
+        repo_sync,
+        "clone_repository",
+        lambda url, *args, **kwargs: clone_repository(remote_path, *args, **kwargs),
+    )
+
+    protos = tmp_path / "protos"
+    protos.mkdir()
+    (protos / "a.proto").write_text("a")
+    python = tmp_path / "python"
+    python.mkdir()
+    (python / "a_pb2.py").write_text("generated")
+    (python / "notes.txt").write_text("ignored")
+    proto_manifest = tmp_path / "proto.txt"
+    proto_manifest.write_text("*.proto\n")
+    python_manifest = tmp_path / "python.txt"
+    python_manifest.write_text("*.py\n")
+
+    url = repo_sync.synchronize(
+        owner="owner",
+        repository="repository",
+        token="token",
+        mappings=[
+            SyncMapping(protos, "protos", proto_manifest),
+            SyncMapping(python, "src/ansys", python_manifest, clean_to_dir=True),
+        ],
+        backend=backend,
+    )
+
+    assert url == "https://github.com/owner/repository/pull/1"
+    with Repo(remote_path) as repo:
+        assert repo.git.rev_parse("sync/file-sync^") == repo.git.rev_parse("main")
+        assert read_tree(repo, "sync/file-sync", "protos")[""][1] == SourceTree.scan(protos).sha
+        assert (
+            read_tree(repo, "sync/file-sync", "src/ansys")[""][1]
+            == SourceTree.scan(python, ManifestMatcher(["*.py"])).sha
+        )
+        assert repo.git.show("sync/file-sync:README.md") == "Hello world"
@@ -0,0 +1,168 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Tests for the metrics collected during synchronizations."""
+
+from concurrent.futures import ThreadPoolExecutor
+import json
+from types import SimpleNamespace
+
+from git import Repo
+import pytest
+
+from ansys.tools.repo_sync import repo_sync
+from ansys.tools.repo_sync.clone import clone_repository
+from ansys.tools.repo_sync.instrumented import InstrumentedRepo
+from ansys.tools.repo_sync.metrics import (
+    Metrics,
+    count,
+    format_json,
+    format_openmetrics,
+    span,
+    submit,
+    write_metrics,
+)
+
+from .conftest import LocalGitDataRepository
+
+
+def test_spans_and_counters():
+    """Test that spans and counters are recorded by the active collector only."""
+    metrics = Metrics()
+    count("ignored")
+    with metrics.activate():
+        with span("phase"):
+            count("files")
+            count("files", 2)
+        with span("phase"):
+            pass
+
+    # Outside of the collector, nothing is recorded
+    count("files")
+    with span("other"):
+        pass
+
+    assert metrics.counters == {"files": 3}
+    assert [s.name for s in metrics.spans] == ["phase", "phase"]
+    assert list(metrics.durations()) == ["phase"]
+    assert metrics.durations()["phase"] >= 0
+    assert metrics.as_dict()["counters"] == {"files": 3}
+
+
+def test_collector_is_propagated_to_worker_threads():
+    """Test that calls submitted to an executor report to the submitting collector."""
+    metrics = Metrics()
+    with metrics.activate(), ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [submit(executor, count, "uploads") for _ in range(10)]
+        for future in futures:
+            future.result()
+        # Plain submissions do not inherit the collector
+        executor.submit(count, "lost").result()
+
+    assert metrics.counters == {"uploads": 10}
+
+
+def test_git_subprocesses_are_counted(tmp_path):
+    """Test that the git commands run through an instrumented repository are counted."""
+    metrics = Metrics()
+    with metrics.activate():
+        with InstrumentedRepo.init(tmp_path / "repo") as repo:
+            repo.git.status()
+            repo.git.rev_parse("--git-dir")
+    assert metrics.counters["git_subprocesses"] >= 2
+
+
+def test_formats():
+    """Test the JSON and OpenMetrics outputs."""
+    metrics = Metrics()
+    with metrics.activate():
+        with span("copy"):
+            count("files_copied", 4)
+    runs = [({"repository": 'owner/"repo"'}, metrics)]
+
+    document = json.loads(format_json(runs))
+    assert document["runs"][0]["labels"] == {"repository": 'owner/"repo"'}
+    assert document["runs"][0]["counters"] == {"files_copied": 4}
+    assert [s["name"] for s in document["runs"][0]["spans"]] == ["copy"]
+
+    exposition = format_openmetrics(runs)
+    assert exposition.endswith("# EOF\n")
+    assert "# TYPE repo_sync_files_copied counter" in exposition
+    assert 'repo_sync_files_copied_total{repository="owner/\\"repo\\""} 4' in exposition
+    assert 'repo_sync_phase_duration_seconds{repository="owner/\\"repo\\"",phase="copy"}' in (
+        exposition
+    )
+
+    with pytest.raises(ValueError, match="Unknown metrics format"):
+        write_metrics("metrics.txt", runs, "csv")
+
+
+@pytest.mark.parametrize("backend", ["clone", "api"])
+def test_synchronize_metrics(local_remote, tmp_path, monkeypatch, backend):
+    """Test the metrics collected by a synchronization."""
+    remote_path, _ = local_remote
+    pygithub_repo = LocalGitDataRepository(remote_path)
+    monkeypatch.setattr(
+        repo_sync,
+        "create_client",
+        lambda token, cache_dir, base_url: SimpleNamespace(get_repo=lambda name: pygithub_repo),
+    )
+    monkeypatch.setattr(
+        repo_sync,
+        "clone_repository",
+        lambda url, *args, **kwargs: clone_repository(remote_path, *args, **kwargs),
+    )
+    source = tmp_path / "source"
+    source.mkdir()
+    (source / "a.proto").write_text("a")
+    (source / "b.proto").write_text("bb")
+    manifest = tmp_path / "manifest.txt"
+    manifest.write_text("*.proto\n")
+
+    metrics = Metrics()
+    url = repo_sync.synchronize(
+        owner="owner",
+        repository="repository",
+        token="token",
+        from_dir=source,
+        to_dir="protos",
+        include_manifest=manifest,
+        backend=backend,
+        metrics=metrics,
+    )
+
+    assert url == "https://github.com/owner/repository/pull/1"
+    durations = metrics.durations()
+    assert {"hash", "access_repository", "push", "pull_request"} <= set(durations)
+    assert metrics.counters["files_scanned"] == 2
+    if backend == "api":
+        assert {"list_remote_tree", "upload"} <= set(durations)
+        assert metrics.counters["blobs_uploaded"] == 2
+        assert metrics.counters["bytes_uploaded"] == 3
+    else:
+        assert {"clone", "read_tree", "copy", "commit", "diff"} <= set(durations)
+        assert metrics.counters["files_new"] == 2
+        assert metrics.counters["bytes_written"] == 3
+        assert metrics.counters["git_subprocesses"] > 0
+
+    with Repo(remote_path) as repo:
+        assert repo.git.show("sync/file-sync:protos/b.proto") == "bb"
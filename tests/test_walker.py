@@ -0,0 +1,84 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Tests for the source tree walker."""
+
+from collections import Counter
+import os
+from pathlib import Path
+
+import pytest
+
+from ansys.tools.repo_sync.manifest import ManifestMatcher
+from ansys.tools.repo_sync.walker import iter_source_files
+
+
+@pytest.fixture
+def source_tree(tmp_path):
+    """Source tree with nested directories and files of several extensions."""
+    for directory in ["", "a", "a/b", "c"]:
+        (tmp_path / directory).mkdir(parents=True, exist_ok=True)
+        for index in range(10):
+            (tmp_path / directory / f"file_{index}.py").write_text("python")
+            (tmp_path / directory / f"file_{index}.txt").write_text("text")
+    return tmp_path
+
+
+@pytest.fixture
+def syscalls(monkeypatch):
+    """Count the filesystem calls made through ``os`` and ``pathlib``."""
+    counter = Counter()
+
+    def counting(name, function):
+        def wrapper(*args, **kwargs):
+            counter[name] += 1
+            return function(*args, **kwargs)
+
+        return wrapper
+
+    for name in ["stat", "lstat", "scandir", "listdir"]:
+        monkeypatch.setattr(os, name, counting(name, getattr(os, name)))
+    for name in ["is_dir", "is_file", "exists"]:
+        monkeypatch.setattr(Path, name, counting(f"Path.{name}", getattr(Path, name)))
+    monkeypatch.setattr(os.path, "isdir", counting("isdir", os.path.isdir))
+    return counter
+
+
+def test_walker_yields_relative_paths(source_tree):
+    """Test that accepted files are yielded with their relative path."""
+    files = dict(iter_source_files(source_tree, ManifestMatcher(["*.py"])))
+
+    expected = {
+        f"{directory}file_{index}.py"
+        for directory in ["", "a/", "a/b/", "c/"]
+        for index in range(10)
+    }
+    assert set(files) == expected
+    assert all(Path(entry.path) == source_tree / path for path, entry in files.items())
+
+
+def test_walker_syscall_count(source_tree, syscalls):
+    """Test that the walker only lists directories and never stats files."""
+    files = list(iter_source_files(source_tree, ManifestMatcher(["*.py"])))
+
+    assert len(files) == 40
+    assert syscalls == Counter({"scandir": 4})
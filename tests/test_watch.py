@@ -0,0 +1,97 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Tests for the watch mode."""
+
+import sys
+
+from click.testing import CliRunner
+import pytest
+
+from ansys.tools.repo_sync.__main__ import main
+from ansys.tools.repo_sync.watch import open_monitor, watch_folders
+
+METHODS = [
+    pytest.param(
+        "inotify",
+        marks=pytest.mark.skipif(not sys.platform.startswith("linux"), reason="Linux only"),
+    ),
+    "poll",
+]
+
+
+@pytest.mark.parametrize("method", METHODS)
+def test_watch_folders(tmp_path, capsys, method):
+    """Test that bursts of changes, including in new folders, trigger one sync each."""
+    calls = []
+
+    def sync():
+        calls.append(sorted(path.name for path in tmp_path.rglob("*")))
+        if len(calls) == 1:
+            # A burst of changes, followed by an error
+            for index in range(20):
+                (tmp_path / f"file_{index}.txt").write_text(str(index))
+            (tmp_path / "new").mkdir()
+            raise RuntimeError("sync failed")
+        if len(calls) == 2:
+            (tmp_path / "new" / "file.txt").write_text("new")
+
+    syncs = watch_folders(
+        [tmp_path], sync, debounce=0.2, method=method, poll_interval=0.05, max_syncs=3
+    )
+
+    assert syncs == 3
+    assert calls[0] == []
+    assert len(calls[1]) == 21
+    assert "file.txt" in calls[2]
+    assert "sync failed - process will continue." in capsys.readouterr().out
+
+
+@pytest.mark.parametrize("method", METHODS)
+def test_monitor_timeout(tmp_path, method):
+    """Test that waiting without any change times out."""
+    with open_monitor([tmp_path], method, poll_interval=0.05) as monitor:
+        assert not monitor.wait(0.1)
+        (tmp_path / "file.txt").write_text("content")
+        assert monitor.wait(1)
+
+
+def test_unknown_method(tmp_path):
+    """Test that unknown watch methods are rejected."""
+    with pytest.raises(ValueError, match="Unknown watch method"):
+        open_monitor([tmp_path], "fanotify")
+
+
+def test_cli_help():
+    """Test that the help of the CLI shows the options of the default sync command."""
+    result = CliRunner().invoke(main, ["--help"])
+    assert result.exit_code == 0
+    assert "--from-dir" in result.output
+    assert "repo-sync watch --help" in result.output
+    assert "--debounce" not in result.output
+
+    result = CliRunner().invoke(main, ["watch", "--help"])
+    assert result.exit_code == 0
+    assert "--from-dir" in result.output
+    assert "--debounce" in result.output
+    assert "--targets-config" not in result.output
+    assert "--target-workers" not in result.output